@@ -0,0 +1,146 @@
+"""Benchmark context query latency as history grows, partitioned vs not.
+
+Builds synthetic news_articles, order_submissions and order_fills in a
+scratch schema for each history size, once as plain tables and once with
+news_articles and order_fills converted by schema.convert_to_partitioned,
+and times the prepared prior-news and traded-news statements for the most
+recent window. With partitioning, latency should stay flat as months of
+history are added.
+
+Usage:
+    BENCH_DATABASE_URL=postgresql://... PYTHONPATH=src \
+        python benchmarks/bench_partitions.py --months 3 12 36 --articles-per-day 2000
+"""
+import argparse
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+from benz_news_context.db import schema
+from benz_news_context.db.context import PRIOR_NEWS_STATEMENT, TRADED_NEWS_STATEMENT
+from benz_news_context.db.queries import (
+    PRIOR_NEWS_LOOKBACK_HOURS,
+    TRADED_NEWS_LOOKBACK_DAYS,
+)
+
+TICKERS = [f"T{i:03d}" for i in range(500)]
+STATEMENTS = {
+    "prior_news": (PRIOR_NEWS_STATEMENT, timedelta(hours=PRIOR_NEWS_LOOKBACK_HOURS)),
+    "traded_news": (TRADED_NEWS_STATEMENT, timedelta(days=TRADED_NEWS_LOOKBACK_DAYS)),
+}
+# One article in this many is traded, filled a few minutes after publication
+TRADED_EVERY = 10
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def _load(conn, name: str, reference: datetime, days: int, per_day: int) -> None:
+    """Create the tables the context queries read and fill them with days of history."""
+    with conn.cursor() as cur:
+        cur.execute(f"CREATE SCHEMA {name}")
+        cur.execute(f"SET search_path TO {name}")
+        cur.execute(
+            "CREATE TABLE news_articles (id text, title text, published_utc timestamptz, "
+            "channels text[], tags text[], tickers text[])"
+        )
+        cur.execute("CREATE TABLE trading_decisions (article_id text, ticker text, sentiment text, confidence float, decision text)")
+        cur.execute(
+            "CREATE TABLE order_submissions (client_order_id text, article_id text, ticker text, symbol text, side text)"
+        )
+        cur.execute(
+            "CREATE TABLE order_fills (client_order_id text, order_leg text, filled_at timestamptz, fill_price numeric)"
+        )
+        cur.execute(
+            "INSERT INTO news_articles "
+            "SELECT 'a' || i, 'title ' || i, %s - (i * %s / %s::float) * interval '1 day', "
+            "'{News}', '{}', ARRAY[(%s::text[])[1 + i %% %s]] "
+            "FROM generate_series(0, %s) i",
+            (reference, days, days * per_day, TICKERS, len(TICKERS), days * per_day - 1),
+        )
+        cur.execute(
+            "INSERT INTO order_submissions "
+            "SELECT 'o' || id, id, tickers[1], tickers[1], 'buy' FROM news_articles "
+            "WHERE substr(id, 2)::int %% %s = 0",
+            (TRADED_EVERY,),
+        )
+        cur.execute(
+            "INSERT INTO order_fills "
+            "SELECT 'o' || na.id, 'entry', na.published_utc + interval '3 minutes', 100 "
+            "FROM news_articles na JOIN order_submissions os ON os.article_id = na.id"
+        )
+        cur.execute("CREATE INDEX ON order_submissions (symbol)")
+        cur.execute("CREATE INDEX ON order_submissions (article_id)")
+        for table in ("news_articles", "order_fills"):
+            for index in schema.PARTITION_INDEXES[table]:
+                cur.execute(f"CREATE INDEX ON {table} {index}")
+        cur.execute("ANALYZE")
+    conn.commit()
+
+
+def _time(conn, name: str, kind: str, reference: datetime, iterations: int) -> list[float]:
+    statement, lookback = STATEMENTS[kind]
+    params = (TICKERS[0], reference, lookback)
+    latencies = []
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(f"SET search_path TO {name}")
+        cur.execute(statement.prepare_sql)
+        for i in range(iterations + min(50, iterations)):
+            started = time.perf_counter()
+            cur.execute(statement.execute_sql, params)
+            cur.fetchall()
+            # The first iterations warm the plan cache and buffers
+            if i >= min(50, iterations):
+                latencies.append((time.perf_counter() - started) * 1000)
+    conn.rollback()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--months", type=int, nargs="+", default=[3, 12, 36], help="History sizes to compare")
+    parser.add_argument("--articles-per-day", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or BENCH_DATABASE_URL is required")
+
+    reference = datetime.now(timezone.utc)
+    print(f"{'months':>6} {'rows':>10} {'layout':<12} {'query':<12} {'mean_ms':>8} {'p50_ms':>8} {'p95_ms':>8}")
+    for months in args.months:
+        days = months * 30
+        for layout in ("plain", "partitioned"):
+            name = f"bench_partitions_{uuid.uuid4().hex[:8]}"
+            conn = psycopg2.connect(args.dsn)
+            try:
+                _load(conn, name, reference, days, args.articles_per_day)
+                if layout == "partitioned":
+                    with conn.cursor() as cur:
+                        cur.execute(f"SET search_path TO {name}")
+                    schema.convert_to_partitioned(conn, "news_articles")
+                    schema.convert_to_partitioned(conn, "order_fills")
+                results = {kind: _time(conn, name, kind, reference, args.iterations) for kind in STATEMENTS}
+            finally:
+                conn.rollback()
+                with conn.cursor() as cur:
+                    cur.execute(f"DROP SCHEMA IF EXISTS {name} CASCADE")
+                conn.commit()
+                conn.close()
+            for kind, latencies in results.items():
+                print(
+                    f"{months:>6} {days * args.articles_per_day:>10} {layout:<12} {kind:<12} "
+                    f"{statistics.fmean(latencies):>8.3f} {_percentile(latencies, 50):>8.3f} "
+                    f"{_percentile(latencies, 95):>8.3f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark per-query latency of the context queries against a live database.
+
+Compares sending the query text on every call with executing a server-side
+prepared statement under each plan_cache_mode, at a steady request rate.
+
+Usage:
+    BENCH_DATABASE_URL=postgresql://... PYTHONPATH=src \
+        python benchmarks/bench_queries.py --ticker AVGO --iterations 2000
+"""
+import argparse
+import os
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+from benz_news_context.db.context import (
+    PRIOR_NEWS_STATEMENT,
+    TRADED_NEWS_PROJECTION_STATEMENT,
+    TRADED_NEWS_STATEMENT,
+)
+from benz_news_context.db.queries import (
+    PRIOR_NEWS_LOOKBACK_HOURS,
+    TRADED_NEWS_LOOKBACK_DAYS,
+)
+
+STATEMENTS = {
+    "prior_news": (PRIOR_NEWS_STATEMENT, timedelta(hours=PRIOR_NEWS_LOOKBACK_HOURS)),
+    "traded_news": (TRADED_NEWS_STATEMENT, timedelta(days=TRADED_NEWS_LOOKBACK_DAYS)),
+}
+# Included when the projection is installed (python -m benz_news_context.db.schema install)
+PROJECTION_STATEMENTS = {
+    "traded_proj": (TRADED_NEWS_PROJECTION_STATEMENT, timedelta(days=TRADED_NEWS_LOOKBACK_DAYS)),
+}
+PLAN_CACHE_MODES = ("auto", "force_generic_plan", "force_custom_plan")
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def _run(conn, sql: str, params: tuple | dict, iterations: int, interval: float) -> list[float]:
+    """Execute sql iterations times, one call per interval seconds, returning latencies in ms."""
+    latencies = []
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        for _ in range(iterations):
+            started = time.perf_counter()
+            cur.execute(sql, params)
+            cur.fetchall()
+            conn.rollback()
+            elapsed = time.perf_counter() - started
+            latencies.append(elapsed * 1000)
+            if interval > elapsed:
+                time.sleep(interval - elapsed)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--ticker", default="AVGO")
+    parser.add_argument("--reference-timestamp", default=None, help="ISO timestamp; defaults to now")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--rate", type=float, default=200.0, help="Calls per second per variant")
+    parser.add_argument("--projection", action="store_true", help="Also time the traded-news projection")
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or BENCH_DATABASE_URL is required")
+
+    reference = (
+        datetime.fromisoformat(args.reference_timestamp)
+        if args.reference_timestamp
+        else datetime.now(timezone.utc)
+    )
+    interval = 1 / args.rate if args.rate > 0 else 0.0
+
+    print(f"{'query':<12} {'variant':<26} {'mean_ms':>8} {'p50_ms':>8} {'p95_ms':>8} {'p99_ms':>8}")
+    statements = {**STATEMENTS, **(PROJECTION_STATEMENTS if args.projection else {})}
+    for kind, (statement, lookback) in statements.items():
+        params = (args.ticker, reference, lookback)
+        variants = {"text": (None, statement.text_sql, statement.text_params(params))}
+        variants.update(
+            {f"prepared/{mode}": (mode, statement.execute_sql, params) for mode in PLAN_CACHE_MODES}
+        )
+        baseline = None
+        for variant, (mode, sql, variant_params) in variants.items():
+            conn = psycopg2.connect(args.dsn)
+            try:
+                if mode is not None:
+                    with conn.cursor() as cur:
+                        cur.execute("SET plan_cache_mode = %s", (mode,))
+                        cur.execute(statement.prepare_sql)
+                    conn.commit()
+                # Warm up the plan cache and buffers before measuring
+                _run(conn, sql, variant_params, min(50, args.iterations), 0.0)
+                latencies = _run(conn, sql, variant_params, args.iterations, interval)
+            finally:
+                conn.close()
+            mean = statistics.fmean(latencies)
+            baseline = baseline if baseline is not None else mean
+            saved = f"  saved {baseline - mean:+.3f} ms/query" if mode is not None else ""
+            print(
+                f"{kind:<12} {variant:<26} {mean:>8.3f} {_percentile(latencies, 50):>8.3f} "
+                f"{_percentile(latencies, 95):>8.3f} {_percentile(latencies, 99):>8.3f}{saved}"
+            )
+
+
+if __name__ == "__main__":
+    main()
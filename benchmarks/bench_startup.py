@@ -0,0 +1,125 @@
+"""Benchmark cold start: app import time and time from process start to first 200.
+
+Each run starts a fresh interpreter, so nothing is shared between runs. The
+import figure covers `import benz_news_context.app` alone; first response
+covers interpreter start, import, lifespan startup and the first /livez.
+
+tests/test_startup.py enforces the budgets with the same probes.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_startup.py --runs 20
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+IMPORT_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import benz_news_context.app
+print(json.dumps({
+    "import_ms": (time.perf_counter() - started) * 1000,
+    "loaded": sorted(m for m in ("benz_common", "psycopg2") if m in sys.modules),
+}))
+"""
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_import(env: dict, cwd: str, timeout: float = 30) -> dict:
+    """Import the app in a fresh interpreter; import_ms and which database modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        env=env,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure_first_response(env: dict, cwd: str, timeout: float) -> float:
+    """Milliseconds from starting a server process to its first 200 from /livez."""
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benz_news_context.app:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout and server.poll() is None:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/livez", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.005)
+        raise RuntimeError("server never answered /livez")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def _report(name: str, samples: list[float], budget_ms: float) -> bool:
+    p95 = _percentile(samples, 95)
+    within = p95 < budget_ms
+    print(
+        f"{name:<16} {statistics.median(samples):>9.1f} {p95:>9.1f} {max(samples):>9.1f} "
+        f"{budget_ms:>10.0f}  {'ok' if within else 'OVER BUDGET'}"
+    )
+    return within
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--import-budget-ms", type=float, default=float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500")))
+    parser.add_argument(
+        "--first-response-budget-ms",
+        type=float,
+        default=float(os.getenv("STARTUP_FIRST_RESPONSE_BUDGET_MS", "3000")),
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(os.path.abspath(p) for p in sys.path if p)
+    import_ms, first_response_ms, loaded = [], [], set()
+    with tempfile.TemporaryDirectory() as cwd:
+        env["HOT_TICKERS_PATH"] = os.path.join(cwd, "hot_tickers.json")
+        env["SLOW_QUERY_LOG_PATH"] = os.path.join(cwd, "slow_queries.jsonl")
+        for _ in range(args.runs):
+            measured = measure_import(env, cwd)
+            import_ms.append(measured["import_ms"])
+            loaded.update(measured["loaded"])
+            first_response_ms.append(measure_first_response(env, cwd, timeout=3 * args.first_response_budget_ms / 1000))
+
+    print(f"{'phase':<16} {'p50_ms':>9} {'p95_ms':>9} {'max_ms':>9} {'budget_ms':>10}")
+    ok = _report("import", import_ms, args.import_budget_ms)
+    ok = _report("first_response", first_response_ms, args.first_response_budget_ms) and ok
+    print(f"database stack loaded at import: {', '.join(sorted(loaded)) or 'none'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
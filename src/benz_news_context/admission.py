@@ -0,0 +1,88 @@
+"""Admission control and per-request deadlines for the context endpoints."""
+import asyncio
+import time
+from dataclasses import dataclass
+
+DEADLINE_HEADER = "X-Deadline-Ms"
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a request's deadline has passed before its query could run."""
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Monotonic-clock deadline for a request; expires_at of None means unbounded."""
+
+    expires_at: float | None = None
+
+    @classmethod
+    def from_budget_ms(cls, budget_ms: int | None) -> "Deadline":
+        if budget_ms is None:
+            return cls()
+        return cls(expires_at=time.monotonic() + budget_ms / 1000)
+
+    def remaining_seconds(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def statement_timeout_ms(self, margin_ms: int, default_ms: int) -> int | None:
+        """Return the Postgres statement_timeout to run under, or None for no limit.
+
+        The remaining budget less margin_ms is used so the query is cancelled
+        server-side before the caller gives up; unbounded requests fall back to
+        default_ms (0 disables). Raises DeadlineExceeded if no budget is left.
+        """
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return default_ms or None
+        timeout_ms = int(remaining * 1000) - margin_ms
+        if timeout_ms <= 0:
+            raise DeadlineExceeded()
+        return timeout_ms
+
+
+class AdmissionController:
+    """Limits concurrent requests, with a bounded queue of waiters behind the limit.
+
+    A request is admitted immediately while fewer than max_concurrent are in
+    flight. Otherwise it waits, up to its timeout, unless max_queue requests are
+    already waiting, in which case it is rejected at once.
+    """
+
+    def __init__(self, max_concurrent: int, max_queue: int):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._in_flight = 0
+        self._waiting = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    async def acquire(self, timeout: float) -> bool:
+        """Wait up to timeout seconds for a slot; False if rejected or timed out."""
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        else:
+            if self._waiting >= self.max_queue or timeout <= 0:
+                return False
+            self._waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except TimeoutError:
+                return False
+            finally:
+                self._waiting -= 1
+        self._in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self._in_flight -= 1
+        self._semaphore.release()
@@ -1,23 +1,137 @@
 """FastAPI application for benz_news_context service."""
-from benz_common.db import DatabaseAdapter
-from fastapi import Depends, FastAPI, HTTPException
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from . import config
+from .admission import AdmissionController
+from .cache import ContextCache
+from .dependencies import (
+    get_admission_controller,
+    get_context_cache,
+    get_db_adapter,
+    get_health_monitor,
+    get_hot_ticker_tracker,
+)
+from .health import HealthMonitor, pool_saturation, run_health_probe_loop
+from .prewarm import HotTickerTracker, run_prewarm_loop
+from .routers import context, debug
+from .tracing import configure_logging, trace_id_middleware
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
+
+
+async def _run_background_work(app: FastAPI, monitor: HealthMonitor, tracker: HotTickerTracker) -> None:
+    """Resolve the database adapter, then probe and prewarm until cancelled.
+
+    Creating the adapter imports and configures the database stack, so it runs
+    here rather than in startup; /readyz reports not ready until the first probe.
+    A failure to create it is retried with exponential backoff. The adapter is
+    kept on app.state for /readyz, which must not create one itself.
+    """
+    factory = app.dependency_overrides.get(get_db_adapter, get_db_adapter)
+    delay = config.DATABASE_CONNECT_RETRY_SECONDS
+    while True:
+        try:
+            db = await asyncio.to_thread(factory)
+            break
+        except Exception as e:
+            logger.error(
+                f"Could not create database adapter, retrying in {delay:.1f}s: error={type(e).__name__}: {e}"
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, config.DATABASE_CONNECT_MAX_RETRY_SECONDS)
+    app.state.db = db
+    await asyncio.gather(
+        run_health_probe_loop(db, monitor, interval_seconds=config.HEALTH_PROBE_INTERVAL_SECONDS),
+        run_prewarm_loop(
+            db,
+            get_context_cache(),
+            tracker,
+            interval_seconds=config.PREWARM_INTERVAL_SECONDS,
+            prewarm_on_startup=config.PREWARM_ON_STARTUP,
+        ),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run database health probes and hot-ticker cache prewarming in the background while serving."""
+    configure_logging(config.LOG_LEVEL)
+    monitor = app.dependency_overrides.get(get_health_monitor, get_health_monitor)()
+    tracker = get_hot_ticker_tracker()
+    tracker.load()
+    background_task = asyncio.create_task(_run_background_work(app, monitor, tracker))
+    yield
+    background_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await background_task
+    tracker.save()
 
-from .dependencies import get_db_adapter
-from .routers import context
 
 app = FastAPI(
     title="benz_news_context",
     description="REST API service providing prior news context for derivative news detection",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+app.middleware("http")(trace_id_middleware)
+
 # Register routers
 app.include_router(context.router)
+app.include_router(debug.router)
+
+
+@app.get("/livez")
+async def livez(monitor: HealthMonitor = Depends(get_health_monitor)):
+    """Liveness probe: the process is up and its event loop is serving requests."""
+    return {"status": "alive", "started_at": monitor.snapshot()["started_at"]}
+
+
+@app.get("/readyz")
+async def readyz(
+    request: Request,
+    monitor: HealthMonitor = Depends(get_health_monitor),
+    controller: AdmissionController = Depends(get_admission_controller),
+):
+    """Readiness probe served from the background probe's last result; never queries the database.
+
+    Replica pool usage comes from the adapter the background work resolved,
+    so a database stack that cannot be created yet reads as not ready.
+    """
+    ready = monitor.is_ready()
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "database": monitor.snapshot(),
+        "saturation": pool_saturation(controller, getattr(request.app.state, "db", None)),
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
+
+@app.get("/cache/memory")
+async def cache_memory(cache: ContextCache = Depends(get_context_cache)):
+    """Bytes of cached rows held per ticker, largest first, against the configured limit."""
+    held = sorted(cache.bytes_by_ticker().items(), key=lambda item: item[1], reverse=True)
+    return {
+        "bytes": sum(nbytes for _, nbytes in held),
+        "max_bytes": cache.max_bytes,
+        "tickers": dict(held),
+    }
 
 
 @app.get("/health")
-async def health(db: DatabaseAdapter = Depends(get_db_adapter)):
-    """Health check endpoint with database validation."""
+async def health(db: "DatabaseAdapter" = Depends(get_db_adapter)):
+    """Health check endpoint with database validation.
+
+    Queries the database on every call; orchestrator probes should use /livez and /readyz.
+    """
     try:
         with db.read_connection() as conn:
             with conn.cursor() as cur:
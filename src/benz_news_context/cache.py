@@ -0,0 +1,209 @@
+"""In-process cache of per-ticker context query windows."""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from .rows import CompactRows, _as_utc
+
+PRIOR_NEWS = "prior_news"
+TRADED_NEWS = "traded_news"
+
+# Column each query kind is windowed on; cached rows are filtered on it.
+TIME_COLUMNS = {
+    PRIOR_NEWS: "published_utc",
+    TRADED_NEWS: "trade_executed_at",
+}
+
+# Windows kept per ticker: one wide prewarmed window plus recent request windows.
+MAX_WINDOWS_PER_TICKER = 8
+
+
+@dataclass
+class CachedWindow:
+    """Rows returned for a ticker over the half-open window [start, end)."""
+
+    start: datetime
+    end: datetime
+    rows: CompactRows
+    fetched_at: float
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.start <= start and end <= self.end
+
+
+class ContextCache:
+    """TTL cache of query windows keyed by (kind, ticker), evicted LRU by ticker.
+
+    Rows are held as CompactRows and decoded to dicts only for the rows a
+    lookup returns. Tickers are evicted once more than max_tickers are held
+    or the rows held exceed max_bytes.
+
+    A lookup for [reference - lookback, reference) is a hit when any fresh
+    window held for the ticker covers it; the rows are sliced from that window,
+    so a single wide prewarmed window serves every reference timestamp inside it.
+    A window that starts in time but ends before the reference timestamp is
+    still useful: lookup_prefix() returns its rows so that only the newer
+    tail needs to be fetched.
+
+    Windows are retained for retain_seconds (at least the TTL) so that expired
+    results remain available to lookup() for stale serving.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_tickers: int,
+        retain_seconds: float | None = None,
+        max_bytes: int | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_tickers = max_tickers
+        self.retain_seconds = max(ttl_seconds, retain_seconds or 0.0)
+        self.max_bytes = max_bytes
+        self._windows: OrderedDict[tuple[str, str], list[CachedWindow]] = OrderedDict()
+        self._bytes: dict[tuple[str, str], int] = {}
+        self._total_bytes = 0
+        self._refreshing: set[tuple] = set()
+        self._lock = threading.Lock()
+
+    def get(
+        self, kind: str, ticker: str, reference_timestamp: datetime, lookback: timedelta
+    ) -> list[dict] | None:
+        """Return fresh cached rows for the lookback window, or None on a miss."""
+        hit = self.lookup(kind, ticker, reference_timestamp, lookback, max_age=self.ttl_seconds)
+        return hit[0] if hit is not None else None
+
+    def lookup(
+        self,
+        kind: str,
+        ticker: str,
+        reference_timestamp: datetime,
+        lookback: timedelta,
+        max_age: float,
+    ) -> tuple[list[dict], float] | None:
+        """Return (rows, age_seconds) from the newest covering window younger than max_age."""
+        end = _as_utc(reference_timestamp)
+        start = end - lookback
+        now = time.time()
+        key = (kind, ticker)
+        with self._lock:
+            windows = self._windows.get(key)
+            if not windows:
+                return None
+            for window in windows:
+                age = now - window.fetched_at
+                if age < max_age and window.covers(start, end):
+                    self._windows.move_to_end(key)
+                    rows = window.rows
+                    break
+            else:
+                return None
+        # Decoding reads immutable rows, so it runs outside the lock
+        return rows.between(TIME_COLUMNS[kind], start, end), age
+
+    def lookup_prefix(
+        self, kind: str, ticker: str, reference_timestamp: datetime, lookback: timedelta
+    ) -> tuple[list[dict], timedelta] | None:
+        """Return (rows, tail) from the fresh window reaching furthest into the lookback window.
+
+        The window starts by reference_timestamp - lookback but ends before
+        reference_timestamp; rows in the final tail of the lookback are not in
+        it. None when no fresh window starts in time.
+        """
+        end = _as_utc(reference_timestamp)
+        start = end - lookback
+        now = time.time()
+        key = (kind, ticker)
+        with self._lock:
+            prefixes = [
+                w
+                for w in self._windows.get(key, [])
+                if now - w.fetched_at < self.ttl_seconds and w.start <= start < w.end < end
+            ]
+            if not prefixes:
+                return None
+            window = max(prefixes, key=lambda w: w.end)
+            self._windows.move_to_end(key)
+        return window.rows.between(TIME_COLUMNS[kind], start, window.end), end - window.end
+
+    def put(
+        self, kind: str, ticker: str, reference_timestamp: datetime, lookback: timedelta, rows: list[dict]
+    ) -> None:
+        """Store the rows returned for [reference_timestamp - lookback, reference_timestamp)."""
+        end = _as_utc(reference_timestamp)
+        window = CachedWindow(start=end - lookback, end=end, rows=CompactRows(rows), fetched_at=time.time())
+        key = (kind, ticker)
+        with self._lock:
+            windows = [
+                w
+                for w in self._windows.get(key, [])
+                if window.fetched_at - w.fetched_at < self.retain_seconds and not window.covers(w.start, w.end)
+            ]
+            windows.insert(0, window)
+            self._windows[key] = windows[:MAX_WINDOWS_PER_TICKER]
+            self._windows.move_to_end(key)
+            nbytes = sum(w.rows.nbytes for w in self._windows[key])
+            self._total_bytes += nbytes - self._bytes.get(key, 0)
+            self._bytes[key] = nbytes
+            self._drop_expired(window.fetched_at)
+            while self._windows and (
+                len(self._windows) > self.max_tickers
+                or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+            ):
+                evicted, _ = self._windows.popitem(last=False)
+                self._total_bytes -= self._bytes.pop(evicted)
+
+    def _drop_expired(self, now: float) -> None:
+        # Windows past retention can no longer be served, so they should not count against max_bytes
+        for key in list(self._windows):
+            windows = self._windows[key]
+            live = [w for w in windows if now - w.fetched_at < self.retain_seconds]
+            if len(live) == len(windows):
+                continue
+            nbytes = sum(w.rows.nbytes for w in live)
+            self._total_bytes -= self._bytes[key] - nbytes
+            if live:
+                self._windows[key] = live
+                self._bytes[key] = nbytes
+            else:
+                del self._windows[key]
+                del self._bytes[key]
+
+    def claim_refresh(self, key: tuple) -> bool:
+        """Mark key as being refreshed; False if a refresh for it is already in flight."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: tuple) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes of all cached rows."""
+        with self._lock:
+            return self._total_bytes
+
+    def bytes_by_ticker(self) -> dict[str, int]:
+        """Approximate bytes of cached rows held for each ticker, across query kinds."""
+        held: dict[str, int] = {}
+        with self._lock:
+            for (_, ticker), nbytes in self._bytes.items():
+                held[ticker] = held.get(ticker, 0) + nbytes
+        return held
+
+    def clear(self) -> None:
+        with self._lock:
+            self._windows.clear()
+            self._bytes.clear()
+            self._total_bytes = 0
+            self._refreshing.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._windows)
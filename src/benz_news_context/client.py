@@ -0,0 +1,219 @@
+"""Async Python client for the news context API.
+
+Requires the client extra (httpx). One ContextClient holds a pooled
+keep-alive connection set; create it once per process and share it:
+
+    async with ContextClient("http://news-context:8000") as client:
+        responses = await client.get_prior_news_many([("AVGO", ts), ("NVDA", ts)])
+"""
+import asyncio
+import random
+import time
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+import httpx
+from pydantic import BaseModel, create_model
+
+from .admission import DEADLINE_HEADER
+from .models import (
+    PriorNewsArticle,
+    PriorNewsResponse,
+    TradedNewsResponse,
+    TradedNewsTrade,
+    partial_model,
+)
+
+PRIOR_NEWS_PATH = "/api/prior-news-context"
+TRADED_NEWS_PATH = "/api/traded-news-context"
+
+# 503 is admission control shedding load; 504 means the deadline ran out, so it is not retried.
+RETRY_STATUSES = frozenset({429, 502, 503})
+
+
+@lru_cache(maxsize=64)
+def _response_model(
+    model: type[BaseModel], items: str, item_model: type[BaseModel], fields: tuple[str, ...]
+) -> type[BaseModel]:
+    """model with its list of items restricted to fields, matching a fields request's response."""
+    return create_model(
+        f"Partial{model.__name__}",
+        __base__=model,
+        **{items: (list[partial_model(item_model, fields)], ...)},
+    )
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class ContextClient:
+    """Pooled async client for /api/prior-news-context and /api/traded-news-context.
+
+    Requests share one httpx.AsyncClient, so connections are kept alive and
+    reused, and at most max_concurrency are in flight at once across all
+    callers. Overload responses (429, 502, 503) and connection errors are
+    retried up to retries times, waiting for the server's Retry-After when
+    given (at most max_backoff_seconds without a deadline) and for a
+    jittered exponential backoff otherwise. Waits between retries do not hold
+    a concurrency slot.
+
+    deadline_ms bounds each call, retries included. Each attempt times out
+    when the budget runs out, the remaining budget is sent as the
+    X-Deadline-Ms header so the service sizes its statement timeout to it, and
+    no retry starts once it is spent.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_concurrency: int = 16,
+        max_connections: int = 32,
+        timeout_seconds: float = 5.0,
+        keepalive_expiry_seconds: float = 60.0,
+        retries: int = 3,
+        backoff_seconds: float = 0.05,
+        max_backoff_seconds: float = 2.0,
+        deadline_ms: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.deadline_ms = deadline_ms
+        self.timeout_seconds = timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_expiry_seconds,
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "ContextClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def get_prior_news(
+        self, ticker: str, reference_timestamp: datetime, fields: list[str] | None = None
+    ) -> PriorNewsResponse:
+        """Prior news for ticker; with fields, articles carry only those fields."""
+        model = PriorNewsResponse
+        if fields:
+            model = _response_model(PriorNewsResponse, "articles", PriorNewsArticle, tuple(fields))
+        return await self._post(PRIOR_NEWS_PATH, model, ticker, reference_timestamp, fields)
+
+    async def get_traded_news(
+        self, ticker: str, reference_timestamp: datetime, fields: list[str] | None = None
+    ) -> TradedNewsResponse:
+        """Traded news for ticker; with fields, trades carry only those fields."""
+        model = TradedNewsResponse
+        if fields:
+            model = _response_model(TradedNewsResponse, "trades", TradedNewsTrade, tuple(fields))
+        return await self._post(TRADED_NEWS_PATH, model, ticker, reference_timestamp, fields)
+
+    async def get_prior_news_many(
+        self,
+        requests: Iterable[tuple[str, datetime]],
+        fields: list[str] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[PriorNewsResponse | BaseException]:
+        """Prior news for each (ticker, reference_timestamp), concurrently, in request order.
+
+        With return_exceptions, a failed request yields its exception in place
+        of a response instead of failing the batch.
+        """
+        calls = [self.get_prior_news(ticker, reference, fields) for ticker, reference in requests]
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def get_traded_news_many(
+        self,
+        requests: Iterable[tuple[str, datetime]],
+        fields: list[str] | None = None,
+        return_exceptions: bool = False,
+    ) -> list[TradedNewsResponse | BaseException]:
+        """Traded news for each (ticker, reference_timestamp), concurrently, in request order."""
+        calls = [self.get_traded_news(ticker, reference, fields) for ticker, reference in requests]
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def _post(
+        self,
+        path: str,
+        model: type[BaseModel],
+        ticker: str,
+        reference_timestamp: datetime,
+        fields: list[str] | None,
+    ) -> BaseModel:
+        body = {"ticker": ticker, "reference_timestamp": reference_timestamp.isoformat()}
+        if fields:
+            body["fields"] = list(fields)
+        expires = time.monotonic() + self.deadline_ms / 1000 if self.deadline_ms is not None else None
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._send(path, body, expires)
+            except httpx.TransportError:
+                delay = self._backoff(attempt)
+                if not self._may_retry(attempt, delay, expires):
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return model.model_validate_json(response.content)
+                retry_after = _retry_after_seconds(response)
+                if retry_after is None:
+                    delay = self._backoff(attempt)
+                elif expires is None:
+                    delay = min(retry_after, self.max_backoff_seconds)
+                else:
+                    delay = retry_after
+                if not self._may_retry(attempt, delay, expires):
+                    response.raise_for_status()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(self, path: str, body: dict, expires: float | None) -> httpx.Response:
+        if expires is None:
+            return await self._http.post(path, json=body)
+        # Measured after the wait for a slot, which spends the budget too
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            raise httpx.TimeoutException("Deadline expired before the request was sent")
+        return await self._http.post(
+            path,
+            json=body,
+            headers={DEADLINE_HEADER: str(int(remaining * 1000))},
+            timeout=min(remaining, self.timeout_seconds),
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter keeps clients that were shed together from retrying together
+        return random.uniform(0, min(self.max_backoff_seconds, self.backoff_seconds * 2**attempt))
+
+    def _may_retry(self, attempt: int, delay: float, expires: float | None) -> bool:
+        if attempt >= self.retries:
+            return False
+        return expires is None or time.monotonic() + delay < expires
@@ -7,3 +7,100 @@ load_dotenv()
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+# Context result cache
+CONTEXT_CACHE_TTL_SECONDS = float(os.getenv("CONTEXT_CACHE_TTL_SECONDS", "60"))
+CONTEXT_CACHE_MAX_TICKERS = int(os.getenv("CONTEXT_CACHE_MAX_TICKERS", "512"))
+# Bound on the rows held, as approximate in-memory bytes (serialized bytes for the shared cache).
+CONTEXT_CACHE_MAX_BYTES = int(os.getenv("CONTEXT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Seconds past the TTL an expired result may be served (marked stale) while it
+# is refreshed in the background, and served instead of a database error.
+CONTEXT_CACHE_STALE_WHILE_REVALIDATE_SECONDS = float(
+    os.getenv("CONTEXT_CACHE_STALE_WHILE_REVALIDATE_SECONDS", "30")
+)
+CONTEXT_CACHE_STALE_IF_ERROR_SECONDS = float(os.getenv("CONTEXT_CACHE_STALE_IF_ERROR_SECONDS", "600"))
+# SQLite file shared by all workers on a host, e.g. /dev/shm/benz_news_context_cache.db.
+# Empty keeps the cache in each process.
+SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", "")
+
+# Hot-ticker prewarming
+HOT_TICKERS_PATH = os.getenv("HOT_TICKERS_PATH", "hot_tickers.json")
+HOT_TICKERS_TOP_N = int(os.getenv("HOT_TICKERS_TOP_N", "50"))
+PREWARM_ON_STARTUP = os.getenv("PREWARM_ON_STARTUP", "true").lower() == "true"
+# Seconds between scheduled refreshes of the hot set; 0 prewarms once at startup only.
+PREWARM_INTERVAL_SECONDS = float(os.getenv("PREWARM_INTERVAL_SECONDS", "30"))
+
+# Admission control and deadlines
+ADMISSION_MAX_CONCURRENT = int(os.getenv("ADMISSION_MAX_CONCURRENT", "16"))
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+ADMISSION_MAX_WAIT_MS = int(os.getenv("ADMISSION_MAX_WAIT_MS", "1000"))
+ADMISSION_RETRY_AFTER_SECONDS = int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1"))
+# statement_timeout for requests without a deadline header; 0 leaves it unset.
+DEFAULT_STATEMENT_TIMEOUT_MS = int(os.getenv("DEFAULT_STATEMENT_TIMEOUT_MS", "0"))
+# Budget held back from the deadline for connection checkout and serialization.
+STATEMENT_TIMEOUT_MARGIN_MS = int(os.getenv("STATEMENT_TIMEOUT_MARGIN_MS", "50"))
+
+# Read replicas: comma-separated DSNs. When empty, reads use benz_common's adapter.
+READ_REPLICA_URLS = [url.strip() for url in os.getenv("READ_REPLICA_URLS", "").split(",") if url.strip()]
+READ_REPLICA_POOL_MAX = int(os.getenv("READ_REPLICA_POOL_MAX", "10"))
+READ_REPLICA_EJECT_AFTER_FAILURES = int(os.getenv("READ_REPLICA_EJECT_AFTER_FAILURES", "3"))
+READ_REPLICA_EJECT_SECONDS = float(os.getenv("READ_REPLICA_EJECT_SECONDS", "5"))
+READ_HEDGING_ENABLED = os.getenv("READ_HEDGING_ENABLED", "false").lower() == "true"
+READ_HEDGE_PERCENTILE = float(os.getenv("READ_HEDGE_PERCENTILE", "95"))
+READ_HEDGE_MIN_DELAY_MS = float(os.getenv("READ_HEDGE_MIN_DELAY_MS", "10"))
+# Hedges allowed per read once the initial burst is spent, e.g. 0.05 for one in twenty.
+READ_HEDGE_MAX_RATIO = float(os.getenv("READ_HEDGE_MAX_RATIO", "0.05"))
+
+# Background health probing
+HEALTH_PROBE_INTERVAL_SECONDS = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", "5"))
+HEALTH_PROBE_TIMEOUT_MS = int(os.getenv("HEALTH_PROBE_TIMEOUT_MS", "1000"))
+# /readyz reports not ready when the last successful probe is older than this.
+HEALTH_MAX_PROBE_AGE_SECONDS = float(os.getenv("HEALTH_MAX_PROBE_AGE_SECONDS", "15"))
+# /readyz reports not ready after this many probes in a row fail.
+HEALTH_FAILURES_BEFORE_NOT_READY = int(os.getenv("HEALTH_FAILURES_BEFORE_NOT_READY", "3"))
+# Backoff between attempts to create the database adapter at startup, doubling up to the max.
+DATABASE_CONNECT_RETRY_SECONDS = float(os.getenv("DATABASE_CONNECT_RETRY_SECONDS", "0.5"))
+DATABASE_CONNECT_MAX_RETRY_SECONDS = float(os.getenv("DATABASE_CONNECT_MAX_RETRY_SECONDS", "30"))
+
+# Server-side prepared statements. Off by default: transaction-mode poolers
+# (PgBouncer, Supavisor on port 6543) do not keep per-session statements.
+PREPARED_STATEMENTS = os.getenv("PREPARED_STATEMENTS", "false").lower() == "true"
+# auto, force_generic_plan or force_custom_plan (PostgreSQL 12+).
+PLAN_CACHE_MODE = os.getenv("PLAN_CACHE_MODE", "auto")
+
+# Read traded news from the traded_news_by_symbol projection instead of joining
+# the order tables. Install it first: python -m benz_news_context.db.schema install
+TRADED_NEWS_FROM_PROJECTION = os.getenv("TRADED_NEWS_FROM_PROJECTION", "false").lower() == "true"
+
+# Slow query capture. Records go to a size-rotated JSONL file; {worker} in the
+# path gives each worker process its own file, numbered from 0 and taken over
+# by the worker that replaces it, so recycling does not add files.
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "250"))
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1"))
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = int(os.getenv("SLOW_QUERY_EXPLAIN_TIMEOUT_MS", "10000"))
+SLOW_QUERY_LOG_PATH = os.getenv("SLOW_QUERY_LOG_PATH", "slow_queries.{worker}.jsonl")
+SLOW_QUERY_LOG_MAX_BYTES = int(os.getenv("SLOW_QUERY_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SLOW_QUERY_LOG_BACKUPS = int(os.getenv("SLOW_QUERY_LOG_BACKUPS", "5"))
+
+# Production serving (python -m benz_news_context.server)
+SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "8000"))
+# Worker processes, one event loop each; defaults to the number of cores.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+SERVER_BACKLOG = int(os.getenv("SERVER_BACKLOG", "2048"))
+# Keep above the load balancer's idle timeout so it never reuses a closed connection.
+SERVER_KEEPALIVE_SECONDS = int(os.getenv("SERVER_KEEPALIVE_SECONDS", "75"))
+# Recycle a worker after this many requests (0 disables); jitter staggers the restarts.
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "10000"))
+SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "1000"))
+SERVER_GRACEFUL_TIMEOUT_SECONDS = int(os.getenv("SERVER_GRACEFUL_TIMEOUT_SECONDS", "30"))
+# A worker silent for this long is killed and replaced.
+SERVER_WORKER_TIMEOUT_SECONDS = int(os.getenv("SERVER_WORKER_TIMEOUT_SECONDS", "60"))
+
+# On-demand sampling profiler at /debug/profile. Off by default; when enabled,
+# requests must send "Authorization: Bearer $PROFILING_TOKEN". Each profile
+# covers the one worker that served it, named by its X-Profile-Pid header.
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+PROFILE_SAMPLE_INTERVAL_MS = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "10"))
@@ -0,0 +1,137 @@
+"""Query execution helpers for the news context endpoints."""
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .. import config
+from ..replicas import ReplicaRouter
+from . import prepared, slow_queries
+from .prepared import PreparedStatement
+from .queries import (
+    PRIOR_NEWS_COLUMNS,
+    PRIOR_NEWS_QUERY,
+    TRADED_NEWS_COLUMNS,
+    TRADED_NEWS_PROJECTION_COLUMNS,
+    TRADED_NEWS_PROJECTION_QUERY,
+    TRADED_NEWS_QUERY,
+    build_prior_news_query,
+    build_traded_news_projection_query,
+    build_traded_news_query,
+)
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
+
+_CONTEXT_PARAM_TYPES = ("text", "timestamptz", "interval")
+PRIOR_NEWS_STATEMENT = PreparedStatement("prior_news_context", PRIOR_NEWS_QUERY, _CONTEXT_PARAM_TYPES)
+TRADED_NEWS_STATEMENT = PreparedStatement("traded_news_context", TRADED_NEWS_QUERY, _CONTEXT_PARAM_TYPES)
+TRADED_NEWS_PROJECTION_STATEMENT = PreparedStatement(
+    "traded_news_projection", TRADED_NEWS_PROJECTION_QUERY, _CONTEXT_PARAM_TYPES
+)
+
+
+@lru_cache(maxsize=256)
+def _field_statement(
+    full: PreparedStatement,
+    build: Callable[[tuple[str, ...]], str],
+    columns: tuple[str, ...],
+    fields: tuple[str, ...] | None,
+) -> PreparedStatement:
+    """full, or a variant selecting only fields, prepared under its own name.
+
+    The name carries a bitmask of the fields' positions in columns, so distinct
+    field sets never share a name.
+    """
+    if fields is None:
+        return full
+    mask = sum(1 << columns.index(field) for field in fields)
+    return PreparedStatement(f"{full.name}_{mask:x}", build(fields), full.param_types)
+
+
+def fetch_prior_news(
+    db: "DatabaseAdapter",
+    ticker: str,
+    reference_timestamp: datetime,
+    lookback: timedelta,
+    statement_timeout_ms: int | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> list[dict]:
+    """Fetch prior-news rows for a ticker in [reference_timestamp - lookback, reference_timestamp).
+
+    fields, from PRIOR_NEWS_COLUMNS in column order, narrows the SELECT list.
+    """
+    statement = _field_statement(PRIOR_NEWS_STATEMENT, build_prior_news_query, tuple(PRIOR_NEWS_COLUMNS), fields)
+    return _fetch(db, statement, ticker, reference_timestamp, lookback, statement_timeout_ms)
+
+
+def fetch_traded_news(
+    db: "DatabaseAdapter",
+    ticker: str,
+    reference_timestamp: datetime,
+    lookback: timedelta,
+    statement_timeout_ms: int | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> list[dict]:
+    """Fetch traded-news rows for a ticker in [reference_timestamp - lookback, reference_timestamp).
+
+    Reads the traded_news_by_symbol projection when TRADED_NEWS_FROM_PROJECTION is set.
+    fields, from TRADED_NEWS_COLUMNS in column order, narrows the SELECT list.
+    """
+    if config.TRADED_NEWS_FROM_PROJECTION:
+        statement = _field_statement(
+            TRADED_NEWS_PROJECTION_STATEMENT,
+            build_traded_news_projection_query,
+            tuple(TRADED_NEWS_PROJECTION_COLUMNS),
+            fields,
+        )
+    else:
+        statement = _field_statement(TRADED_NEWS_STATEMENT, build_traded_news_query, tuple(TRADED_NEWS_COLUMNS), fields)
+    return _fetch(db, statement, ticker, reference_timestamp, lookback, statement_timeout_ms)
+
+
+def _fetch(
+    db: "DatabaseAdapter",
+    statement: PreparedStatement,
+    ticker: str,
+    reference_timestamp: datetime,
+    lookback: timedelta,
+    statement_timeout_ms: int | None,
+) -> list[dict]:
+    # psycopg2 is imported on first query rather than at app import
+    from psycopg2.errors import InvalidSqlStatementName
+    from psycopg2.extras import RealDictCursor
+
+    params = (ticker, reference_timestamp, lookback)
+
+    def execute(conn, cur) -> None:
+        if config.PREPARED_STATEMENTS:
+            prepared.ensure_prepared(conn, cur, statement, config.PLAN_CACHE_MODE)
+        if statement_timeout_ms:
+            # Scoped to the read transaction, so pooled connections are unaffected
+            cur.execute("SET LOCAL statement_timeout = %s", (int(statement_timeout_ms),))
+        if config.PREPARED_STATEMENTS:
+            cur.execute(statement.execute_sql, params)
+        else:
+            cur.execute(statement.text_sql, statement.text_params(params))
+
+    def run(conn) -> list[dict]:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            started = time.perf_counter()
+            try:
+                execute(conn, cur)
+            except InvalidSqlStatementName:
+                # The session was reset under us (e.g. DISCARD ALL); prepare again
+                conn.rollback()
+                prepared.forget(conn)
+                execute(conn, cur)
+            rows = [dict(row) for row in cur.fetchall()]
+        slow_queries.capture(db, statement, params, (time.perf_counter() - started) * 1000)
+        return rows
+
+    if isinstance(db, ReplicaRouter):
+        # Lets the router hedge the whole read across replicas
+        return db.run_read(run)
+    with db.read_connection() as conn:
+        return run(conn)
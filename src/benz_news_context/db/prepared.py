@@ -0,0 +1,75 @@
+"""Server-side prepared statements, prepared once per pooled connection."""
+import re
+import threading
+import weakref
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+# Statement names prepared on each live connection; entries vanish with the connection.
+_prepared: "weakref.WeakKeyDictionary[Any, set[str]]" = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+_PLACEHOLDER = re.compile(r"\$(\d+)")
+
+
+@dataclass(frozen=True)
+class PreparedStatement:
+    """A query with $n placeholders, prepared under name with the given parameter types."""
+
+    name: str
+    query: str
+    param_types: tuple[str, ...]
+
+    @property
+    def prepare_sql(self) -> str:
+        body = self.query.strip().rstrip(";")
+        return f"PREPARE {self.name}({', '.join(self.param_types)}) AS\n{body}"
+
+    @property
+    def execute_sql(self) -> str:
+        return f"EXECUTE {self.name}({', '.join(['%s'] * len(self.param_types))})"
+
+    @cached_property
+    def text_sql(self) -> str:
+        """query for sending as plain text through psycopg2, with $n as %(pn)s.
+
+        Parameters are typed by their casts in the query, as when prepared.
+        """
+        return _PLACEHOLDER.sub(r"%(p\1)s", self.query.replace("%", "%%"))
+
+    def text_params(self, params: tuple) -> dict[str, Any]:
+        """params keyed for text_sql."""
+        return {f"p{position}": value for position, value in enumerate(params, start=1)}
+
+
+def ensure_prepared(conn: Any, cur: Any, statement: PreparedStatement, plan_cache_mode: str) -> None:
+    """Prepare statement on conn unless already done, then commit.
+
+    plan_cache_mode is applied as a session setting the first time a connection
+    prepares anything. The commit keeps that setting from being undone when the
+    read transaction is later rolled back.
+    """
+    from psycopg2.errors import DuplicatePreparedStatement
+
+    with _lock:
+        names = _prepared.get(conn)
+        if names is not None and statement.name in names:
+            return
+    try:
+        if names is None:
+            cur.execute("SELECT set_config('plan_cache_mode', %s, false)", (plan_cache_mode,))
+        cur.execute(statement.prepare_sql)
+    except DuplicatePreparedStatement:
+        # Prepared by an earlier checkout whose bookkeeping was lost
+        conn.rollback()
+    else:
+        conn.commit()
+    with _lock:
+        _prepared.setdefault(conn, set()).add(statement.name)
+
+
+def forget(conn: Any) -> None:
+    """Drop what is known about conn's prepared statements, e.g. after a session reset."""
+    with _lock:
+        _prepared.pop(conn, None)
+
@@ -1,35 +1,76 @@
 """SQL query definitions for benz_news_context service."""
+from collections.abc import Sequence
 
-PRIOR_NEWS_QUERY = """
-SELECT
-    na.id,
-    na.title,
-    na.published_utc,
-    na.channels,
-    na.tags,
-    td.sentiment,
-    td.confidence AS sentiment_score,
-    (td.decision = 'TRADE') AS was_traded,
-    CASE WHEN td.decision = 'TRADE' THEN
+# Lookback windows are bound as the $3 interval parameter so the same statement
+# serves both per-request lookups and wider cache prewarm windows.
+#
+# Every time column is bounded by parameters only, so when news_articles and
+# order_fills are range-partitioned on them (see db/schema.py) Postgres prunes
+# partitions at executor startup, for custom and generic plans alike. A traded
+# article is published before it is filled, so published_utc < $2 holds for
+# every traded-news row and lets that join skip newer news_articles partitions.
+# Articles may be filled long after publication, so there is no lower bound on
+# published_utc; the join's lookups by na.id probe every older partition. The
+# traded_news_by_symbol projection avoids them altogether.
+PRIOR_NEWS_LOOKBACK_HOURS = 48
+TRADED_NEWS_LOOKBACK_DAYS = 14
+
+# SELECT expression for each PriorNewsArticle field, in response order.
+PRIOR_NEWS_COLUMNS = {
+    "id": "na.id",
+    "title": "na.title",
+    "published_utc": "na.published_utc",
+    "channels": "na.channels",
+    "tags": "na.tags",
+    "sentiment": "td.sentiment",
+    "sentiment_score": "td.confidence AS sentiment_score",
+    "was_traded": "(td.decision = 'TRADE') AS was_traded",
+    "trade_side": """CASE WHEN td.decision = 'TRADE' THEN
         (SELECT os.side FROM order_submissions os WHERE os.article_id = na.id AND os.ticker = $1 LIMIT 1)
-    ELSE NULL END AS trade_side
-FROM news_articles na
-LEFT JOIN trading_decisions td
-    ON na.id = td.article_id AND td.ticker = $1
+    ELSE NULL END AS trade_side""",
+}
+# Fields read from trading_decisions; the join is left out when none is selected.
+_TRADING_DECISION_FIELDS = {"sentiment", "sentiment_score", "was_traded", "trade_side"}
+
+
+def build_prior_news_query(fields: Sequence[str] = tuple(PRIOR_NEWS_COLUMNS)) -> str:
+    """PRIOR_NEWS_QUERY selecting only fields, which must be PRIOR_NEWS_COLUMNS keys."""
+    select = ",\n    ".join(PRIOR_NEWS_COLUMNS[field] for field in fields)
+    join = (
+        "\nLEFT JOIN trading_decisions td\n    ON na.id = td.article_id AND td.ticker = $1"
+        if _TRADING_DECISION_FIELDS.intersection(fields)
+        else ""
+    )
+    return f"""
+SELECT
+    {select}
+FROM news_articles na{join}
 WHERE $1 = ANY(na.tickers)
-  AND na.published_utc >= ($2::timestamptz - INTERVAL '48 hours')
+  AND na.published_utc >= ($2::timestamptz - $3::interval)
   AND na.published_utc < $2::timestamptz
 ORDER BY na.published_utc DESC;
 """
 
-TRADED_NEWS_QUERY = """
+
+PRIOR_NEWS_QUERY = build_prior_news_query()
+
+# SELECT expression for each TradedNewsTrade field, in response order.
+TRADED_NEWS_COLUMNS = {
+    "article_id": "na.id AS article_id",
+    "title": "na.title",
+    "published_utc": "na.published_utc",
+    "trade_executed_at": "of.filled_at AS trade_executed_at",
+    "side": "os.side",
+    "fill_price": "of.fill_price",
+}
+
+
+def build_traded_news_query(fields: Sequence[str] = tuple(TRADED_NEWS_COLUMNS)) -> str:
+    """TRADED_NEWS_QUERY selecting only fields, which must be TRADED_NEWS_COLUMNS keys."""
+    select = ",\n    ".join(TRADED_NEWS_COLUMNS[field] for field in fields)
+    return f"""
 SELECT
-    na.id AS article_id,
-    na.title,
-    na.published_utc,
-    of.filled_at AS trade_executed_at,
-    os.side,
-    of.fill_price
+    {select}
 FROM news_articles na
 INNER JOIN order_submissions os
     ON na.id = os.article_id
@@ -37,7 +78,39 @@ INNER JOIN order_fills of
     ON os.client_order_id = of.client_order_id
 WHERE os.symbol = $1
   AND of.order_leg = 'entry'
-  AND of.filled_at >= ($2::timestamptz - INTERVAL '14 days')
+  AND of.filled_at >= ($2::timestamptz - $3::interval)
   AND of.filled_at < $2::timestamptz
+  AND na.published_utc < $2::timestamptz
 ORDER BY of.filled_at DESC;
 """
+
+
+TRADED_NEWS_QUERY = build_traded_news_query()
+
+# Same result as TRADED_NEWS_QUERY, read from the traded_news_by_symbol projection
+# (see db/schema.py) with one range scan of its (symbol, filled_at) index.
+TRADED_NEWS_PROJECTION_COLUMNS = {
+    "article_id": "article_id",
+    "title": "title",
+    "published_utc": "published_utc",
+    "trade_executed_at": "filled_at AS trade_executed_at",
+    "side": "side",
+    "fill_price": "fill_price",
+}
+
+
+def build_traded_news_projection_query(fields: Sequence[str] = tuple(TRADED_NEWS_PROJECTION_COLUMNS)) -> str:
+    """TRADED_NEWS_PROJECTION_QUERY selecting only fields."""
+    select = ",\n    ".join(TRADED_NEWS_PROJECTION_COLUMNS[field] for field in fields)
+    return f"""
+SELECT
+    {select}
+FROM traded_news_by_symbol
+WHERE symbol = $1
+  AND filled_at >= ($2::timestamptz - $3::interval)
+  AND filled_at < $2::timestamptz
+ORDER BY filled_at DESC;
+"""
+
+
+TRADED_NEWS_PROJECTION_QUERY = build_traded_news_projection_query()
@@ -0,0 +1,342 @@
+"""Database objects owned by this service, and a CLI to install them.
+
+The traded-news projection denormalizes entry fills with their order and
+article into one table indexed by (symbol, filled_at), kept current by a
+trigger on order_fills. Fills are treated as append-only; `rebuild`
+resynchronizes the table if rows were updated or deleted upstream.
+
+news_articles and order_fills can be converted to tables range-partitioned
+by month on their time column (`partition --table ...`). The context
+queries bound that column on both sides, so Postgres prunes each lookup to
+the one or two partitions its window overlaps. `add-partitions` creates
+upcoming months and is meant to run on a schedule.
+
+Usage:
+    DATABASE_URL=postgresql://... PYTHONPATH=src \
+        python -m benz_news_context.db.schema install
+    DATABASE_URL=postgresql://... PYTHONPATH=src \
+        python -m benz_news_context.db.schema partition --table news_articles
+"""
+import argparse
+import os
+from datetime import date, datetime, timezone
+from typing import Any
+
+TRADED_NEWS_PROJECTION_TABLE = "traded_news_by_symbol"
+
+_PROJECTION_SELECT = """SELECT os.symbol, of.filled_at, of.client_order_id, na.id AS article_id,
+       na.title, na.published_utc, os.side, of.fill_price
+FROM news_articles na
+INNER JOIN order_submissions os
+    ON na.id = os.article_id
+INNER JOIN order_fills of
+    ON os.client_order_id = of.client_order_id
+WHERE of.order_leg = 'entry'"""
+
+# Column types are taken from the source tables
+CREATE_TRADED_NEWS_PROJECTION = f"""
+CREATE TABLE IF NOT EXISTS traded_news_by_symbol AS
+{_PROJECTION_SELECT}
+WITH NO DATA;
+CREATE INDEX IF NOT EXISTS traded_news_by_symbol_symbol_filled_at
+    ON traded_news_by_symbol (symbol, filled_at);
+"""
+
+# Mirrors the joins and filters of TRADED_NEWS_QUERY for a single new fill.
+CREATE_TRADED_NEWS_PROJECTION_TRIGGER = """
+CREATE OR REPLACE FUNCTION traded_news_by_symbol_on_fill() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO traded_news_by_symbol
+        (symbol, filled_at, client_order_id, article_id, title, published_utc, side, fill_price)
+    SELECT os.symbol, NEW.filled_at, NEW.client_order_id, na.id, na.title, na.published_utc, os.side, NEW.fill_price
+    FROM order_submissions os
+    INNER JOIN news_articles na ON na.id = os.article_id
+    WHERE os.client_order_id = NEW.client_order_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+DROP TRIGGER IF EXISTS traded_news_by_symbol_on_fill ON order_fills;
+CREATE TRIGGER traded_news_by_symbol_on_fill
+    AFTER INSERT ON order_fills
+    FOR EACH ROW WHEN (NEW.order_leg = 'entry')
+    EXECUTE FUNCTION traded_news_by_symbol_on_fill();
+"""
+
+BACKFILL_TRADED_NEWS_PROJECTION = f"""
+TRUNCATE traded_news_by_symbol;
+INSERT INTO traded_news_by_symbol
+    (symbol, filled_at, client_order_id, article_id, title, published_utc, side, fill_price)
+{_PROJECTION_SELECT};
+ANALYZE traded_news_by_symbol;
+"""
+
+DROP_TRADED_NEWS_PROJECTION = """
+DROP TRIGGER IF EXISTS traded_news_by_symbol_on_fill ON order_fills;
+DROP FUNCTION IF EXISTS traded_news_by_symbol_on_fill();
+DROP TABLE IF EXISTS traded_news_by_symbol;
+"""
+
+
+def install_traded_news_projection(conn: Any) -> None:
+    """Create, backfill and attach the traded-news projection in one transaction.
+
+    order_fills is locked against writes while the backfill runs, so no fill
+    lands between the snapshot and the trigger taking over. Safe to re-run.
+    """
+    with conn.cursor() as cur:
+        cur.execute(CREATE_TRADED_NEWS_PROJECTION)
+        cur.execute("LOCK TABLE order_fills IN SHARE MODE")
+        cur.execute(BACKFILL_TRADED_NEWS_PROJECTION)
+        cur.execute(CREATE_TRADED_NEWS_PROJECTION_TRIGGER)
+    conn.commit()
+
+
+def drop_traded_news_projection(conn: Any) -> None:
+    """Remove the projection table, trigger and function."""
+    with conn.cursor() as cur:
+        cur.execute(DROP_TRADED_NEWS_PROJECTION)
+    conn.commit()
+
+
+# Tables the service reads by time window, and the column each is partitioned on.
+PARTITION_KEYS = {
+    "news_articles": "published_utc",
+    "order_fills": "filled_at",
+}
+
+# Indexes the context queries rely on, created on converted tables. Primary
+# keys and unique constraints are carried over separately; other indexes and
+# foreign keys on the original table are not.
+PARTITION_INDEXES = {
+    "news_articles": ["USING GIN (tickers)", "(published_utc)"],
+    "order_fills": ["(client_order_id)", "(filled_at)"],
+}
+
+
+def _next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def month_starts(start: date, end: date) -> list[date]:
+    """First day of every month from start's month through end's month."""
+    months = []
+    month = date(start.year, start.month, 1)
+    while month <= end:
+        months.append(month)
+        month = _next_month(month)
+    return months
+
+
+def create_monthly_partitions(cur: Any, parent: str, table: str, start: date, end: date) -> list[str]:
+    """Create monthly partitions of parent covering start through end; existing ones are kept.
+
+    Partitions are named after table, so names stay stable when parent is a
+    staging table that is later renamed to table. Bounds are UTC midnights.
+    """
+    names = []
+    for month in month_starts(start, end):
+        name = f"{table}_p{month:%Y_%m}"
+        cur.execute(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{_next_month(month).isoformat()} 00:00:00+00')"
+        )
+        names.append(name)
+    return names
+
+
+def _is_partitioned(cur: Any, table: str) -> bool:
+    cur.execute(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.oid = to_regclass(%s)",
+        (table,),
+    )
+    return cur.fetchone() is not None
+
+
+def _referencing_constraints(cur: Any, table: str) -> list[str]:
+    cur.execute(
+        "SELECT conrelid::regclass || '.' || conname FROM pg_constraint "
+        "WHERE contype = 'f' AND confrelid = to_regclass(%s) ORDER BY 1",
+        (table,),
+    )
+    return [name for (name,) in cur.fetchall()]
+
+
+def _unique_keys(cur: Any, table: str) -> list[tuple[str, list[str]]]:
+    """(constraint type, columns) for the primary key and each unique constraint of table."""
+    cur.execute(
+        "SELECT c.contype, ARRAY("
+        " SELECT a.attname::text FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, position)"
+        " JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum ORDER BY k.position"
+        ") FROM pg_constraint c WHERE c.conrelid = to_regclass(%s) AND c.contype IN ('p', 'u') "
+        "ORDER BY c.contype, c.conname",
+        (table,),
+    )
+    return cur.fetchall()
+
+
+def _owned_sequences(cur: Any, table: str) -> list[tuple[str, str]]:
+    """(sequence, column) for each serial sequence owned by a column of table."""
+    cur.execute(
+        "SELECT d.objid::regclass::text, a.attname FROM pg_depend d "
+        "JOIN pg_class s ON s.oid = d.objid AND s.relkind = 'S' "
+        "JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid "
+        "WHERE d.classid = 'pg_class'::regclass AND d.refobjid = to_regclass(%s) AND d.deptype = 'a'",
+        (table,),
+    )
+    return cur.fetchall()
+
+
+def convert_to_partitioned(conn: Any, table: str, months_ahead: int = 3) -> None:
+    """Rebuild table as a monthly range-partitioned table in one transaction.
+
+    The table is locked for the copy. Defaults, CHECK and NOT NULL
+    constraints are copied. The primary key and unique constraints are
+    recreated with the partition column appended, since Postgres requires
+    it in every unique key of a partitioned table: the primary key of
+    news_articles becomes (id, published_utc), and writers using
+    ON CONFLICT (id) must name (id, published_utc) instead.
+
+    The original is kept, renamed to <table>_unpartitioned, for verification
+    and manual cleanup; serial sequences move to the new table, so dropping
+    the original leaves its column defaults intact. A default partition
+    catches rows outside the created months, so writers never fail on a
+    missing partition.
+
+    Raises ValueError if other tables hold foreign keys to table: they would
+    keep pointing at the renamed original, and a partitioned table cannot
+    be referenced by a key that excludes the partition column. Drop them
+    first.
+    """
+    column = PARTITION_KEYS[table]
+    staging = f"{table}_partitioned"
+    with conn.cursor() as cur:
+        if _is_partitioned(cur, table):
+            conn.rollback()
+            return
+        referencing = _referencing_constraints(cur, table)
+        if referencing:
+            conn.rollback()
+            raise ValueError(f"{table} is referenced by foreign keys {', '.join(referencing)}; drop them first")
+        cur.execute(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE")
+        cur.execute(f"SELECT min({column}), max({column}) FROM {table}")
+        oldest, newest = cur.fetchone()
+        today = datetime.now(timezone.utc).date()
+        start = oldest.astimezone(timezone.utc).date() if oldest else today
+        end = max(newest.astimezone(timezone.utc).date() if newest else today, today)
+        for _ in range(months_ahead):
+            end = _next_month(end)
+        cur.execute(
+            f"CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS INCLUDING GENERATED "
+            f"INCLUDING CONSTRAINTS INCLUDING STORAGE) PARTITION BY RANGE ({column})"
+        )
+        create_monthly_partitions(cur, staging, table, start, end)
+        cur.execute(f"CREATE TABLE {table}_default PARTITION OF {staging} DEFAULT")
+        cur.execute(f"INSERT INTO {staging} SELECT * FROM {table}")
+        for kind, columns in _unique_keys(cur, table):
+            key = ", ".join(columns if column in columns else [*columns, column])
+            cur.execute(f"ALTER TABLE {staging} ADD {'PRIMARY KEY' if kind == 'p' else 'UNIQUE'} ({key})")
+        for index in PARTITION_INDEXES[table]:
+            cur.execute(f"CREATE INDEX ON {staging} {index}")
+        sequences = _owned_sequences(cur, table)
+        cur.execute(f"ALTER TABLE {table} RENAME TO {table}_unpartitioned")
+        cur.execute(f"ALTER TABLE {staging} RENAME TO {table}")
+        for sequence, owner_column in sequences:
+            # The copied defaults still call nextval() on it
+            cur.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.{owner_column}")
+        if table == "order_fills" and _projection_installed(cur):
+            # The trigger stayed with the renamed original; attach it to the new table
+            cur.execute(CREATE_TRADED_NEWS_PROJECTION_TRIGGER)
+        cur.execute(f"ANALYZE {table}")
+    conn.commit()
+
+
+def _projection_installed(cur: Any) -> bool:
+    cur.execute("SELECT to_regclass(%s)", (TRADED_NEWS_PROJECTION_TABLE,))
+    return cur.fetchone()[0] is not None
+
+
+def add_partitions(conn: Any, months_ahead: int = 3) -> list[str]:
+    """Ensure partitions for the current month and months_ahead more on each partitioned table.
+
+    Rows that landed in the default partition for those months would block
+    creating them, so the default partition is detached, the rows are moved
+    into the new partitions and it is attached again, all in one
+    transaction. Returns the partition names covering that range.
+    """
+    today = datetime.now(timezone.utc).date()
+    end = today
+    for _ in range(months_ahead):
+        end = _next_month(end)
+    lower = f"{date(today.year, today.month, 1).isoformat()} 00:00:00+00"
+    upper = f"{_next_month(end).isoformat()} 00:00:00+00"
+    names = []
+    with conn.cursor() as cur:
+        for table in PARTITION_KEYS:
+            if not _is_partitioned(cur, table):
+                continue
+            column = PARTITION_KEYS[table]
+            default = f"{table}_default"
+            cur.execute("SELECT to_regclass(%s)", (default,))
+            stranded = False
+            if cur.fetchone()[0] is not None:
+                cur.execute(
+                    f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {column} >= %s AND {column} < %s)",
+                    (lower, upper),
+                )
+                stranded = cur.fetchone()[0]
+            if stranded:
+                cur.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+            names.extend(create_monthly_partitions(cur, table, table, today, end))
+            if stranded:
+                cur.execute(
+                    f"WITH moved AS (DELETE FROM {default} WHERE {column} >= %s AND {column} < %s RETURNING *) "
+                    f"INSERT INTO {table} SELECT * FROM moved",
+                    (lower, upper),
+                )
+                cur.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+    conn.commit()
+    return names
+
+
+COMMANDS = {
+    "install": install_traded_news_projection,
+    # Same steps as install: truncate and backfill under the write lock
+    "rebuild": install_traded_news_projection,
+    "drop": drop_traded_news_projection,
+}
+PARTITION_COMMANDS = ("partition", "add-partitions")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=sorted([*COMMANDS, *PARTITION_COMMANDS]))
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--table", choices=sorted(PARTITION_KEYS), help="Table to convert (partition)")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    args = parser.parse_args()
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    if args.command == "partition" and not args.table:
+        parser.error("partition requires --table")
+
+    import psycopg2
+
+    conn = psycopg2.connect(args.dsn)
+    try:
+        if args.command == "partition":
+            try:
+                convert_to_partitioned(conn, args.table, args.months_ahead)
+            except ValueError as e:
+                parser.error(str(e))
+        elif args.command == "add-partitions":
+            print("\n".join(add_partitions(conn, args.months_ahead)))
+        else:
+            COMMANDS[args.command](conn)
+    finally:
+        conn.close()
+    print(f"{args.command}: done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""Capture of slow context queries, with sampled EXPLAIN ANALYZE, to a rotating JSONL file."""
+import fcntl
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+from loguru import logger
+
+from .. import config
+from ..tracing import current_trace_id
+from . import prepared
+from .prepared import PreparedStatement
+
+_writer: logging.Logger | None = None
+_writer_lock = threading.Lock()
+# Held open for the life of the process; the lock on it reserves this worker's log file
+_slot_lock: int | None = None
+# A single background EXPLAIN at a time; samples arriving while one runs are skipped
+_explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+_explain_slot = threading.Semaphore(1)
+
+
+def _claim_log_path(template: str) -> str:
+    """Lowest-numbered log path for {worker} in template that no live process holds.
+
+    A worker that replaces a recycled one takes over its file, so the files
+    on disk are bounded by the number of workers running at once.
+    """
+    global _slot_lock
+    if "{worker}" not in template:
+        return template
+    for worker in itertools.count():
+        path = template.replace("{worker}", str(worker))
+        fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            continue
+        if _slot_lock is not None:
+            os.close(_slot_lock)
+        _slot_lock = fd
+        return path
+
+
+def _get_writer() -> logging.Logger:
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            path = _claim_log_path(config.SLOW_QUERY_LOG_PATH)
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=config.SLOW_QUERY_LOG_MAX_BYTES,
+                backupCount=config.SLOW_QUERY_LOG_BACKUPS,
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            writer = logging.getLogger("benz_news_context.slow_queries")
+            writer.setLevel(logging.INFO)
+            writer.propagate = False
+            for stale in list(writer.handlers):
+                writer.removeHandler(stale)
+                stale.close()
+            writer.addHandler(handler)
+            _writer = writer
+        return _writer
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f"{value.total_seconds():g} seconds"
+    return str(value)
+
+
+def write_record(record: dict) -> None:
+    _get_writer().info(json.dumps(record, default=_json_default))
+
+
+def explain(conn: Any, statement: PreparedStatement, params: tuple) -> Any:
+    """Run EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) for statement with params on conn.
+
+    The statement is explained through EXECUTE so the plan is the one the
+    service would get for these parameters, generic or custom. When prepared
+    statements are disabled it is prepared under a scratch name and deallocated.
+    The transaction is rolled back last, so conn is returned idle.
+    """
+    with conn.cursor() as cur:
+        if config.PREPARED_STATEMENTS:
+            prepared.ensure_prepared(conn, cur, statement, config.PLAN_CACHE_MODE)
+            target = statement
+        else:
+            target = PreparedStatement(
+                f"{statement.name}_explain_{uuid.uuid4().hex[:8]}", statement.query, statement.param_types
+            )
+            cur.execute(target.prepare_sql)
+        try:
+            cur.execute("SET LOCAL statement_timeout = %s", (config.SLOW_QUERY_EXPLAIN_TIMEOUT_MS,))
+            cur.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {target.execute_sql}", params)
+            return cur.fetchone()[0]
+        finally:
+            if target is not statement:
+                from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+
+                # DEALLOCATE cannot run in a failed transaction, and rollback does not undo PREPARE
+                if conn.get_transaction_status() == TRANSACTION_STATUS_INERROR:
+                    conn.rollback()
+                cur.execute(f"DEALLOCATE {target.name}")
+            conn.rollback()
+
+
+def _explain_and_write(db: Any, statement: PreparedStatement, params: tuple, record: dict) -> None:
+    try:
+        with db.read_connection() as conn:
+            record["plan"] = explain(conn, statement, params)
+    except Exception as e:
+        record["explain_error"] = type(e).__name__
+    finally:
+        _explain_slot.release()
+    write_record(record)
+
+
+def capture(db: Any, statement: PreparedStatement, params: tuple, elapsed_ms: float) -> None:
+    """Record a query that ran for elapsed_ms if it crossed SLOW_QUERY_THRESHOLD_MS.
+
+    A sampled share of slow queries is re-run under EXPLAIN ANALYZE in the
+    background, on its own connection, so the request is not delayed.
+    """
+    threshold_ms = config.SLOW_QUERY_THRESHOLD_MS
+    if not threshold_ms or elapsed_ms < threshold_ms:
+        return
+    ticker, reference_timestamp, lookback = params
+    record = {
+        "logged_at": datetime.now(timezone.utc),
+        "trace_id": current_trace_id(),
+        "query": statement.name,
+        "elapsed_ms": round(elapsed_ms, 2),
+        "threshold_ms": threshold_ms,
+        "params": {"ticker": ticker, "reference_timestamp": reference_timestamp, "lookback": lookback},
+    }
+    logger.warning(
+        f"Slow query {statement.name}: ticker={ticker}, ref_ts={reference_timestamp}, "
+        f"elapsed_ms={elapsed_ms:.0f}"
+    )
+    if random.random() < config.SLOW_QUERY_EXPLAIN_SAMPLE_RATE and _explain_slot.acquire(blocking=False):
+        _explain_executor.submit(_explain_and_write, db, statement, params, record)
+    else:
+        write_record(record)
@@ -1,7 +1,128 @@
 """FastAPI dependency injection functions."""
-from benz_common.db import DatabaseAdapter, get_database_adapter
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from fastapi import Depends, Header, HTTPException
+from loguru import logger
+
+from . import config
+from .admission import DEADLINE_HEADER, AdmissionController, Deadline
+from .cache import ContextCache
+from .health import HealthMonitor
+from .prewarm import HotTickerTracker
+from .replicas import ReplicaRouter
+from .shared_cache import SharedContextCache
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
+
+
+def get_db_adapter() -> "DatabaseAdapter":
+    """FastAPI dependency for database adapter.
+
+    When READ_REPLICA_URLS is set, reads are routed across those endpoints instead.
+    benz_common is imported on first use so it stays off the startup path.
+    """
+    if config.READ_REPLICA_URLS:
+        return get_replica_router()
+    from benz_common.db import get_database_adapter
 
-def get_db_adapter() -> DatabaseAdapter:
-    """FastAPI dependency for database adapter."""
     return get_database_adapter()
+
+
+@lru_cache
+def get_replica_router() -> ReplicaRouter:
+    """Process-wide router over the configured read replicas."""
+    return ReplicaRouter.from_dsns(
+        config.READ_REPLICA_URLS,
+        pool_max=config.READ_REPLICA_POOL_MAX,
+        hedge_enabled=config.READ_HEDGING_ENABLED,
+        hedge_percentile=config.READ_HEDGE_PERCENTILE,
+        hedge_min_delay_ms=config.READ_HEDGE_MIN_DELAY_MS,
+        hedge_max_ratio=config.READ_HEDGE_MAX_RATIO,
+        # Room for every admitted read's primary and its hedge
+        hedge_max_workers=2 * config.ADMISSION_MAX_CONCURRENT,
+        eject_after_failures=config.READ_REPLICA_EJECT_AFTER_FAILURES,
+        eject_seconds=config.READ_REPLICA_EJECT_SECONDS,
+    )
+
+
+@lru_cache
+def get_context_cache() -> ContextCache:
+    """FastAPI dependency for the context result cache.
+
+    Shared by all workers on the host when SHARED_CACHE_PATH is set, otherwise process-wide.
+    """
+    retain_seconds = config.CONTEXT_CACHE_TTL_SECONDS + max(
+        config.CONTEXT_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+        config.CONTEXT_CACHE_STALE_IF_ERROR_SECONDS,
+    )
+    if config.SHARED_CACHE_PATH:
+        try:
+            return SharedContextCache(
+                path=config.SHARED_CACHE_PATH,
+                ttl_seconds=config.CONTEXT_CACHE_TTL_SECONDS,
+                max_tickers=config.CONTEXT_CACHE_MAX_TICKERS,
+                retain_seconds=retain_seconds,
+                max_bytes=config.CONTEXT_CACHE_MAX_BYTES,
+            )
+        except PermissionError as e:
+            logger.error(f"Shared cache refused, using a per-process cache: {e}")
+    return ContextCache(
+        ttl_seconds=config.CONTEXT_CACHE_TTL_SECONDS,
+        max_tickers=config.CONTEXT_CACHE_MAX_TICKERS,
+        retain_seconds=retain_seconds,
+        max_bytes=config.CONTEXT_CACHE_MAX_BYTES,
+    )
+
+
+@lru_cache
+def get_hot_ticker_tracker() -> HotTickerTracker:
+    """FastAPI dependency for the process-wide hot-ticker tracker."""
+    return HotTickerTracker(path=config.HOT_TICKERS_PATH, top_n=config.HOT_TICKERS_TOP_N)
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    """FastAPI dependency for the process-wide context admission controller."""
+    return AdmissionController(
+        max_concurrent=config.ADMISSION_MAX_CONCURRENT,
+        max_queue=config.ADMISSION_MAX_QUEUE,
+    )
+
+
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    """FastAPI dependency for the process-wide background health monitor."""
+    return HealthMonitor(
+        max_probe_age_seconds=config.HEALTH_MAX_PROBE_AGE_SECONDS,
+        probe_timeout_ms=config.HEALTH_PROBE_TIMEOUT_MS,
+        failures_before_not_ready=config.HEALTH_FAILURES_BEFORE_NOT_READY,
+    )
+
+
+async def admit_context_request(
+    deadline_ms: int | None = Header(default=None, alias=DEADLINE_HEADER, ge=0),
+    controller: AdmissionController = Depends(get_admission_controller),
+) -> AsyncIterator[Deadline]:
+    """FastAPI dependency holding an admission slot for the request's duration.
+
+    Rejects with 503 and Retry-After when the wait queue is full or no slot
+    frees up within ADMISSION_MAX_WAIT_MS (or the request's deadline, if sooner).
+    """
+    deadline = Deadline.from_budget_ms(deadline_ms)
+    timeout = config.ADMISSION_MAX_WAIT_MS / 1000
+    remaining = deadline.remaining_seconds()
+    if remaining is not None:
+        timeout = min(timeout, remaining)
+    if not await controller.acquire(timeout):
+        raise HTTPException(
+            status_code=503,
+            detail="Service overloaded",
+            headers={"Retry-After": str(config.ADMISSION_RETRY_AFTER_SECONDS)},
+        )
+    try:
+        yield deadline
+    finally:
+        controller.release()
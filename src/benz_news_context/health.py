@@ -0,0 +1,120 @@
+"""Background database health probing served from memory."""
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from functools import partial
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from .admission import AdmissionController
+from .replicas import ReplicaRouter
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
+
+
+class HealthMonitor:
+    """Holds the result of the latest background database probe.
+
+    Probes run off the request path on a fixed interval; readiness is derived
+    from the last result, so serving /readyz never touches the database.
+    With replica routing every endpoint is probed, and a probe succeeds when
+    any of them answers. Readiness is lost only after failures_before_not_ready
+    probes in a row fail, so one dropped connection does not pull the
+    instance out of rotation.
+    """
+
+    def __init__(self, max_probe_age_seconds: float, probe_timeout_ms: int, failures_before_not_ready: int = 3):
+        self.max_probe_age_seconds = max_probe_age_seconds
+        self.probe_timeout_ms = probe_timeout_ms
+        self.failures_before_not_ready = max(1, failures_before_not_ready)
+        self.started_at = time.time()
+        self._last_probe_at: float | None = None
+        self._last_success_at: float | None = None
+        self._latency_ms: float | None = None
+        self._last_error: str | None = None
+        self._failing_endpoints: list[str] = []
+        self._consecutive_failures = 0
+        self._lock = threading.Lock()
+
+    def probe(self, db: "DatabaseAdapter") -> bool:
+        """Run SELECT 1 against the database, or each replica endpoint, and record the outcome."""
+        if isinstance(db, ReplicaRouter):
+            targets = [(e.name, partial(db.endpoint_connection, e)) for e in db.endpoints]
+        else:
+            targets = [("database", db.read_connection)]
+        started = time.perf_counter()
+        errors: dict[str, str] = {}
+        for name, connect in targets:
+            try:
+                with connect() as conn:
+                    with conn.cursor() as cur:
+                        cur.execute("SET LOCAL statement_timeout = %s", (self.probe_timeout_ms,))
+                        cur.execute("SELECT 1")
+            except Exception as e:
+                errors[name] = type(e).__name__
+                logger.warning(f"Health probe failed: endpoint={name}, error={type(e).__name__}")
+        ok = len(errors) < len(targets)
+        with self._lock:
+            self._last_probe_at = time.time()
+            self._failing_endpoints = sorted(errors)
+            if not ok:
+                self._last_error = next(iter(errors.values()))
+                self._consecutive_failures += 1
+                return False
+            self._last_success_at = self._last_probe_at
+            self._latency_ms = (time.perf_counter() - started) * 1000
+            self._last_error = None
+            self._consecutive_failures = 0
+        return True
+
+    def is_ready(self) -> bool:
+        """Ready unless failures_before_not_ready probes failed in a row or the last success is too old."""
+        with self._lock:
+            if self._consecutive_failures >= self.failures_before_not_ready or self._last_success_at is None:
+                return False
+            return time.time() - self._last_success_at <= self.max_probe_age_seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started_at": _isoformat(self.started_at),
+                "last_probe_at": _isoformat(self._last_probe_at),
+                "last_success_at": _isoformat(self._last_success_at),
+                "probe_latency_ms": None if self._latency_ms is None else round(self._latency_ms, 2),
+                "consecutive_failures": self._consecutive_failures,
+                "last_error": self._last_error,
+                "failing_endpoints": list(self._failing_endpoints),
+            }
+
+
+def _isoformat(ts: float | None) -> str | None:
+    return None if ts is None else datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def pool_saturation(controller: AdmissionController, db: "DatabaseAdapter | None") -> dict:
+    """Report admission slot usage and, for replica routing, per-endpoint pool usage.
+
+    db is None until the adapter has been created.
+    """
+    saturation = {
+        "in_flight": controller.in_flight,
+        "waiting": controller.waiting,
+        "max_concurrent": controller.max_concurrent,
+        "max_queue": controller.max_queue,
+        "utilization": round(controller.in_flight / controller.max_concurrent, 3)
+        if controller.max_concurrent
+        else 1.0,
+    }
+    if isinstance(db, ReplicaRouter):
+        saturation["replicas"] = db.pool_stats()
+    return saturation
+
+
+async def run_health_probe_loop(db: "DatabaseAdapter", monitor: HealthMonitor, interval_seconds: float) -> None:
+    """Probe the database every interval_seconds until cancelled."""
+    while True:
+        await asyncio.to_thread(monitor.probe, db)
+        await asyncio.sleep(interval_seconds)
@@ -1,22 +1,64 @@
 """Pydantic models for benz_news_context API requests and responses."""
 from datetime import datetime
+from functools import lru_cache
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, create_model, field_validator
+
+from .db.queries import PRIOR_NEWS_COLUMNS, TRADED_NEWS_COLUMNS
+
+
+def _select_fields(fields: list[str] | None, allowed: dict) -> list[str] | None:
+    """Validate requested fields against allowed, returning them deduplicated in response order."""
+    if fields is None:
+        return None
+    unknown = sorted(set(fields) - set(allowed))
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}; allowed: {', '.join(allowed)}")
+    if not fields:
+        raise ValueError("fields must not be empty")
+    return [field for field in allowed if field in fields]
+
+
+@lru_cache(maxsize=256)
+def partial_model(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    """model restricted to fields, for responses built from a reduced SELECT list."""
+    return create_model(
+        f"Partial{model.__name__}",
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields},
+    )
 
 
 # Request Models
 class PriorNewsRequest(BaseModel):
-    """Request model for /api/prior-news-context endpoint."""
+    """Request model for /api/prior-news-context endpoint.
+
+    fields limits each article to the named PriorNewsArticle fields; omitted, all are returned.
+    """
 
     ticker: str
     reference_timestamp: datetime
+    fields: list[str] | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def _check_fields(cls, fields: list[str] | None) -> list[str] | None:
+        return _select_fields(fields, PRIOR_NEWS_COLUMNS)
 
 
 class TradedNewsRequest(BaseModel):
-    """Request model for /api/traded-news-context endpoint."""
+    """Request model for /api/traded-news-context endpoint.
+
+    fields limits each trade to the named TradedNewsTrade fields; omitted, all are returned.
+    """
 
     ticker: str
     reference_timestamp: datetime
+    fields: list[str] | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def _check_fields(cls, fields: list[str] | None) -> list[str] | None:
+        return _select_fields(fields, TRADED_NEWS_COLUMNS)
 
 
 # Response Models
@@ -44,6 +86,7 @@ class PriorNewsResponse(BaseModel):
     lookback_hours: int
     articles: list[PriorNewsArticle]
     article_count: int
+    stale: bool = False
 
 
 class TradedNewsTrade(BaseModel):
@@ -65,3 +108,4 @@ class TradedNewsResponse(BaseModel):
     lookback_days: int
     trades: list[TradedNewsTrade]
     trade_count: int
+    stale: bool = False
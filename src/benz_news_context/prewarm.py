@@ -0,0 +1,126 @@
+"""Hot-ticker tracking and background prewarming of the context cache."""
+import asyncio
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from .cache import PRIOR_NEWS, TRADED_NEWS, ContextCache
+from .db.context import fetch_prior_news, fetch_traded_news
+from .db.queries import PRIOR_NEWS_LOOKBACK_HOURS, TRADED_NEWS_LOOKBACK_DAYS
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
+
+_PREWARM_QUERIES = (
+    (PRIOR_NEWS, fetch_prior_news, timedelta(hours=PRIOR_NEWS_LOOKBACK_HOURS)),
+    (TRADED_NEWS, fetch_traded_news, timedelta(days=TRADED_NEWS_LOOKBACK_DAYS)),
+)
+
+
+class HotTickerTracker:
+    """Counts context requests per ticker and persists the hottest set to a JSON file.
+
+    At most max_tracked tickers are counted (by default ten times top_n); once
+    twice that many have been seen, all but the max_tracked most requested are
+    dropped, so arbitrary ticker strings cannot grow the counts without bound.
+    """
+
+    def __init__(self, path: str, top_n: int, max_tracked: int | None = None):
+        self.path = path
+        self.top_n = top_n
+        self.max_tracked = max_tracked if max_tracked is not None else 10 * top_n
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, ticker: str) -> None:
+        with self._lock:
+            self._counts[ticker] += 1
+            if len(self._counts) > 2 * self.max_tracked:
+                self._counts = Counter(dict(self._counts.most_common(self.max_tracked)))
+
+    def hot(self) -> list[str]:
+        """Return up to top_n tickers, most requested first."""
+        with self._lock:
+            return [ticker for ticker, _ in self._counts.most_common(self.top_n)]
+
+    def load(self) -> list[str]:
+        """Seed counts from the persisted hot set; a missing or corrupt file is ignored."""
+        try:
+            with open(self.path) as f:
+                persisted = json.load(f)["tickers"]
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable hot ticker file {self.path}: {type(e).__name__}")
+            return []
+        with self._lock:
+            self._counts.update({str(t): int(c) for t, c in persisted.items()})
+        return self.hot()
+
+    def save(self) -> None:
+        """Atomically write the current hot set with its request counts."""
+        with self._lock:
+            tickers = dict(self._counts.most_common(self.top_n))
+        if not tickers:
+            return
+        payload = {"saved_at": datetime.now(timezone.utc).isoformat(), "tickers": tickers}
+        # Workers share the path, so each writes its own temporary file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist hot tickers to {self.path}: {type(e).__name__}")
+
+
+def prewarm_tickers(db: "DatabaseAdapter", cache: ContextCache, tickers: list[str]) -> int:
+    """Fetch prior-news and traded-news windows for tickers into the cache.
+
+    Each window ends at fetch time, since rows published later are not in it,
+    and starts one cache TTL before the lookback, so requests with a reference
+    timestamp up to one TTL before the fetch are covered. Later requests within
+    the TTL are served from it as a prefix, querying only the rows since the
+    fetch. Returns the number of tickers warmed.
+    """
+    margin = timedelta(seconds=cache.ttl_seconds)
+    reference = datetime.now(timezone.utc)
+    warmed = 0
+    for ticker in tickers:
+        try:
+            for kind, fetch, lookback in _PREWARM_QUERIES:
+                window = lookback + margin
+                cache.put(kind, ticker, reference, window, fetch(db, ticker, reference, window))
+        except Exception as e:
+            logger.warning(f"Prewarm failed: ticker={ticker}, error={type(e).__name__}")
+            continue
+        warmed += 1
+    return warmed
+
+
+async def run_prewarm_loop(
+    db: "DatabaseAdapter",
+    cache: ContextCache,
+    tracker: HotTickerTracker,
+    interval_seconds: float,
+    prewarm_on_startup: bool,
+) -> None:
+    """Prewarm the hot set in the background, then refresh it every interval_seconds."""
+    if not prewarm_on_startup:
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
+    while True:
+        tickers = tracker.hot()
+        if tickers:
+            warmed = await asyncio.to_thread(prewarm_tickers, db, cache, tickers)
+            logger.info(f"Prewarmed context cache: {warmed}/{len(tickers)} hot tickers")
+        await asyncio.to_thread(tracker.save)
+        if interval_seconds <= 0:
+            return
+        await asyncio.sleep(interval_seconds)
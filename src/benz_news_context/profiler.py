@@ -0,0 +1,45 @@
+"""Sampling profiler over the live process, producing collapsed stacks."""
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+
+def _frame_label(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{frame.f_code.co_qualname}"
+
+
+def _collapse(thread_name: str, frame: FrameType | None) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.append(thread_name)
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds: float, interval_seconds: float) -> Counter[str]:
+    """Sample every thread's stack each interval_seconds for seconds.
+
+    Returns how often each stack was seen, keyed root first as
+    "thread;module:function;...". The calling thread is not sampled. Each
+    sample briefly holds the GIL to walk the frames, so overhead scales
+    with the sampling rate rather than with the work being profiled.
+    """
+    own = threading.get_ident()
+    counts: Counter[str] = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident != own:
+                counts[_collapse(names.get(ident, str(ident)), frame)] += 1
+        time.sleep(interval_seconds)
+    return counts
+
+
+def collapsed_text(counts: Counter[str]) -> str:
+    """Render counts in the collapsed format read by flamegraph.pl and speedscope."""
+    return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
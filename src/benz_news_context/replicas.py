@@ -0,0 +1,311 @@
+"""Health-weighted read-replica routing with optional hedged reads."""
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# Latency samples kept per endpoint for the hedge-delay percentile.
+LATENCY_SAMPLES = 256
+# Samples required before the percentile replaces the configured minimum delay.
+MIN_SAMPLES_FOR_PERCENTILE = 20
+EWMA_ALPHA = 0.2
+# Hedges that may be issued back to back before the per-read budget refills.
+HEDGE_BUDGET_BURST = 10.0
+
+
+class ReadEndpoint:
+    """A read endpoint with its connection pool and observed health."""
+
+    def __init__(self, name: str, pool: Any):
+        self.name = name
+        self.pool = pool
+        self.ewma_latency = 0.0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.in_use = 0
+        self._samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._lock = threading.Lock()
+
+    def record_success(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+            if self.ewma_latency == 0.0:
+                self.ewma_latency = latency
+            else:
+                self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+            self.consecutive_failures = 0
+
+    def record_failure(self, eject_after: int, eject_seconds: float) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= eject_after:
+                self.ejected_until = time.monotonic() + eject_seconds
+                logger.warning(f"Ejecting read endpoint {self.name} for {eject_seconds:.0f}s")
+
+    def checked_out(self, delta: int) -> None:
+        with self._lock:
+            self.in_use += delta
+
+    def latency_percentile(self, percentile: float) -> float | None:
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES_FOR_PERCENTILE:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+
+    def weight(self) -> float:
+        """Routing weight: inverse of smoothed latency, zero while ejected."""
+        if time.monotonic() < self.ejected_until:
+            return 0.0
+        return 1.0 / max(self.ewma_latency, 0.001)
+
+
+class ReplicaRouter:
+    """Routes reads across several endpoints, weighted by observed latency and errors.
+
+    Provides the read_connection() side of benz_common's DatabaseAdapter, so it
+    can stand in for the adapter on read paths. run_read() additionally hedges:
+    when the first endpoint has not answered within its latency percentile, the
+    same read is issued to a second endpoint and the first result wins.
+    Hedges are budgeted to hedge_max_ratio of reads so that a slow fleet is
+    not sent twice the load.
+    """
+
+    def __init__(
+        self,
+        endpoints: list[ReadEndpoint],
+        hedge_enabled: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay_ms: float = 10.0,
+        eject_after_failures: int = 3,
+        eject_seconds: float = 5.0,
+        hedge_max_ratio: float = 0.05,
+        hedge_max_workers: int = 32,
+    ):
+        if not endpoints:
+            raise ValueError("ReplicaRouter needs at least one read endpoint")
+        self.endpoints = endpoints
+        self.hedge_enabled = hedge_enabled and len(endpoints) > 1
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay_ms / 1000
+        self.eject_after_failures = eject_after_failures
+        self.eject_seconds = eject_seconds
+        self.hedge_max_ratio = hedge_max_ratio
+        self._hedge_budget = HEDGE_BUDGET_BURST
+        self._hedge_lock = threading.Lock()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=hedge_max_workers, thread_name_prefix="hedged-read")
+            if self.hedge_enabled
+            else None
+        )
+
+    @classmethod
+    def from_dsns(cls, dsns: list[str], pool_max: int, **kwargs: Any) -> "ReplicaRouter":
+        """Build a router with a lazily connecting pool per DSN."""
+        from psycopg2.pool import ThreadedConnectionPool
+
+        endpoints = [
+            ReadEndpoint(f"replica-{i}", ThreadedConnectionPool(0, pool_max, dsn))
+            for i, dsn in enumerate(dsns)
+        ]
+        return cls(endpoints, **kwargs)
+
+    def pool_stats(self) -> list[dict]:
+        """Connections in use per endpoint, for saturation reporting."""
+        return [
+            {
+                "name": e.name,
+                "in_use": e.in_use,
+                "max": getattr(e.pool, "maxconn", None),
+                "ejected": e.weight() == 0.0,
+            }
+            for e in self.endpoints
+        ]
+
+    def choose(self, exclude: ReadEndpoint | None = None) -> ReadEndpoint:
+        """Pick an endpoint at random, weighted by health; ejected ones only as a last resort."""
+        return self._pick([e for e in self.endpoints if e is not exclude] or self.endpoints)
+
+    def _pick(self, candidates: list[ReadEndpoint]) -> ReadEndpoint:
+        weights = [e.weight() for e in candidates]
+        if not any(weights):
+            return min(candidates, key=lambda e: e.ejected_until)
+        return random.choices(candidates, weights=weights)[0]
+
+    @contextmanager
+    def read_connection(self) -> Iterator[Any]:
+        """Check out a connection from a health-weighted choice of endpoint."""
+        with self._checkout(_Attempt(self.choose())) as conn:
+            yield conn
+
+    @contextmanager
+    def endpoint_connection(self, endpoint: ReadEndpoint) -> Iterator[Any]:
+        """Check out a connection from endpoint, e.g. to probe it; another only if its pool is exhausted."""
+        with self._checkout(_Attempt(endpoint)) as conn:
+            yield conn
+
+    @contextmanager
+    def _checkout(self, attempt: "_Attempt") -> Iterator[Any]:
+        """Check out a connection for an attempt, recording its latency and errors.
+
+        A hedged attempt cancelled because the other endpoint won records its
+        elapsed time as latency rather than counting as an endpoint failure.
+        Errors that say nothing about the endpoint, such as the request's own
+        statement_timeout or a bad query, record neither.
+        """
+        conn = self._getconn(attempt)
+        endpoint = attempt.endpoint
+        attempt.conn = conn
+        started = time.perf_counter()
+        broken = False
+        try:
+            yield conn
+            endpoint.record_success(time.perf_counter() - started)
+        except Exception as e:
+            if attempt.cancelled:
+                endpoint.record_success(time.perf_counter() - started)
+            elif _is_endpoint_failure(e):
+                endpoint.record_failure(self.eject_after_failures, self.eject_seconds)
+            raise
+        finally:
+            with attempt.lock:
+                # Detach first so a late cancel() cannot hit the connection's next user
+                attempt.conn = None
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+            try:
+                endpoint.pool.putconn(conn, close=broken)
+            finally:
+                endpoint.checked_out(-1)
+
+    def _getconn(self, attempt: "_Attempt") -> Any:
+        """Check out a connection for attempt from its endpoint's pool.
+
+        Pools connect lazily, so a refused connection surfaces here and counts
+        as an endpoint failure. An exhausted pool says nothing about the
+        endpoint's health; the attempt moves to another endpoint instead.
+        """
+        from psycopg2.pool import PoolError
+
+        exhausted: list[ReadEndpoint] = []
+        while True:
+            endpoint = attempt.endpoint
+            try:
+                conn = endpoint.pool.getconn()
+            except PoolError:
+                exhausted.append(endpoint)
+                remaining = [e for e in self.endpoints if e not in exhausted]
+                if not remaining:
+                    raise
+                attempt.endpoint = self._pick(remaining)
+                logger.debug(f"Pool for {endpoint.name} exhausted; reading from {attempt.endpoint.name}")
+            except Exception:
+                endpoint.record_failure(self.eject_after_failures, self.eject_seconds)
+                raise
+            else:
+                endpoint.checked_out(1)
+                return conn
+
+    def hedge_delay(self, endpoint: ReadEndpoint) -> float:
+        observed = endpoint.latency_percentile(self.hedge_percentile)
+        return max(self.hedge_min_delay, observed or 0.0)
+
+    def run_read(self, fn: Callable[[Any], T]) -> T:
+        """Run fn(conn) against a read endpoint, hedging to a second one when slow."""
+        if not self.hedge_enabled:
+            with self.read_connection() as conn:
+                return fn(conn)
+
+        with self._hedge_lock:
+            self._hedge_budget = min(HEDGE_BUDGET_BURST, self._hedge_budget + self.hedge_max_ratio)
+        primary = self._submit(_Attempt(self.choose()), fn)
+        attempts = {primary.future: primary}
+        # Time the primary from when a worker picks it up, not while it is queued
+        primary.started.wait()
+        delay = self.hedge_delay(primary.endpoint) - (time.perf_counter() - primary.started_at)
+        done, _ = wait(attempts, timeout=max(delay, 0.0))
+        if not done and self._take_hedge():
+            secondary = self._submit(_Attempt(self.choose(exclude=primary.endpoint)), fn)
+            logger.debug(f"Hedging read from {primary.endpoint.name} to {secondary.endpoint.name}")
+            attempts[secondary.future] = secondary
+
+        pending = set(attempts)
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for loser in pending:
+                        attempts[loser].cancel()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _take_hedge(self) -> bool:
+        """Spend one hedge from the budget that each read refills by hedge_max_ratio."""
+        with self._hedge_lock:
+            if self._hedge_budget < 1.0:
+                return False
+            self._hedge_budget -= 1.0
+            return True
+
+    def _submit(self, attempt: "_Attempt", fn: Callable[[Any], T]) -> "_Attempt":
+        def run() -> T:
+            attempt.started_at = time.perf_counter()
+            attempt.started.set()
+            with self._checkout(attempt) as conn:
+                return fn(conn)
+
+        # Each attempt runs in its own copy of the caller's context, so trace IDs reach the worker
+        attempt.future = self._executor.submit(contextvars.copy_context().run, run)
+        return attempt
+
+
+def _is_endpoint_failure(error: Exception) -> bool:
+    """Whether error reflects on the endpoint rather than on the query or its deadline."""
+    import psycopg2
+    from psycopg2.errors import QueryCanceled
+
+    if isinstance(error, QueryCanceled):
+        return False
+    if isinstance(error, psycopg2.Error):
+        # Lost connections and server trouble; not syntax, data or constraint errors
+        return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError))
+    return True
+
+
+class _Attempt:
+    """One endpoint's share of a possibly hedged read."""
+
+    def __init__(self, endpoint: ReadEndpoint):
+        self.endpoint = endpoint
+        self.conn: Any = None
+        self.future: Future | None = None
+        self.cancelled = False
+        self.lock = threading.Lock()
+        self.started = threading.Event()
+        self.started_at = 0.0
+
+    def cancel(self) -> None:
+        """Abandon the attempt, asking Postgres to abort its query if it is running."""
+        self.cancelled = True
+        if self.future is not None and self.future.cancel():
+            return
+        with self.lock:
+            if self.conn is not None:
+                try:
+                    self.conn.cancel()
+                except Exception as e:
+                    logger.debug(f"Could not cancel hedged read on {self.endpoint.name}: {type(e).__name__}")
@@ -1,11 +1,25 @@
 """API endpoints for news context retrieval."""
-from benz_common.db import DatabaseAdapter
-from fastapi import APIRouter, Depends, HTTPException
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
 from loguru import logger
-from psycopg2.extras import RealDictCursor
+from pydantic import TypeAdapter
 
-from ..db.queries import PRIOR_NEWS_QUERY, TRADED_NEWS_QUERY
-from ..dependencies import get_db_adapter
+from .. import config
+from ..admission import Deadline, DeadlineExceeded
+from ..cache import PRIOR_NEWS, TRADED_NEWS, ContextCache
+from ..db.context import fetch_prior_news, fetch_traded_news
+from ..db.queries import PRIOR_NEWS_LOOKBACK_HOURS, TRADED_NEWS_LOOKBACK_DAYS
+from ..dependencies import (
+    admit_context_request,
+    get_context_cache,
+    get_db_adapter,
+    get_hot_ticker_tracker,
+)
 from ..models import (
     PriorNewsArticle,
     PriorNewsRequest,
@@ -13,31 +27,177 @@ from ..models import (
     TradedNewsRequest,
     TradedNewsResponse,
     TradedNewsTrade,
+    partial_model,
 )
+from ..prewarm import HotTickerTracker
+
+if TYPE_CHECKING:
+    from benz_common.db import DatabaseAdapter
 
 router = APIRouter()
 
+Fetch = Callable[..., list[dict]]
+# Serializes responses holding partial_model() rows, which response_model would reject
+_PROJECTED_RESPONSE = TypeAdapter(dict[str, Any])
+
+
+def _deadline_errors() -> tuple[type[Exception], ...]:
+    """Errors reported as 504; evaluated only when a request fails, so psycopg2 loads lazily."""
+    from psycopg2.errors import QueryCanceled
+
+    return (DeadlineExceeded, QueryCanceled)
+
+
+def _refresh(
+    kind: str,
+    fetch: Fetch,
+    db: "DatabaseAdapter",
+    cache: ContextCache,
+    ticker: str,
+    reference_timestamp: datetime,
+    lookback: timedelta,
+) -> None:
+    """Re-fetch a window that was served stale and store the result."""
+    key = (kind, ticker, reference_timestamp, lookback)
+    try:
+        rows = fetch(db, ticker, reference_timestamp, lookback, config.DEFAULT_STATEMENT_TIMEOUT_MS or None)
+        cache.put(kind, ticker, reference_timestamp, lookback, rows)
+    except Exception as e:
+        logger.warning(f"Background refresh failed for {kind}: ticker={ticker}, error={type(e).__name__}")
+    finally:
+        cache.release_refresh(key)
+
+
+def _load_rows(
+    kind: str,
+    fetch: Fetch,
+    db: "DatabaseAdapter",
+    cache: ContextCache,
+    background_tasks: BackgroundTasks,
+    ticker: str,
+    reference_timestamp: datetime,
+    lookback: timedelta,
+    deadline: Deadline,
+    fields: tuple[str, ...] | None = None,
+) -> tuple[list[dict], bool]:
+    """Return (rows, stale) for a context window.
+
+    Fresh cache hits are returned as is. A result expired by less than the
+    stale-while-revalidate bound is returned marked stale and refreshed in the
+    background. Otherwise the database is queried under a statement_timeout
+    derived from the request deadline; if that fails, a result expired by less
+    than the stale-if-error bound is returned instead. When a fresh window
+    covers the start of the lookback but ends too early, as a prewarmed window
+    does for live requests, only the uncovered tail is queried and the newer
+    rows are put in front of the cached ones.
+
+    With fields, a miss selects only those columns and the partial rows are
+    not cached; cached rows are always complete, so hits carry every field.
+    """
+    hit = cache.lookup(
+        kind,
+        ticker,
+        reference_timestamp,
+        lookback,
+        max_age=cache.ttl_seconds + config.CONTEXT_CACHE_STALE_WHILE_REVALIDATE_SECONDS,
+    )
+    if hit is not None:
+        rows, age = hit
+        if age < cache.ttl_seconds:
+            return rows, False
+        if cache.claim_refresh((kind, ticker, reference_timestamp, lookback)):
+            background_tasks.add_task(_refresh, kind, fetch, db, cache, ticker, reference_timestamp, lookback)
+        return rows, True
+
+    try:
+        statement_timeout_ms = deadline.statement_timeout_ms(
+            margin_ms=config.STATEMENT_TIMEOUT_MARGIN_MS,
+            default_ms=config.DEFAULT_STATEMENT_TIMEOUT_MS,
+        )
+        prefix = cache.lookup_prefix(kind, ticker, reference_timestamp, lookback)
+        if prefix is not None:
+            cached, tail = prefix
+            # Complete rows, like every other cache-served result
+            return fetch(db, ticker, reference_timestamp, tail, statement_timeout_ms) + cached, False
+        rows = fetch(db, ticker, reference_timestamp, lookback, statement_timeout_ms, fields)
+    except Exception as e:
+        hit = cache.lookup(
+            kind,
+            ticker,
+            reference_timestamp,
+            lookback,
+            max_age=cache.ttl_seconds + config.CONTEXT_CACHE_STALE_IF_ERROR_SECONDS,
+        )
+        if hit is None:
+            raise
+        logger.warning(
+            f"Serving stale {kind} after database error: ticker={ticker}, "
+            f"age={hit[1]:.0f}s, error={type(e).__name__}"
+        )
+        return hit[0], True
+    if fields is None:
+        cache.put(kind, ticker, reference_timestamp, lookback, rows)
+    return rows, False
+
+
+def _projected_response(content: dict) -> Response:
+    return Response(_PROJECTED_RESPONSE.dump_json(content), media_type="application/json")
+
 
 @router.post("/api/prior-news-context", response_model=PriorNewsResponse)
 async def prior_news_context(
     request: PriorNewsRequest,
-    db: DatabaseAdapter = Depends(get_db_adapter),
+    background_tasks: BackgroundTasks,
+    db: "DatabaseAdapter" = Depends(get_db_adapter),
+    cache: ContextCache = Depends(get_context_cache),
+    tracker: HotTickerTracker = Depends(get_hot_ticker_tracker),
+    deadline: Deadline = Depends(admit_context_request),
 ):
     """Return recent news articles about a ticker from the 48 hours before a reference timestamp."""
+    tracker.record(request.ticker)
+    lookback = timedelta(hours=PRIOR_NEWS_LOOKBACK_HOURS)
+    fields = tuple(request.fields) if request.fields else None
     try:
-        with db.read_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(PRIOR_NEWS_QUERY, (request.ticker, request.reference_timestamp))
-                rows = cur.fetchall()
-                articles = [PriorNewsArticle(**dict(row)) for row in rows]
+        rows, stale = await run_in_threadpool(
+            _load_rows,
+            PRIOR_NEWS,
+            fetch_prior_news,
+            db,
+            cache,
+            background_tasks,
+            request.ticker,
+            request.reference_timestamp,
+            lookback,
+            deadline,
+            fields,
+        )
+        if fields is not None:
+            return _projected_response(
+                {
+                    "ticker": request.ticker,
+                    "reference_timestamp": request.reference_timestamp,
+                    "lookback_hours": PRIOR_NEWS_LOOKBACK_HOURS,
+                    "articles": [partial_model(PriorNewsArticle, fields)(**row) for row in rows],
+                    "article_count": len(rows),
+                    "stale": stale,
+                }
+            )
+        articles = [PriorNewsArticle(**row) for row in rows]
 
         return PriorNewsResponse(
             ticker=request.ticker,
             reference_timestamp=request.reference_timestamp,
-            lookback_hours=48,
+            lookback_hours=PRIOR_NEWS_LOOKBACK_HOURS,
             articles=articles,
             article_count=len(articles),
+            stale=stale,
         )
+    except _deadline_errors():
+        logger.warning(
+            f"Deadline exceeded for prior-news-context: ticker={request.ticker}, "
+            f"ref_ts={request.reference_timestamp}"
+        )
+        raise HTTPException(status_code=504, detail="Deadline exceeded") from None
     except Exception as e:
         logger.error(
             f"Database error for prior-news-context: ticker={request.ticker}, "
@@ -49,23 +209,57 @@ async def prior_news_context(
 @router.post("/api/traded-news-context", response_model=TradedNewsResponse)
 async def traded_news_context(
     request: TradedNewsRequest,
-    db: DatabaseAdapter = Depends(get_db_adapter),
+    background_tasks: BackgroundTasks,
+    db: "DatabaseAdapter" = Depends(get_db_adapter),
+    cache: ContextCache = Depends(get_context_cache),
+    tracker: HotTickerTracker = Depends(get_hot_ticker_tracker),
+    deadline: Deadline = Depends(admit_context_request),
 ):
     """Return news articles that resulted in executed trades within 14 days before a reference timestamp."""
+    tracker.record(request.ticker)
+    lookback = timedelta(days=TRADED_NEWS_LOOKBACK_DAYS)
+    fields = tuple(request.fields) if request.fields else None
     try:
-        with db.read_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                cur.execute(TRADED_NEWS_QUERY, (request.ticker, request.reference_timestamp))
-                rows = cur.fetchall()
-                trades = [TradedNewsTrade(**dict(row)) for row in rows]
+        rows, stale = await run_in_threadpool(
+            _load_rows,
+            TRADED_NEWS,
+            fetch_traded_news,
+            db,
+            cache,
+            background_tasks,
+            request.ticker,
+            request.reference_timestamp,
+            lookback,
+            deadline,
+            fields,
+        )
+        if fields is not None:
+            return _projected_response(
+                {
+                    "ticker": request.ticker,
+                    "reference_timestamp": request.reference_timestamp,
+                    "lookback_days": TRADED_NEWS_LOOKBACK_DAYS,
+                    "trades": [partial_model(TradedNewsTrade, fields)(**row) for row in rows],
+                    "trade_count": len(rows),
+                    "stale": stale,
+                }
+            )
+        trades = [TradedNewsTrade(**row) for row in rows]
 
         return TradedNewsResponse(
             ticker=request.ticker,
             reference_timestamp=request.reference_timestamp,
-            lookback_days=14,
+            lookback_days=TRADED_NEWS_LOOKBACK_DAYS,
             trades=trades,
             trade_count=len(trades),
+            stale=stale,
+        )
+    except _deadline_errors():
+        logger.warning(
+            f"Deadline exceeded for traded-news-context: ticker={request.ticker}, "
+            f"ref_ts={request.reference_timestamp}"
         )
+        raise HTTPException(status_code=504, detail="Deadline exceeded") from None
     except Exception as e:
         logger.error(
             f"Database error for traded-news-context: ticker={request.ticker}, "
@@ -0,0 +1,53 @@
+"""Operator endpoints for inspecting a live worker."""
+import asyncio
+import os
+import secrets
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from loguru import logger
+
+from .. import config
+from ..profiler import collapsed_text, sample_stacks
+
+router = APIRouter(include_in_schema=False)
+
+_bearer = HTTPBearer(auto_error=False)
+# One profile per process at a time; overlapping samplers would double the overhead
+_profile_lock = asyncio.Lock()
+PROFILE_PID_HEADER = "X-Profile-Pid"
+
+
+def require_profiling_token(credentials: HTTPAuthorizationCredentials | None = Depends(_bearer)) -> None:
+    """Allow the request only when profiling is enabled and it carries PROFILING_TOKEN.
+
+    Answers 404 while disabled, so the endpoint is not discoverable.
+    """
+    if not config.PROFILING_ENABLED or not config.PROFILING_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), config.PROFILING_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid token", headers={"WWW-Authenticate": "Bearer"})
+
+
+@router.get("/debug/profile", response_class=PlainTextResponse, dependencies=[Depends(require_profiling_token)])
+async def profile(seconds: float = Query(default=10.0, gt=0)):
+    """Sample all threads for seconds and return collapsed stacks for a flamegraph.
+
+    The sampler runs in its own thread, so the event loop keeps serving and
+    its request handling, validation and encoding show up in the profile.
+
+    Only the worker process that receives the request is sampled; its pid is
+    returned in the X-Profile-Pid header. Behind a multi-worker server, repeat
+    the request until the workers of interest have each answered.
+    """
+    if seconds > config.PROFILE_MAX_SECONDS:
+        raise HTTPException(status_code=422, detail=f"seconds must be at most {config.PROFILE_MAX_SECONDS:g}")
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    async with _profile_lock:
+        logger.info(f"Profiling for {seconds:g}s at {config.PROFILE_SAMPLE_INTERVAL_MS}ms intervals")
+        counts = await asyncio.to_thread(sample_stacks, seconds, config.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+    return PlainTextResponse(collapsed_text(counts), headers={PROFILE_PID_HEADER: str(os.getpid())})
@@ -0,0 +1,157 @@
+"""Compact column-oriented storage for cached query rows."""
+import json
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from operator import neg
+from typing import Any
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Column codecs
+_OBJECTS = 0  # tuple of scalars; strings interned, Decimals as floats
+_STRINGS = 1  # tuple of tuples of interned strings, decoded back to lists
+_TIMES = 2  # array of epoch microseconds, decoded back to UTC datetimes
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+
+def _micros(ts: datetime) -> int:
+    return (ts - _EPOCH) // _MICROSECOND
+
+
+def _scalar(value: Any) -> Any:
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _codec(values: list) -> int:
+    if values and all(isinstance(value, datetime) for value in values):
+        return _TIMES
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, list) and all(isinstance(item, str) for item in value) for value in present):
+        return _STRINGS
+    return _OBJECTS
+
+
+def _intern(codec: int, values: tuple) -> tuple:
+    if codec == _STRINGS:
+        return tuple(None if value is None else tuple(map(sys.intern, value)) for value in values)
+    return tuple(_scalar(value) for value in values)
+
+
+def _is_descending(times: array) -> bool:
+    return all(times[i] >= times[i + 1] for i in range(len(times) - 1))
+
+
+class CompactRows:
+    """Rows of one query result held as one sequence per column.
+
+    Timestamps are stored as epoch microseconds, naive ones read as UTC,
+    string lists as tuples and every string is interned, so tags, channels and the titles of articles
+    held in overlapping windows are stored once per process. Decimals are
+    kept as floats, the type the response models expose. Rows are decoded
+    back to dicts only for the slice a lookup returns.
+
+    nbytes approximates the memory held; strings shared with other windows
+    are counted in each of them, so it overstates rather than understates.
+    """
+
+    __slots__ = ("columns", "codecs", "values", "descending", "nbytes")
+
+    def __init__(self, rows: list[dict]):
+        self.columns: tuple[str, ...] = tuple(rows[0]) if rows else ()
+        codecs = []
+        values = []
+        for column in self.columns:
+            raw = [row.get(column) for row in rows]
+            codec = _codec(raw)
+            if codec == _TIMES:
+                values.append(array("q", (_micros(_as_utc(ts)) for ts in raw)))
+            else:
+                values.append(_intern(codec, raw))
+            codecs.append(codec)
+        self.codecs = tuple(codecs)
+        self.values = tuple(values)
+        self.descending = tuple(
+            codec == _TIMES and _is_descending(column) for codec, column in zip(codecs, values, strict=True)
+        )
+        self.nbytes = self._measure()
+
+    def _measure(self) -> int:
+        objects: dict[int, Any] = {}
+        total = sys.getsizeof(self) + sys.getsizeof(self.values)
+        for codec, column in zip(self.codecs, self.values, strict=True):
+            total += sys.getsizeof(column)
+            if codec == _TIMES:
+                continue
+            for value in column:
+                if value is None or isinstance(value, bool):
+                    continue
+                objects[id(value)] = value
+                if codec == _STRINGS:
+                    objects.update((id(item), item) for item in value)
+        # Objects referenced from several rows, like interned tags, are counted once
+        return total + sum(map(sys.getsizeof, objects.values()))
+
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+
+    def to_json(self) -> bytes:
+        """Serialize as JSON, for stores other processes can write to; see from_json."""
+        return json.dumps(
+            [self.columns, self.codecs, [list(column) for column in self.values], self.descending, self.nbytes],
+            separators=(",", ":"),
+        ).encode()
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "CompactRows":
+        """Rebuild rows serialized by to_json, interning their strings in this process."""
+        columns, codecs, values, descending, nbytes = json.loads(data)
+        rows = cls.__new__(cls)
+        rows.columns = tuple(columns)
+        rows.codecs = tuple(codecs)
+        rows.values = tuple(
+            array("q", column) if codec == _TIMES else _intern(codec, column)
+            for codec, column in zip(codecs, values, strict=True)
+        )
+        rows.descending = tuple(descending)
+        rows.nbytes = nbytes
+        return rows
+
+    def between(self, column: str, start: datetime, end: datetime) -> list[dict]:
+        """Decode the rows whose column value lies in [start, end), in stored order.
+
+        Results ordered newest first, as the context queries return them, are
+        sliced by binary search; any other order falls back to a scan.
+        """
+        if not self.columns:
+            return []
+        index = self.columns.index(column)
+        values = self.values[index]
+        if self.codecs[index] != _TIMES:
+            return self._decode([i for i, ts in enumerate(values) if start <= ts < end])
+        lo, hi = _micros(start), _micros(end)
+        if self.descending[index]:
+            # key=neg views the newest-first array as ascending
+            return self._decode(range(bisect_right(values, -hi, key=neg), bisect_right(values, -lo, key=neg)))
+        return self._decode([i for i, ts in enumerate(values) if lo <= ts < hi])
+
+    def _decode(self, positions: range | list[int]) -> list[dict]:
+        decoded = []
+        for codec, column in zip(self.codecs, self.values, strict=True):
+            if codec == _TIMES:
+                decoded.append([_EPOCH + timedelta(microseconds=column[i]) for i in positions])
+            elif codec == _STRINGS:
+                decoded.append([None if column[i] is None else list(column[i]) for i in positions])
+            else:
+                decoded.append([column[i] for i in positions])
+        return [dict(zip(self.columns, row, strict=True)) for row in zip(*decoded, strict=True)]
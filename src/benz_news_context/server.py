@@ -0,0 +1,26 @@
+"""Production entry point: several uvicorn workers supervised by gunicorn.
+
+Requires the prod extra (gunicorn, uvicorn-worker). For local development
+with reload, use ``python -m benz_news_context`` instead.
+"""
+import sys
+
+# Modules the prod extra provides; see workers.py.
+_PROD_MODULES = {"gunicorn", "uvicorn_worker"}
+
+
+def main() -> None:
+    try:
+        from .workers import ContextServer
+    except ImportError as e:
+        if (e.name or "").split(".")[0] not in _PROD_MODULES:
+            raise
+        sys.exit(
+            f"benz-news-context needs the prod extra to serve ({e.name} is not installed): "
+            "uv sync --extra prod, or pip install 'benz-news-context[prod]'"
+        )
+    ContextServer().run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Context cache shared by all worker processes on a host, stored in SQLite on tmpfs."""
+import os
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+
+from .cache import MAX_WINDOWS_PER_TICKER, TIME_COLUMNS, ContextCache, _as_utc
+from .rows import CompactRows
+
+# Bumped when the stored row format changes; older files are emptied on open.
+FORMAT_VERSION = 3
+# A hit refreshes its ticker's LRU position at most this often, keeping reads mostly write-free.
+TOUCH_INTERVAL_SECONDS = 1.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS windows (
+    kind TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    fetched_at REAL NOT NULL,
+    rows BLOB NOT NULL,
+    nbytes INTEGER NOT NULL,
+    PRIMARY KEY (kind, ticker, start_ts, end_ts)
+);
+CREATE INDEX IF NOT EXISTS windows_fetched_at ON windows (fetched_at);
+CREATE TABLE IF NOT EXISTS tickers (
+    kind TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (kind, ticker)
+);
+CREATE INDEX IF NOT EXISTS tickers_last_used ON tickers (last_used);
+"""
+
+
+def _check_private(path: str, st: os.stat_result) -> None:
+    if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) & 0o077:
+        raise PermissionError(
+            f"Shared cache file {path} must be a regular file owned by uid {os.getuid()} with mode 0600"
+        )
+
+
+class SharedContextCache(ContextCache):
+    """ContextCache whose windows live in one SQLite database shared across processes.
+
+    Point path at tmpfs (e.g. /dev/shm) so the store is memory-backed: workers
+    on a host then hold one copy of each window and a result fetched by any
+    worker is a hit for all of them. SQLite's WAL locking serializes writers
+    and lets readers proceed concurrently. Windows are stored as CompactRows
+    serialized to JSON, so reading a window never runs code from the file.
+    Expired windows are purged on write, and tickers beyond max_tickers, or
+    beyond max_bytes of stored rows, are evicted least recently used first.
+    Bytes are the serialized size, which is what the tmpfs file holds.
+
+    Each process keeps the windows it has read decoded, keyed by row and
+    fetch time and bounded like an in-process cache, so a hit on a known
+    window reads two numbers from SQLite rather than decoding its rows.
+
+    The database and its WAL files must belong to this user and be closed to
+    everyone else; otherwise __init__ raises PermissionError. Store errors
+    degrade to cache misses rather than failing the request.
+    Background-refresh claims stay per process.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        max_tickers: int,
+        retain_seconds: float | None = None,
+        busy_timeout_ms: int = 100,
+        max_bytes: int | None = None,
+    ):
+        super().__init__(ttl_seconds, max_tickers, retain_seconds, max_bytes)
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._decoded: OrderedDict[tuple[int, float], CompactRows] = OrderedDict()
+        self._decoded_bytes = 0
+        # The mode applies only when this call creates the file, so check what is there either way
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+        try:
+            _check_private(path, os.fstat(fd))
+        finally:
+            os.close(fd)
+        for suffix in ("-wal", "-shm"):
+            try:
+                _check_private(path + suffix, os.lstat(path + suffix))
+            except FileNotFoundError:
+                pass
+        self._initialize()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            # Contents are disposable; skip fsync on tmpfs
+            conn.execute("PRAGMA synchronous=OFF")
+            self._local.conn = conn
+        return conn
+
+    def _initialize(self) -> None:
+        # Workers starting together contend here, so wait longer than on the request path
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != FORMAT_VERSION:
+                conn.execute("DROP TABLE IF EXISTS windows")
+                conn.execute("DROP TABLE IF EXISTS tickers")
+                conn.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute("COMMIT")
+        finally:
+            # Closing with the transaction still open rolls it back
+            conn.close()
+
+    def lookup(
+        self,
+        kind: str,
+        ticker: str,
+        reference_timestamp: datetime,
+        lookback: timedelta,
+        max_age: float,
+    ) -> tuple[list[dict], float] | None:
+        """Return (rows, age_seconds) from the newest covering window younger than max_age."""
+        end = _as_utc(reference_timestamp)
+        start = end - lookback
+        now = time.time()
+        try:
+            conn = self._connection()
+            found = conn.execute(
+                "SELECT rowid, fetched_at FROM windows"
+                " WHERE kind = ? AND ticker = ? AND start_ts <= ? AND end_ts >= ? AND fetched_at > ?"
+                " ORDER BY fetched_at DESC LIMIT 1",
+                (kind, ticker, start.timestamp(), end.timestamp(), now - max_age),
+            ).fetchone()
+            if found is None:
+                return None
+            rowid, fetched_at = found
+            rows = self._decoded_window(conn, rowid, fetched_at)
+            if rows is None:
+                return None
+        except Exception as e:
+            logger.warning(f"Shared cache read failed: kind={kind}, ticker={ticker}, error={type(e).__name__}")
+            return None
+        # Never wait for the write lock on a hit: if another worker holds it, the LRU position can wait
+        try:
+            conn.execute("PRAGMA busy_timeout = 0")
+            conn.execute(
+                "UPDATE tickers SET last_used = ? WHERE kind = ? AND ticker = ? AND last_used < ?",
+                (now, kind, ticker, now - TOUCH_INTERVAL_SECONDS),
+            )
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        return rows.between(TIME_COLUMNS[kind], start, end), now - fetched_at
+
+    def lookup_prefix(
+        self, kind: str, ticker: str, reference_timestamp: datetime, lookback: timedelta
+    ) -> tuple[list[dict], timedelta] | None:
+        """Return (rows, tail) from the fresh window reaching furthest into the lookback window."""
+        end = _as_utc(reference_timestamp)
+        start = end - lookback
+        try:
+            conn = self._connection()
+            found = conn.execute(
+                "SELECT rowid, fetched_at, end_ts FROM windows"
+                " WHERE kind = ? AND ticker = ? AND start_ts <= ? AND end_ts > ? AND end_ts < ? AND fetched_at > ?"
+                " ORDER BY end_ts DESC LIMIT 1",
+                (kind, ticker, start.timestamp(), start.timestamp(), end.timestamp(), time.time() - self.ttl_seconds),
+            ).fetchone()
+            if found is None:
+                return None
+            rowid, fetched_at, end_ts = found
+            rows = self._decoded_window(conn, rowid, fetched_at)
+            if rows is None:
+                return None
+        except Exception as e:
+            logger.warning(f"Shared cache read failed: kind={kind}, ticker={ticker}, error={type(e).__name__}")
+            return None
+        prefix_end = datetime.fromtimestamp(end_ts, timezone.utc)
+        return rows.between(TIME_COLUMNS[kind], start, prefix_end), end - prefix_end
+
+    def _decoded_window(self, conn: sqlite3.Connection, rowid: int, fetched_at: float) -> CompactRows | None:
+        # A window is never updated in place, so (rowid, fetched_at) names one version of it
+        key = (rowid, fetched_at)
+        with self._lock:
+            rows = self._decoded.get(key)
+            if rows is not None:
+                self._decoded.move_to_end(key)
+                return rows
+        found = conn.execute("SELECT rows FROM windows WHERE rowid = ? AND fetched_at = ?", key).fetchone()
+        if found is None:
+            # Replaced or evicted since the lookup
+            return None
+        rows = CompactRows.from_json(found[0])
+        self._remember(key, rows)
+        return rows
+
+    def _remember(self, key: tuple[int, float], rows: CompactRows) -> None:
+        with self._lock:
+            if key in self._decoded:
+                return
+            self._decoded[key] = rows
+            self._decoded_bytes += rows.nbytes
+            while len(self._decoded) > self.max_tickers * MAX_WINDOWS_PER_TICKER or (
+                self.max_bytes is not None and self._decoded_bytes > self.max_bytes and len(self._decoded) > 1
+            ):
+                _, evicted = self._decoded.popitem(last=False)
+                self._decoded_bytes -= evicted.nbytes
+
+    def put(
+        self, kind: str, ticker: str, reference_timestamp: datetime, lookback: timedelta, rows: list[dict]
+    ) -> None:
+        """Store the rows returned for [reference_timestamp - lookback, reference_timestamp)."""
+        end = _as_utc(reference_timestamp)
+        start_ts, end_ts = (end - lookback).timestamp(), end.timestamp()
+        now = time.time()
+        try:
+            compact = CompactRows(rows)
+            blob = compact.to_json()
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Shared cache cannot store rows: kind={kind}, ticker={ticker}, error={e}")
+            return
+        try:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM windows WHERE fetched_at <= ?", (now - self.retain_seconds,))
+                # Windows the new one covers are redundant
+                conn.execute(
+                    "DELETE FROM windows WHERE kind = ? AND ticker = ? AND start_ts >= ? AND end_ts <= ?",
+                    (kind, ticker, start_ts, end_ts),
+                )
+                rowid = conn.execute(
+                    "INSERT INTO windows (kind, ticker, start_ts, end_ts, fetched_at, rows, nbytes)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (kind, ticker, start_ts, end_ts, now, blob, len(blob)),
+                ).lastrowid
+                conn.execute(
+                    "DELETE FROM windows WHERE kind = ? AND ticker = ? AND rowid NOT IN ("
+                    " SELECT rowid FROM windows WHERE kind = ? AND ticker = ? ORDER BY fetched_at DESC LIMIT ?)",
+                    (kind, ticker, kind, ticker, MAX_WINDOWS_PER_TICKER),
+                )
+                conn.execute(
+                    "INSERT INTO tickers (kind, ticker, last_used) VALUES (?, ?, ?)"
+                    " ON CONFLICT (kind, ticker) DO UPDATE SET last_used = excluded.last_used",
+                    (kind, ticker, now),
+                )
+                self._evict(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache write failed: kind={kind}, ticker={ticker}, error={type(e).__name__}")
+            return
+        self._remember((rowid, now), compact)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        conn.execute(
+            "DELETE FROM tickers WHERE NOT EXISTS ("
+            " SELECT 1 FROM windows w WHERE w.kind = tickers.kind AND w.ticker = tickers.ticker)"
+        )
+        # Keep the most recently used tickers that fit both limits
+        evicted = conn.execute(
+            "SELECT kind, ticker FROM ("
+            " SELECT t.kind, t.ticker,"
+            "  ROW_NUMBER() OVER newest_first AS position,"
+            "  SUM(w.nbytes) OVER newest_first AS held"
+            " FROM tickers t JOIN ("
+            "  SELECT kind, ticker, SUM(nbytes) AS nbytes FROM windows GROUP BY kind, ticker"
+            " ) w USING (kind, ticker)"
+            " WINDOW newest_first AS (ORDER BY t.last_used DESC ROWS UNBOUNDED PRECEDING)"
+            # held > NULL is never true, so max_bytes=None leaves bytes unbounded
+            ") WHERE position > ? OR held > ?",
+            (self.max_tickers, self.max_bytes),
+        ).fetchall()
+        if not evicted:
+            return
+        conn.executemany("DELETE FROM windows WHERE kind = ? AND ticker = ?", evicted)
+        conn.executemany("DELETE FROM tickers WHERE kind = ? AND ticker = ?", evicted)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of serialized rows in the store; 0 when the store cannot be read."""
+        try:
+            return self._connection().execute("SELECT COALESCE(SUM(nbytes), 0) FROM windows").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache size read failed: error={type(e).__name__}")
+            return 0
+
+    def bytes_by_ticker(self) -> dict[str, int]:
+        """Bytes of serialized rows stored for each ticker, across query kinds; empty when unreadable."""
+        try:
+            return dict(
+                self._connection().execute("SELECT ticker, SUM(nbytes) FROM windows GROUP BY ticker").fetchall()
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache size read failed: error={type(e).__name__}")
+            return {}
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._decoded.clear()
+            self._decoded_bytes = 0
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM windows")
+        conn.execute("DELETE FROM tickers")
+        conn.execute("COMMIT")
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM tickers").fetchone()[0]
@@ -0,0 +1,60 @@
+"""Per-request trace IDs propagated from request headers into logs."""
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+
+from fastapi import Request
+from loguru import logger
+
+TRACE_ID_HEADER = "X-Request-ID"
+# W3C trace context, used when the caller sends no X-Request-ID
+TRACEPARENT_HEADER = "traceparent"
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-[0-9a-f]{16}-[0-9a-f]{2}$")
+# Caller-supplied IDs are echoed into logs and headers, so keep them short and plain
+_VALID_TRACE_ID = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+_trace_id: ContextVar[str | None] = ContextVar("trace_id", default=None)
+
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
+    "trace_id={extra[trace_id]} | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+
+
+def current_trace_id() -> str | None:
+    """Trace ID of the request being handled, if any; propagates into threadpool work."""
+    return _trace_id.get()
+
+
+def trace_id_from_headers(request: Request) -> str:
+    """Take the caller's X-Request-ID or traceparent trace ID, or mint a new one."""
+    trace_id = request.headers.get(TRACE_ID_HEADER)
+    if trace_id and _VALID_TRACE_ID.match(trace_id):
+        return trace_id
+    match = _TRACEPARENT.match(request.headers.get(TRACEPARENT_HEADER, ""))
+    if match:
+        return match.group(1)
+    return uuid.uuid4().hex
+
+
+async def trace_id_middleware(request: Request, call_next):
+    """Bind the request's trace ID to logs and echo it in the response."""
+    trace_id = trace_id_from_headers(request)
+    token = _trace_id.set(trace_id)
+    try:
+        with logger.contextualize(trace_id=trace_id):
+            response = await call_next(request)
+    finally:
+        _trace_id.reset(token)
+    response.headers[TRACE_ID_HEADER] = trace_id
+    return response
+
+
+def configure_logging(level: str) -> None:
+    """Log to stderr at level, including the trace ID on every line."""
+    logger.remove()
+    logger.configure(extra={"trace_id": "-"})
+    logger.add(sys.stderr, level=level, format=LOG_FORMAT)
@@ -0,0 +1,50 @@
+"""Gunicorn application running several uvicorn workers; see server.main.
+
+Requires the prod extra (gunicorn, uvicorn-worker).
+"""
+from gunicorn.app.base import BaseApplication
+from uvicorn_worker import UvicornWorker
+
+from . import config
+
+
+class ContextWorker(UvicornWorker):
+    """Uvicorn worker on uvloop with the httptools HTTP parser."""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
+
+
+def gunicorn_options() -> dict:
+    """Gunicorn settings built from config."""
+    return {
+        "bind": f"{config.SERVER_HOST}:{config.SERVER_PORT}",
+        "workers": config.WEB_CONCURRENCY,
+        "worker_class": ContextWorker,
+        # Import the app once in the master so a broken build fails before forking
+        "preload_app": True,
+        "backlog": config.SERVER_BACKLOG,
+        "keepalive": config.SERVER_KEEPALIVE_SECONDS,
+        "max_requests": config.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": config.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": config.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        "timeout": config.SERVER_WORKER_TIMEOUT_SECONDS,
+        "loglevel": config.LOG_LEVEL.lower(),
+        "accesslog": "-",
+    }
+
+
+class ContextServer(BaseApplication):
+    """Gunicorn application serving benz_news_context.app:app."""
+
+    def __init__(self, options: dict | None = None):
+        self.options = gunicorn_options() if options is None else options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from .app import app
+
+        return app
@@ -5,6 +5,24 @@ from unittest.mock import MagicMock
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_context_cache():
+    """Give every test fresh process-wide caches, trackers and monitors."""
+    from benz_news_context.dependencies import (
+        get_admission_controller,
+        get_context_cache,
+        get_health_monitor,
+        get_hot_ticker_tracker,
+    )
+
+    providers = (get_context_cache, get_hot_ticker_tracker, get_admission_controller, get_health_monitor)
+    for provider in providers:
+        provider.cache_clear()
+    yield
+    for provider in providers:
+        provider.cache_clear()
+
+
 @pytest.fixture
 def mock_database_adapter():
     """Mock DatabaseAdapter for testing without database connection."""
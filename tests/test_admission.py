@@ -0,0 +1,79 @@
+"""Tests for admission control and request deadlines."""
+import asyncio
+import time
+
+import pytest
+
+
+def test_controller_admits_up_to_max_concurrent():
+    """Test that requests are admitted immediately while slots are free."""
+    from benz_news_context.admission import AdmissionController
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=2, max_queue=0)
+        assert await controller.acquire(timeout=0)
+        assert await controller.acquire(timeout=0)
+        assert controller.in_flight == 2
+        # Full, and no queue to wait in
+        assert not await controller.acquire(timeout=1)
+        controller.release()
+        assert await controller.acquire(timeout=0)
+
+    asyncio.run(scenario())
+
+
+def test_controller_queued_request_gets_released_slot():
+    """Test that a waiting request is admitted when a slot is released."""
+    from benz_news_context.admission import AdmissionController
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1)
+        assert await controller.acquire(timeout=0)
+        waiter = asyncio.create_task(controller.acquire(timeout=1))
+        await asyncio.sleep(0)
+        assert controller.waiting == 1
+        # The queue is full, so a third request is rejected immediately
+        assert not await controller.acquire(timeout=1)
+        controller.release()
+        assert await waiter
+        assert controller.waiting == 0
+
+    asyncio.run(scenario())
+
+
+def test_controller_rejects_after_wait_timeout():
+    """Test that a queued request gives up after its timeout."""
+    from benz_news_context.admission import AdmissionController
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=1, max_queue=1)
+        assert await controller.acquire(timeout=0)
+        assert not await controller.acquire(timeout=0.01)
+        assert controller.waiting == 0
+
+    asyncio.run(scenario())
+
+
+def test_deadline_derives_statement_timeout_from_remaining_budget():
+    """Test that statement_timeout is the remaining budget less the margin."""
+    from benz_news_context.admission import Deadline
+
+    deadline = Deadline(expires_at=time.monotonic() + 1.0)
+
+    assert 900 < deadline.statement_timeout_ms(margin_ms=50, default_ms=0) <= 950
+
+
+def test_deadline_without_budget_uses_default_timeout():
+    """Test that unbounded requests fall back to the default statement_timeout."""
+    from benz_news_context.admission import Deadline
+
+    assert Deadline().statement_timeout_ms(margin_ms=50, default_ms=0) is None
+    assert Deadline().statement_timeout_ms(margin_ms=50, default_ms=5000) == 5000
+
+
+def test_deadline_raises_when_budget_is_spent():
+    """Test that an expired deadline raises DeadlineExceeded."""
+    from benz_news_context.admission import Deadline, DeadlineExceeded
+
+    with pytest.raises(DeadlineExceeded):
+        Deadline(expires_at=time.monotonic() + 0.01).statement_timeout_ms(margin_ms=50, default_ms=0)
@@ -96,6 +96,120 @@ def test_health_endpoint_handles_database_error(mock_database_adapter):
     app.dependency_overrides.clear()
 
 
+def test_livez_returns_200_without_database(mock_database_adapter):
+    """Test that the liveness probe never touches the database."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.get("/livez")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "alive"
+    mock_database_adapter.read_connection.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_readyz_serves_last_probe_result_from_memory(mock_database_adapter):
+    """Test that readiness follows the background probe without querying the database."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter, get_health_monitor
+
+    def unavailable():
+        raise ConnectionError("database stack not configured")
+
+    # /readyz must not create the adapter itself
+    app.dependency_overrides[get_db_adapter] = unavailable
+
+    client = TestClient(app)
+    assert client.get("/readyz").status_code == 503
+
+    get_health_monitor().probe(mock_database_adapter)
+    mock_database_adapter.read_connection.reset_mock()
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["database"]["probe_latency_ms"] is not None
+    assert data["saturation"]["in_flight"] == 0
+    mock_database_adapter.read_connection.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_readyz_reports_replica_pools_of_the_resolved_router(mock_database_adapter):
+    """Test that /readyz reports pool usage for the router the background work resolved."""
+    from benz_news_context.app import app
+    from benz_news_context.replicas import ReadEndpoint, ReplicaRouter
+
+    router = ReplicaRouter([ReadEndpoint("replica-0", MagicMock(maxconn=4))])
+    app.state.db = router
+    try:
+        response = TestClient(app).get("/readyz")
+    finally:
+        del app.state.db
+
+    assert response.json()["saturation"]["replicas"] == [{"name": "replica-0", "in_use": 0, "max": 4, "ejected": False}]
+
+
+def test_lifespan_starts_background_health_probe(mock_database_adapter):
+    """Test that the app probes the database in the background once started."""
+    import time
+
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    with TestClient(app) as client:
+        deadline = time.monotonic() + 5
+        while client.get("/readyz").status_code != 200 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.get("/readyz").status_code == 200
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_background_work_retries_database_adapter_creation(mock_database_adapter, monkeypatch):
+    """Test that a failure to create the adapter is retried instead of leaving the service never ready."""
+    import asyncio
+
+    from benz_news_context import app as app_module
+    from benz_news_context import config
+    from benz_news_context.dependencies import get_db_adapter
+
+    attempts = []
+
+    def flaky_adapter():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("database is starting up")
+        return mock_database_adapter
+
+    started = []
+
+    async def fake_loop(db, *args, **kwargs):
+        started.append(db)
+
+    monkeypatch.setattr(config, "DATABASE_CONNECT_RETRY_SECONDS", 0.001)
+    monkeypatch.setattr(app_module, "run_health_probe_loop", fake_loop)
+    monkeypatch.setattr(app_module, "run_prewarm_loop", fake_loop)
+    fake_app = FastAPI()
+    fake_app.dependency_overrides[get_db_adapter] = flaky_adapter
+
+    asyncio.run(app_module._run_background_work(fake_app, MagicMock(), MagicMock()))
+
+    assert len(attempts) == 3
+    assert started == [mock_database_adapter, mock_database_adapter]
+
+
 # Prior News Context Endpoint Tests
 
 
@@ -259,6 +373,369 @@ def test_prior_news_endpoint_uses_48_hour_lookback(mock_database_adapter):
     app.dependency_overrides.clear()
 
 
+def test_prior_news_endpoint_serves_repeat_requests_from_cache(mock_database_adapter):
+    """Test that a repeated prior-news-context request does not query the database again."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = []
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    for _ in range(2):
+        response = client.post(
+            "/api/prior-news-context",
+            json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+        )
+        assert response.status_code == 200
+
+    cursor.execute.assert_called_once()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_fetches_only_the_tail_past_a_cached_window(mock_database_adapter):
+    """Test that a window ending before the reference is served with only its tail queried."""
+    from datetime import datetime, timedelta, timezone
+
+    from benz_news_context.app import app
+    from benz_news_context.cache import PRIOR_NEWS
+    from benz_news_context.dependencies import get_db_adapter
+
+    def article(id, published_utc):
+        return {
+            "id": id,
+            "title": id,
+            "published_utc": published_utc,
+            "channels": [],
+            "tags": [],
+            "sentiment": None,
+            "sentiment_score": None,
+            "was_traded": False,
+            "trade_side": None,
+        }
+
+    # A prewarmed window ending at 17:00 with a request at 17:05
+    _seed_context_cache(
+        PRIOR_NEWS, "AVGO", timedelta(hours=49), [article("cached", datetime(2026, 1, 21, 9, tzinfo=timezone.utc))], 0
+    )
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = [article("tail", datetime(2026, 1, 21, 17, 2, tzinfo=timezone.utc))]
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:05:00Z"},
+    )
+
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()["articles"]] == ["tail", "cached"]
+    cursor.execute.assert_called_once()
+    assert cursor.execute.call_args.args[1]["p3"] == timedelta(minutes=5)
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_cache_memory_reports_bytes_per_ticker(mock_database_adapter):
+    """Test that /cache/memory reports bytes held per cached ticker."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = []
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    client.post("/api/prior-news-context", json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"})
+    response = client.get("/cache/memory")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body["tickers"]) == ["AVGO"]
+    assert body["bytes"] == body["tickers"]["AVGO"] > 0
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_selects_only_requested_fields(mock_database_adapter):
+    """Test that fields narrows the SELECT list and the articles, and the partial rows are not cached."""
+    from datetime import datetime, timezone
+
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_context_cache, get_db_adapter
+
+    published = datetime(2026, 1, 20, 14, 30, 0, tzinfo=timezone.utc)
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = [{"id": "uuid-1234", "published_utc": published}]
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={
+            "ticker": "AVGO",
+            "reference_timestamp": "2026-01-21T17:00:00Z",
+            "fields": ["published_utc", "id"],
+        },
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["articles"] == [{"id": "uuid-1234", "published_utc": "2026-01-20T14:30:00Z"}]
+    assert data["article_count"] == 1
+    query = cursor.execute.call_args.args[0]
+    assert "na.channels" not in query
+    assert "trade_side" not in query
+    assert "trading_decisions" not in query
+    assert len(get_context_cache()) == 0
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_projects_fields_from_cached_rows(mock_database_adapter):
+    """Test that a fields request is served from complete cached rows without querying."""
+    from datetime import datetime, timedelta, timezone
+
+    from benz_news_context.app import app
+    from benz_news_context.cache import PRIOR_NEWS
+    from benz_news_context.dependencies import get_db_adapter
+
+    row = {
+        "id": "uuid-1234",
+        "title": "Cached",
+        "published_utc": datetime(2026, 1, 21, 16, 0, 0, tzinfo=timezone.utc),
+        "channels": [],
+        "tags": [],
+        "sentiment": None,
+        "sentiment_score": None,
+        "was_traded": True,
+        "trade_side": "buy",
+    }
+    _seed_context_cache(PRIOR_NEWS, "AVGO", timedelta(hours=48), [row], age_seconds=0)
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z", "fields": ["id", "was_traded"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["articles"] == [{"id": "uuid-1234", "was_traded": True}]
+    cursor.execute.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_context_endpoints_reject_unknown_fields(mock_database_adapter):
+    """Test that fields outside the allow-list are rejected with 422."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    for path, fields in (
+        ("/api/prior-news-context", ["id", "na.title; DROP TABLE news_articles"]),
+        ("/api/traded-news-context", ["channels"]),
+        ("/api/traded-news-context", []),
+    ):
+        response = client.post(
+            path, json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z", "fields": fields}
+        )
+        assert response.status_code == 422
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def _seed_context_cache(kind, ticker, lookback, rows, age_seconds):
+    """Store rows in the app's context cache as if fetched age_seconds ago."""
+    import time
+    from datetime import datetime, timezone
+    from unittest.mock import patch
+
+    from benz_news_context.dependencies import get_context_cache
+
+    reference = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+    with patch("benz_news_context.cache.time.time", return_value=time.time() - age_seconds):
+        get_context_cache().put(kind, ticker, reference, lookback, rows)
+
+
+def test_prior_news_endpoint_serves_stale_result_on_database_error(mock_database_adapter):
+    """Test that prior-news-context serves the last known good result instead of a 500."""
+    from datetime import datetime, timedelta, timezone
+
+    from benz_news_context.app import app
+    from benz_news_context.cache import PRIOR_NEWS
+    from benz_news_context.dependencies import get_db_adapter
+
+    row = {
+        "id": "uuid-1234",
+        "title": "First Article",
+        "published_utc": datetime(2026, 1, 20, 14, 30, 0, tzinfo=timezone.utc),
+        "channels": ["technology"],
+        "tags": ["earnings"],
+        "sentiment": "bullish",
+        "sentiment_score": 0.85,
+        "was_traded": True,
+        "trade_side": "buy",
+    }
+    _seed_context_cache(PRIOR_NEWS, "AVGO", timedelta(hours=48), [row], age_seconds=300)
+    mock_database_adapter.read_connection.side_effect = Exception("Database error")
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["stale"] is True
+    assert data["article_count"] == 1
+    assert data["articles"][0]["id"] == "uuid-1234"
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_serves_stale_result_and_revalidates(mock_database_adapter):
+    """Test that a recently expired result is served stale and refreshed in the background."""
+    from datetime import timedelta
+
+    from benz_news_context.app import app
+    from benz_news_context.cache import PRIOR_NEWS
+    from benz_news_context.dependencies import get_db_adapter
+
+    _seed_context_cache(PRIOR_NEWS, "AVGO", timedelta(hours=48), [], age_seconds=75)
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = []
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    payload = {"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"}
+    first = client.post("/api/prior-news-context", json=payload)
+    second = client.post("/api/prior-news-context", json=payload)
+
+    assert first.status_code == 200
+    assert first.json()["stale"] is True
+    # The background refresh ran once and the next request is served fresh
+    cursor.execute.assert_called_once()
+    assert second.json()["stale"] is False
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_sheds_load_when_queue_is_full(mock_database_adapter):
+    """Test that prior-news-context returns 503 with Retry-After when admission is refused."""
+    from benz_news_context.admission import AdmissionController
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_admission_controller, get_db_adapter
+
+    # Override dependencies with a controller that has no free slots or queue
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+    app.dependency_overrides[get_admission_controller] = lambda: AdmissionController(
+        max_concurrent=0, max_queue=0
+    )
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    mock_database_adapter.read_connection.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_sets_statement_timeout_from_deadline(mock_database_adapter):
+    """Test that the deadline header bounds the query with a statement_timeout."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.return_value = []
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+        headers={"X-Deadline-Ms": "2000"},
+    )
+
+    assert response.status_code == 200
+    assert cursor.execute.call_count == 2
+    sql, params = cursor.execute.call_args_list[0].args
+    assert sql.startswith("SET LOCAL statement_timeout")
+    assert 0 < params[0] <= 1950
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_prior_news_endpoint_returns_504_when_deadline_is_spent(mock_database_adapter):
+    """Test that a request whose deadline has no budget left fails fast without querying."""
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+        headers={"X-Deadline-Ms": "0"},
+    )
+
+    assert response.status_code == 504
+    mock_database_adapter.read_connection.assert_not_called()
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
 # Traded News Context Endpoint Tests
 
 
@@ -396,6 +873,34 @@ def test_traded_news_endpoint_handles_database_error(mock_database_adapter):
     app.dependency_overrides.clear()
 
 
+def test_traded_news_endpoint_serves_stale_result_on_database_error(mock_database_adapter):
+    """Test that traded-news-context serves the last known good result instead of a 500."""
+    from datetime import timedelta
+
+    from benz_news_context.app import app
+    from benz_news_context.cache import TRADED_NEWS
+    from benz_news_context.dependencies import get_db_adapter
+
+    _seed_context_cache(TRADED_NEWS, "AVGO", timedelta(days=14), [], age_seconds=300)
+    mock_database_adapter.read_connection.side_effect = Exception("Database error")
+
+    # Override dependency
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/traded-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["stale"] is True
+    assert response.json()["trade_count"] == 0
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
 def test_traded_news_endpoint_uses_14_day_lookback(mock_database_adapter):
     """Test that traded-news-context uses correct lookback window."""
     from benz_news_context.app import app
@@ -0,0 +1,172 @@
+"""Tests for the in-process context cache."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+LOOKBACK = timedelta(hours=48)
+
+
+def _article(published_utc):
+    return {"id": published_utc.isoformat(), "published_utc": published_utc}
+
+
+def test_cache_returns_none_on_miss():
+    """Test that an empty cache misses."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_hits_for_same_window():
+    """Test that a stored window is returned for the same reference timestamp."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    rows = [_article(REFERENCE - timedelta(hours=1))]
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == rows
+    assert cache.get(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_slices_rows_from_covering_window():
+    """Test that a wide window serves narrower lookups filtered to their range."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    inside = _article(REFERENCE - timedelta(hours=2))
+    too_new = _article(REFERENCE + timedelta(minutes=1))
+    too_old = _article(REFERENCE - timedelta(hours=49))
+    cache.put(
+        PRIOR_NEWS,
+        "AVGO",
+        REFERENCE + timedelta(minutes=5),
+        LOOKBACK + timedelta(minutes=10),
+        [too_new, inside, too_old],
+    )
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == [inside]
+    # A reference past the end of the window is not covered
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE + timedelta(minutes=6), LOOKBACK) is None
+
+
+def test_cache_returns_prefix_of_window_ending_before_reference():
+    """Test that a fresh window ending early yields its rows and the tail left to fetch."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    inside = _article(REFERENCE - timedelta(hours=2))
+    too_old = _article(REFERENCE - timedelta(hours=49))
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE - timedelta(minutes=10), LOOKBACK + timedelta(hours=1), [inside, too_old])
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE - timedelta(minutes=30), LOOKBACK + timedelta(hours=1), [inside, too_old])
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+    assert cache.lookup_prefix(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == ([inside], timedelta(minutes=10))
+    # A window that starts too late, or has expired, is no prefix
+    assert cache.lookup_prefix(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK + timedelta(hours=2)) is None
+    with patch("benz_news_context.cache.time.time", return_value=REFERENCE.timestamp() + 10**9):
+        assert cache.lookup_prefix(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_expires_entries_after_ttl():
+    """Test that entries older than the TTL miss."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    with patch("benz_news_context.cache.time.time", return_value=1000.0):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    with patch("benz_news_context.cache.time.time", return_value=1061.0):
+        assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_evicts_least_recently_used_ticker():
+    """Test that the cache holds at most max_tickers tickers."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=2)
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    cache.put(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK, [])
+    cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK)
+    cache.put(PRIOR_NEWS, "AAPL", REFERENCE, LOOKBACK, [])
+
+    assert len(cache) == 2
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == []
+    assert cache.get(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_treats_naive_timestamps_as_utc():
+    """Test that naive reference timestamps are compared as UTC."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    rows = [_article(REFERENCE - timedelta(hours=1))]
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE.replace(tzinfo=None), LOOKBACK) == rows
+
+
+def test_cache_lookup_returns_expired_rows_within_retention():
+    """Test that lookup() serves windows past the TTL but within max_age and retention."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10, retain_seconds=600)
+    with patch("benz_news_context.cache.time.time", return_value=1000.0):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    with patch("benz_news_context.cache.time.time", return_value=1100.0):
+        assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+        assert cache.lookup(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, max_age=120) == ([], 100.0)
+        assert cache.lookup(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, max_age=90) is None
+
+
+def test_cache_allows_one_refresh_per_key():
+    """Test that claim_refresh() deduplicates concurrent background refreshes."""
+    from benz_news_context.cache import ContextCache
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    key = ("prior_news", "AVGO", REFERENCE, LOOKBACK)
+
+    assert cache.claim_refresh(key) is True
+    assert cache.claim_refresh(key) is False
+    cache.release_refresh(key)
+    assert cache.claim_refresh(key) is True
+
+
+def test_cache_evicts_least_recently_used_ticker_over_max_bytes():
+    """Test that tickers are evicted once cached rows exceed max_bytes, and bytes are reported per ticker."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    rows = [_article(REFERENCE - timedelta(minutes=i)) for i in range(1, 50)]
+    unbounded = ContextCache(ttl_seconds=60, max_tickers=10)
+    unbounded.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+    per_ticker = unbounded.nbytes
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10, max_bytes=per_ticker * 2)
+    for ticker in ("AVGO", "NVDA", "AAPL"):
+        cache.put(PRIOR_NEWS, ticker, REFERENCE, LOOKBACK, rows)
+
+    assert cache.bytes_by_ticker() == {"NVDA": per_ticker, "AAPL": per_ticker}
+    assert cache.nbytes == per_ticker * 2
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+
+
+def test_cache_drops_expired_windows_and_their_bytes():
+    """Test that windows past retention stop counting against max_bytes once any put runs."""
+    from benz_news_context.cache import PRIOR_NEWS, ContextCache
+
+    rows = [_article(REFERENCE - timedelta(minutes=i)) for i in range(1, 50)]
+    cache = ContextCache(ttl_seconds=60, max_tickers=10, retain_seconds=600)
+    with patch("benz_news_context.cache.time.time", return_value=1000.0):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+        cache.put(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK, rows)
+    per_ticker = cache.bytes_by_ticker()["AVGO"]
+    with patch("benz_news_context.cache.time.time", return_value=1500.0):
+        cache.put(PRIOR_NEWS, "NVDA", REFERENCE - timedelta(days=3), LOOKBACK, rows)
+    with patch("benz_news_context.cache.time.time", return_value=1700.0):
+        cache.put(PRIOR_NEWS, "AAPL", REFERENCE, LOOKBACK, [])
+
+    held = cache.bytes_by_ticker()
+    assert set(held) == {"NVDA", "AAPL"}
+    assert held["NVDA"] == per_ticker  # the older NVDA window expired
+    assert cache.nbytes == sum(held.values())
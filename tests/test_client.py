@@ -0,0 +1,220 @@
+"""Tests for the async context API client."""
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+
+ARTICLE = {
+    "id": "uuid-1234",
+    "title": "First Article",
+    "published_utc": datetime(2026, 1, 20, 14, 30, 0, tzinfo=timezone.utc),
+    "channels": ["technology"],
+    "tags": ["earnings"],
+    "sentiment": "bullish",
+    "sentiment_score": 0.85,
+    "was_traded": True,
+    "trade_side": "buy",
+}
+
+
+def _prior_news_body(ticker):
+    return {
+        "ticker": ticker,
+        "reference_timestamp": REFERENCE.isoformat(),
+        "lookback_hours": 48,
+        "articles": [],
+        "article_count": 0,
+        "stale": False,
+    }
+
+
+def test_client_parses_responses_from_the_app(mock_database_adapter):
+    """Test that the client returns response models for full and fields-limited requests."""
+    from benz_news_context.app import app
+    from benz_news_context.client import ContextClient
+    from benz_news_context.dependencies import get_db_adapter
+    from benz_news_context.models import PriorNewsResponse
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.side_effect = [[ARTICLE], [{"id": ARTICLE["id"], "published_utc": ARTICLE["published_utc"]}]]
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    async def scenario():
+        async with ContextClient("http://test", transport=httpx.ASGITransport(app=app)) as client:
+            full = await client.get_prior_news("AVGO", REFERENCE)
+            partial = await client.get_prior_news("NVDA", REFERENCE, fields=["id", "published_utc"])
+        return full, partial
+
+    full, partial = asyncio.run(scenario())
+
+    assert isinstance(full, PriorNewsResponse)
+    assert full.articles[0].published_utc == ARTICLE["published_utc"]
+    assert full.articles[0].trade_side == "buy"
+    assert list(partial.articles[0].model_dump()) == ["id", "published_utc"]
+
+    # Clean up
+    app.dependency_overrides.clear()
+
+
+def test_get_prior_news_many_bounds_concurrency_and_keeps_order():
+    """Test that at most max_concurrency requests are in flight and results follow request order."""
+    from benz_news_context.client import ContextClient
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=_prior_news_body(json.loads(request.content)["ticker"]))
+
+    tickers = [f"T{i}" for i in range(8)]
+
+    async def scenario():
+        async with ContextClient("http://test", max_concurrency=3, transport=httpx.MockTransport(handler)) as client:
+            return await client.get_prior_news_many([(ticker, REFERENCE) for ticker in tickers])
+
+    responses = asyncio.run(scenario())
+
+    assert [response.ticker for response in responses] == tickers
+    assert peak == 3
+
+
+def test_client_retries_overload_after_retry_after():
+    """Test that a 503 is retried after the server's Retry-After and the remaining deadline is sent."""
+    from benz_news_context.client import ContextClient
+
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "1"}, json={"detail": "Service overloaded"})
+        return httpx.Response(200, json=_prior_news_body("AVGO"))
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    async def scenario():
+        client = ContextClient("http://test", deadline_ms=5000, transport=httpx.MockTransport(handler))
+        with patch("benz_news_context.client.asyncio.sleep", fake_sleep):
+            response = await client.get_prior_news("AVGO", REFERENCE)
+        await client.aclose()
+        return response
+
+    response = asyncio.run(scenario())
+
+    assert response.ticker == "AVGO"
+    assert sleeps == [1.0]
+    assert len(calls) == 2
+    assert 0 < int(calls[1].headers["X-Deadline-Ms"]) <= 5000
+
+
+def test_client_gives_up_after_retries_and_within_deadline():
+    """Test that retries stop after the retry budget, or when the wait would pass the deadline."""
+    from benz_news_context.client import ContextClient
+
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, headers={"Retry-After": "0"})
+
+    async def scenario(**kwargs):
+        async with ContextClient("http://test", transport=httpx.MockTransport(handler), **kwargs) as client:
+            return await client.get_prior_news_many([("AVGO", REFERENCE)], return_exceptions=True)
+
+    [error] = asyncio.run(scenario(retries=2))
+    assert isinstance(error, httpx.HTTPStatusError)
+    assert calls == 3
+
+    calls = 0
+    with patch("benz_news_context.client._retry_after_seconds", return_value=10.0):
+        [error] = asyncio.run(scenario(retries=2, deadline_ms=1000))
+    assert error.response.status_code == 503
+    assert calls == 1
+
+
+def test_client_does_not_retry_deadline_exceeded():
+    """Test that a 504 is raised without retrying."""
+    from benz_news_context.client import ContextClient
+
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(504, json={"detail": "Deadline exceeded"})
+
+    async def scenario():
+        async with ContextClient("http://test", transport=httpx.MockTransport(handler)) as client:
+            await client.get_traded_news("AVGO", REFERENCE)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scenario())
+    assert calls == 1
+
+
+def test_client_bounds_each_attempt_by_the_remaining_deadline():
+    """Test that an attempt's timeout is the smaller of the remaining deadline and timeout_seconds."""
+    from benz_news_context.client import ContextClient
+
+    timeouts = []
+
+    async def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json=_prior_news_body("AVGO"))
+
+    async def scenario(**kwargs):
+        async with ContextClient("http://test", transport=httpx.MockTransport(handler), **kwargs) as client:
+            await client.get_prior_news("AVGO", REFERENCE)
+
+    asyncio.run(scenario(timeout_seconds=5.0, deadline_ms=200))
+    asyncio.run(scenario(timeout_seconds=0.1, deadline_ms=5000))
+    asyncio.run(scenario(timeout_seconds=5.0))
+
+    assert 0 < timeouts[0] <= 0.2
+    assert timeouts[1:] == [0.1, 5.0]
+
+
+def test_client_waits_for_retries_without_holding_a_slot():
+    """Test that a retry's wait releases its concurrency slot, and Retry-After is clamped without a deadline."""
+    from benz_news_context.client import ContextClient
+
+    async def handler(request):
+        return httpx.Response(503, headers={"Retry-After": "3600"})
+
+    slot_held = []
+    sleeps = []
+
+    async def scenario():
+        async with ContextClient(
+            "http://test", max_concurrency=1, retries=1, max_backoff_seconds=2.0, transport=httpx.MockTransport(handler)
+        ) as client:
+
+            async def fake_sleep(delay):
+                slot_held.append(client._semaphore.locked())
+                sleeps.append(delay)
+
+            with patch("benz_news_context.client.asyncio.sleep", fake_sleep):
+                return await client.get_prior_news_many([("AVGO", REFERENCE)], return_exceptions=True)
+
+    [error] = asyncio.run(scenario())
+
+    assert isinstance(error, httpx.HTTPStatusError)
+    assert slot_held == [False]
+    assert sleeps == [2.0]
@@ -0,0 +1,101 @@
+"""Tests for background health probing."""
+import asyncio
+from unittest.mock import patch
+
+
+def test_monitor_is_not_ready_before_first_probe():
+    """Test that readiness requires at least one successful probe."""
+    from benz_news_context.health import HealthMonitor
+
+    monitor = HealthMonitor(max_probe_age_seconds=15, probe_timeout_ms=1000)
+
+    assert monitor.is_ready() is False
+    assert monitor.snapshot()["last_probe_at"] is None
+
+
+def test_monitor_records_successful_probe(mock_database_adapter):
+    """Test that a successful probe records latency and marks the service ready."""
+    from benz_news_context.health import HealthMonitor
+
+    monitor = HealthMonitor(max_probe_age_seconds=15, probe_timeout_ms=1000)
+
+    assert monitor.probe(mock_database_adapter) is True
+    assert monitor.is_ready() is True
+    snapshot = monitor.snapshot()
+    assert snapshot["probe_latency_ms"] is not None
+    assert snapshot["consecutive_failures"] == 0
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    assert cursor.execute.call_args_list[0].args == ("SET LOCAL statement_timeout = %s", (1000,))
+    assert cursor.execute.call_args_list[1].args == ("SELECT 1",)
+
+
+def test_monitor_records_failed_probes_and_is_not_ready_after_several(mock_database_adapter):
+    """Test that failed probes keep the error type and readiness is lost only after N in a row."""
+    from benz_news_context.health import HealthMonitor
+
+    monitor = HealthMonitor(max_probe_age_seconds=15, probe_timeout_ms=1000, failures_before_not_ready=3)
+    monitor.probe(mock_database_adapter)
+    mock_database_adapter.read_connection.side_effect = ConnectionError("refused")
+
+    assert monitor.probe(mock_database_adapter) is False
+    assert monitor.is_ready() is True
+    assert monitor.snapshot()["last_error"] == "ConnectionError"
+    assert monitor.snapshot()["consecutive_failures"] == 1
+
+    monitor.probe(mock_database_adapter)
+    monitor.probe(mock_database_adapter)
+    assert monitor.is_ready() is False
+
+
+def test_monitor_probes_every_replica_endpoint():
+    """Test that each endpoint is probed, and one failing endpoint does not fail the probe."""
+    from unittest.mock import MagicMock
+
+    from benz_news_context.health import HealthMonitor
+    from benz_news_context.replicas import ReadEndpoint, ReplicaRouter
+
+    up, down = ReadEndpoint("up", MagicMock()), ReadEndpoint("down", MagicMock())
+    down.pool.getconn.return_value.cursor.return_value.__enter__.return_value.execute.side_effect = OSError("reset")
+    router = ReplicaRouter([up, down])
+    monitor = HealthMonitor(max_probe_age_seconds=15, probe_timeout_ms=1000, failures_before_not_ready=1)
+
+    assert monitor.probe(router) is True
+    assert monitor.is_ready() is True
+    assert monitor.snapshot()["failing_endpoints"] == ["down"]
+    assert up.pool.getconn.call_count == down.pool.getconn.call_count == 1
+
+    up.pool.getconn.side_effect = OSError("refused")
+    assert monitor.probe(router) is False
+    assert monitor.is_ready() is False
+    assert monitor.snapshot()["failing_endpoints"] == ["down", "up"]
+
+
+def test_monitor_is_not_ready_when_last_success_is_too_old(mock_database_adapter):
+    """Test that a stalled probe loop eventually reports not ready."""
+    from benz_news_context.health import HealthMonitor
+
+    monitor = HealthMonitor(max_probe_age_seconds=15, probe_timeout_ms=1000)
+    with patch("benz_news_context.health.time.time", return_value=1000.0):
+        monitor.probe(mock_database_adapter)
+    with patch("benz_news_context.health.time.time", return_value=1016.0):
+        assert monitor.is_ready() is False
+
+
+def test_pool_saturation_reports_admission_usage(mock_database_adapter):
+    """Test that saturation reflects in-flight admission slots."""
+    from benz_news_context.admission import AdmissionController
+    from benz_news_context.health import pool_saturation
+
+    async def scenario():
+        controller = AdmissionController(max_concurrent=4, max_queue=8)
+        await controller.acquire(timeout=0)
+        return pool_saturation(controller, mock_database_adapter)
+
+    saturation = asyncio.run(scenario())
+
+    assert saturation["in_flight"] == 1
+    assert saturation["utilization"] == 0.25
+    assert "replicas" not in saturation
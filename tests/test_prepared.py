@@ -0,0 +1,128 @@
+"""Tests for server-side prepared context statements."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+
+
+def _cursor(adapter):
+    return adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+
+def test_prepared_statement_sql():
+    """Test PREPARE and EXECUTE text for a context statement."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+
+    assert PRIOR_NEWS_STATEMENT.prepare_sql.startswith(
+        "PREPARE prior_news_context(text, timestamptz, interval) AS\nSELECT"
+    )
+    assert not PRIOR_NEWS_STATEMENT.prepare_sql.endswith(";")
+    assert PRIOR_NEWS_STATEMENT.execute_sql == "EXECUTE prior_news_context(%s, %s, %s)"
+
+
+def test_field_statements_are_named_by_field_positions():
+    """Test that each field subset gets a distinct statement name from its column positions."""
+    from itertools import combinations
+
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT, _field_statement
+    from benz_news_context.db.queries import PRIOR_NEWS_COLUMNS, build_prior_news_query
+
+    def statement(fields):
+        return _field_statement(PRIOR_NEWS_STATEMENT, build_prior_news_query, tuple(PRIOR_NEWS_COLUMNS), fields)
+
+    columns = tuple(PRIOR_NEWS_COLUMNS)
+    subsets = [fields for size in range(1, len(columns) + 1) for fields in combinations(columns, size)]
+    names = {statement(fields).name for fields in subsets}
+
+    assert statement(None) is PRIOR_NEWS_STATEMENT
+    assert statement(("id", "published_utc")).name == "prior_news_context_5"
+    assert len(names) == len(subsets)
+
+
+def test_ensure_prepared_runs_once_per_connection():
+    """Test that a statement is prepared and the plan mode set only on first use of a connection."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT, TRADED_NEWS_STATEMENT
+    from benz_news_context.db.prepared import ensure_prepared
+
+    conn, cur = MagicMock(), MagicMock()
+
+    ensure_prepared(conn, cur, PRIOR_NEWS_STATEMENT, "force_generic_plan")
+    ensure_prepared(conn, cur, PRIOR_NEWS_STATEMENT, "force_generic_plan")
+    ensure_prepared(conn, cur, TRADED_NEWS_STATEMENT, "force_generic_plan")
+
+    statements = [c.args[0] for c in cur.execute.call_args_list]
+    assert statements[0].startswith("SELECT set_config('plan_cache_mode'")
+    assert cur.execute.call_args_list[0].args[1] == ("force_generic_plan",)
+    assert statements[1] == PRIOR_NEWS_STATEMENT.prepare_sql
+    assert statements[2] == TRADED_NEWS_STATEMENT.prepare_sql
+    assert len(statements) == 3
+    assert conn.commit.call_count == 2
+
+
+def test_fetch_executes_prepared_statement_when_enabled(mock_database_adapter):
+    """Test that fetches use EXECUTE by handle once the connection has prepared the query."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT, fetch_prior_news
+
+    cursor = _cursor(mock_database_adapter)
+    with patch("benz_news_context.config.PREPARED_STATEMENTS", True):
+        fetch_prior_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(hours=48))
+        cursor.execute.reset_mock()
+        fetch_prior_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(hours=48))
+
+    cursor.execute.assert_called_once_with(
+        PRIOR_NEWS_STATEMENT.execute_sql, ("AVGO", REFERENCE, timedelta(hours=48))
+    )
+
+
+def test_fetch_sends_query_text_when_disabled(mock_database_adapter):
+    """Test that fetches send the raw query when prepared statements are off."""
+    from benz_news_context.db.context import TRADED_NEWS_STATEMENT, fetch_traded_news
+
+    cursor = _cursor(mock_database_adapter)
+    with patch("benz_news_context.config.PREPARED_STATEMENTS", False):
+        fetch_traded_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(days=14))
+
+    cursor.execute.assert_called_once_with(
+        TRADED_NEWS_STATEMENT.text_sql, {"p1": "AVGO", "p2": REFERENCE, "p3": timedelta(days=14)}
+    )
+
+
+def test_text_sql_formats_with_psycopg2_parameters():
+    """Test that every context query's text form takes its parameters through psycopg2's %-formatting."""
+    from psycopg2.extensions import adapt
+
+    from benz_news_context.db.context import (
+        PRIOR_NEWS_STATEMENT,
+        TRADED_NEWS_PROJECTION_STATEMENT,
+        TRADED_NEWS_STATEMENT,
+    )
+
+    params = ("AVGO", REFERENCE, timedelta(days=14))
+    for statement in (PRIOR_NEWS_STATEMENT, TRADED_NEWS_STATEMENT, TRADED_NEWS_PROJECTION_STATEMENT):
+        # psycopg2 substitutes each quoted parameter with Python's % operator
+        quoted = {name: adapt(value).getquoted().decode() for name, value in statement.text_params(params).items()}
+        sql = statement.text_sql % quoted
+
+        assert "$" not in sql
+        assert "= 'AVGO'" in sql or "'AVGO' = ANY" in sql
+        assert "'2026-01-21T17:00:00+00:00'::timestamptz" in sql
+
+
+def test_fetch_reprepares_after_session_reset(mock_database_adapter):
+    """Test that a vanished prepared statement is prepared again and the query retried."""
+    from psycopg2.errors import InvalidSqlStatementName
+
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT, fetch_prior_news
+
+    conn = mock_database_adapter.read_connection.return_value.__enter__.return_value
+    cursor = _cursor(mock_database_adapter)
+    with patch("benz_news_context.config.PREPARED_STATEMENTS", True):
+        fetch_prior_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(hours=48))
+        cursor.execute.reset_mock()
+        cursor.execute.side_effect = [InvalidSqlStatementName("prepared statement does not exist"), None, None, None]
+        fetch_prior_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(hours=48))
+
+    conn.rollback.assert_called_once()
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert statements[2] == PRIOR_NEWS_STATEMENT.prepare_sql
+    assert statements[3] == PRIOR_NEWS_STATEMENT.execute_sql
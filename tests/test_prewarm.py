@@ -0,0 +1,123 @@
+"""Tests for hot-ticker tracking and cache prewarming."""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+
+def test_tracker_ranks_tickers_by_request_count(tmp_path):
+    """Test that hot() returns the most requested tickers first, capped at top_n."""
+    from benz_news_context.prewarm import HotTickerTracker
+
+    tracker = HotTickerTracker(path=str(tmp_path / "hot.json"), top_n=2)
+    for ticker in ["AVGO", "NVDA", "NVDA", "AAPL", "NVDA", "AVGO"]:
+        tracker.record(ticker)
+
+    assert tracker.hot() == ["NVDA", "AVGO"]
+
+
+def test_tracker_bounds_the_tickers_it_counts(tmp_path):
+    """Test that rarely requested tickers are dropped once too many have been seen."""
+    from benz_news_context.prewarm import HotTickerTracker
+
+    tracker = HotTickerTracker(path=str(tmp_path / "hot.json"), top_n=2, max_tracked=3)
+    for _ in range(3):
+        tracker.record("NVDA")
+    tracker.record("AVGO")
+    tracker.record("AVGO")
+    for i in range(100):
+        tracker.record(f"RARE{i}")
+
+    assert len(tracker._counts) <= 6
+    assert tracker.hot() == ["NVDA", "AVGO"]
+
+
+def test_tracker_save_uses_a_temporary_file_per_process(tmp_path):
+    """Test that workers sharing the hot ticker path do not share a temporary file."""
+    import os
+    from unittest.mock import patch
+
+    from benz_news_context.prewarm import HotTickerTracker
+
+    path = str(tmp_path / "hot.json")
+    tracker = HotTickerTracker(path=path, top_n=10)
+    tracker.record("AVGO")
+    with patch("benz_news_context.prewarm.os.replace", wraps=os.replace) as replace:
+        tracker.save()
+
+    replace.assert_called_once_with(f"{path}.{os.getpid()}.tmp", path)
+
+
+def test_tracker_persists_and_reloads_hot_set(tmp_path):
+    """Test that a saved hot set seeds a new tracker."""
+    from benz_news_context.prewarm import HotTickerTracker
+
+    path = str(tmp_path / "hot.json")
+    tracker = HotTickerTracker(path=path, top_n=10)
+    tracker.record("AVGO")
+    tracker.record("AVGO")
+    tracker.record("NVDA")
+    tracker.save()
+
+    with open(path) as f:
+        assert json.load(f)["tickers"] == {"AVGO": 2, "NVDA": 1}
+
+    reloaded = HotTickerTracker(path=path, top_n=10)
+    assert reloaded.load() == ["AVGO", "NVDA"]
+
+
+def test_tracker_ignores_missing_or_corrupt_file(tmp_path):
+    """Test that load() tolerates a missing or unreadable hot ticker file."""
+    from benz_news_context.prewarm import HotTickerTracker
+
+    path = tmp_path / "hot.json"
+    assert HotTickerTracker(path=str(path), top_n=10).load() == []
+
+    path.write_text("not json")
+    assert HotTickerTracker(path=str(path), top_n=10).load() == []
+
+
+def test_prewarm_fills_cache_up_to_fetch_time(mock_database_adapter):
+    """Test that prewarmed windows serve requests up to the fetch, and not past it."""
+    from benz_news_context.cache import PRIOR_NEWS, TRADED_NEWS, ContextCache
+    from benz_news_context.prewarm import prewarm_tickers
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    before = datetime.now(timezone.utc)
+
+    assert prewarm_tickers(mock_database_adapter, cache, ["AVGO", "NVDA"]) == 2
+
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    assert cursor.execute.call_count == 4
+    assert cache.get(PRIOR_NEWS, "AVGO", before, timedelta(hours=48)) == []
+    assert cache.get(TRADED_NEWS, "NVDA", before - timedelta(seconds=30), timedelta(days=14)) == []
+    # Articles published after the fetch are not in the window
+    assert cache.get(PRIOR_NEWS, "AVGO", datetime.now(timezone.utc) + timedelta(seconds=1), timedelta(hours=48)) is None
+
+
+def test_prewarm_skips_tickers_that_fail(mock_database_adapter):
+    """Test that a failing ticker does not abort the prewarm pass."""
+    from benz_news_context.cache import ContextCache
+    from benz_news_context.prewarm import prewarm_tickers
+
+    mock_database_adapter.read_connection.side_effect = Exception("Database error")
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+
+    assert prewarm_tickers(mock_database_adapter, cache, ["AVGO"]) == 0
+    assert len(cache) == 0
+
+
+def test_prewarm_loop_runs_once_and_saves_without_interval(mock_database_adapter, tmp_path):
+    """Test that a zero interval prewarms once at startup and persists the hot set."""
+    from benz_news_context.cache import ContextCache
+    from benz_news_context.prewarm import HotTickerTracker, run_prewarm_loop
+
+    cache = ContextCache(ttl_seconds=60, max_tickers=10)
+    tracker = HotTickerTracker(path=str(tmp_path / "hot.json"), top_n=10)
+    tracker.record("AVGO")
+
+    asyncio.run(run_prewarm_loop(mock_database_adapter, cache, tracker, 0, prewarm_on_startup=True))
+
+    assert len(cache) == 2  # prior-news and traded-news windows
+    assert (tmp_path / "hot.json").exists()
@@ -0,0 +1,71 @@
+"""Tests for the sampling profiler and the /debug/profile endpoint."""
+import os
+import threading
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+
+def _spin(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_sample_stacks_records_busy_threads_root_first():
+    """Test that a busy thread's stack is sampled with its thread name as the root frame."""
+    from benz_news_context.profiler import collapsed_text, sample_stacks
+
+    stop = threading.Event()
+    worker = threading.Thread(target=_spin, args=(stop,), name="spinner")
+    worker.start()
+    try:
+        counts = sample_stacks(0.1, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    spinner = [stack for stack in counts if stack.startswith("spinner;")]
+    assert spinner
+    assert any(stack.endswith("test_profiler:_spin") for stack in spinner)
+    assert not any("profiler:sample_stacks" in stack for stack in counts)
+    first = collapsed_text(counts).splitlines()[0]
+    stack, count = first.rsplit(" ", 1)
+    assert int(count) == max(counts.values())
+
+
+def test_profile_endpoint_is_hidden_when_disabled():
+    """Test that /debug/profile answers 404 unless profiling is enabled with a token."""
+    from benz_news_context.app import app
+
+    client = TestClient(app)
+    with patch("benz_news_context.config.PROFILING_ENABLED", False):
+        assert client.get("/debug/profile?seconds=0.05", headers={"Authorization": "Bearer s3cret"}).status_code == 404
+    with patch("benz_news_context.config.PROFILING_ENABLED", True), patch("benz_news_context.config.PROFILING_TOKEN", ""):
+        assert client.get("/debug/profile?seconds=0.05").status_code == 404
+    assert "/debug/profile" not in app.openapi()["paths"]
+
+
+def test_profile_endpoint_requires_the_token_and_returns_collapsed_stacks():
+    """Test that a valid bearer token gets collapsed stacks and a wrong or missing one gets 401."""
+    from benz_news_context.app import app
+
+    client = TestClient(app)
+    with patch("benz_news_context.config.PROFILING_ENABLED", True), patch(
+        "benz_news_context.config.PROFILING_TOKEN", "s3cret"
+    ):
+        assert client.get("/debug/profile?seconds=0.05").status_code == 401
+        assert client.get("/debug/profile?seconds=0.05", headers={"Authorization": "Bearer nope"}).status_code == 401
+        too_long = client.get("/debug/profile?seconds=3600", headers={"Authorization": "Bearer s3cret"})
+        assert too_long.status_code == 422
+
+        started = time.monotonic()
+        response = client.get("/debug/profile?seconds=0.1", headers={"Authorization": "Bearer s3cret"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["X-Profile-Pid"] == str(os.getpid())
+    assert time.monotonic() - started >= 0.1
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
@@ -56,3 +56,40 @@ def test_traded_news_query_parameters():
     # Check for PostgreSQL parameter placeholders
     assert "$1" in TRADED_NEWS_QUERY, "Missing $1 parameter (ticker)"
     assert "$2" in TRADED_NEWS_QUERY, "Missing $2 parameter (reference_timestamp)"
+
+
+def test_traded_news_projection_query_matches_traded_news_columns():
+    """Test that the projection query returns the same columns as TRADED_NEWS_QUERY."""
+    from benz_news_context.db.queries import TRADED_NEWS_PROJECTION_QUERY
+
+    for column in ["article_id", "title", "published_utc", "trade_executed_at", "side", "fill_price"]:
+        assert column in TRADED_NEWS_PROJECTION_QUERY.lower(), f"Missing column: {column}"
+    assert "traded_news_by_symbol" in TRADED_NEWS_PROJECTION_QUERY
+    assert "$3::interval" in TRADED_NEWS_PROJECTION_QUERY
+
+
+def test_prior_news_query_builder_skips_unrequested_columns_and_joins():
+    """Test that a reduced prior-news query drops the arrays, the trade_side subquery and unused joins."""
+    from benz_news_context.db.queries import build_prior_news_query
+
+    query = build_prior_news_query(["id", "published_utc", "was_traded"])
+
+    assert "was_traded" in query
+    assert "trading_decisions" in query
+    assert "na.tags" not in query
+    assert "order_submissions" not in query
+    assert "trading_decisions" not in build_prior_news_query(["id", "published_utc"])
+
+
+def test_field_allow_lists_match_response_models():
+    """Test that every selectable field is a response model field and vice versa."""
+    from benz_news_context.db.queries import (
+        PRIOR_NEWS_COLUMNS,
+        TRADED_NEWS_COLUMNS,
+        TRADED_NEWS_PROJECTION_COLUMNS,
+    )
+    from benz_news_context.models import PriorNewsArticle, TradedNewsTrade
+
+    assert list(PRIOR_NEWS_COLUMNS) == list(PriorNewsArticle.model_fields)
+    assert list(TRADED_NEWS_COLUMNS) == list(TradedNewsTrade.model_fields)
+    assert list(TRADED_NEWS_PROJECTION_COLUMNS) == list(TradedNewsTrade.model_fields)
@@ -0,0 +1,323 @@
+"""Tests for read-replica routing and hedged reads."""
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+# Two comma-separated DSNs, e.g. two local Postgres instances, enable the integration tests.
+REPLICA_URLS = [url for url in os.getenv("TEST_READ_REPLICA_URLS", "").split(",") if url]
+
+
+def _endpoint(name):
+    from benz_news_context.replicas import ReadEndpoint
+
+    pool = MagicMock()
+    conn = MagicMock(name=f"{name}-conn")
+    pool.getconn.return_value = conn
+    return ReadEndpoint(name, pool)
+
+
+def _attempt(endpoint):
+    from benz_news_context.replicas import _Attempt
+
+    return _Attempt(endpoint)
+
+
+def test_router_requires_an_endpoint():
+    """Test that a router cannot be built without endpoints."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    with pytest.raises(ValueError):
+        ReplicaRouter([])
+
+
+def test_read_connection_returns_connection_to_pool():
+    """Test that read_connection() checks a connection out and back in after a rollback."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    endpoint = _endpoint("a")
+    router = ReplicaRouter([endpoint])
+
+    with router.read_connection() as conn:
+        assert conn is endpoint.pool.getconn.return_value
+
+    conn.rollback.assert_called_once()
+    endpoint.pool.putconn.assert_called_once_with(conn, close=False)
+    assert endpoint.ewma_latency > 0
+
+
+def test_pool_stats_count_checked_out_connections():
+    """Test that connections in use are tracked by the router, not read from the pool."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    endpoint = _endpoint("a")
+    endpoint.pool.maxconn = 4
+    router = ReplicaRouter([endpoint])
+
+    with router.read_connection():
+        with router.read_connection():
+            assert router.pool_stats() == [{"name": "a", "in_use": 2, "max": 4, "ejected": False}]
+
+    assert router.pool_stats()[0]["in_use"] == 0
+
+
+def test_choose_prefers_faster_endpoint():
+    """Test that routing weight is inversely proportional to smoothed latency."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    fast, slow = _endpoint("fast"), _endpoint("slow")
+    fast.record_success(0.001)
+    slow.record_success(0.100)
+    router = ReplicaRouter([fast, slow])
+
+    picks = [router.choose() for _ in range(500)]
+
+    assert picks.count(fast) > 400
+
+
+def test_failing_endpoint_is_ejected():
+    """Test that an endpoint is skipped after consecutive failures."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    bad, good = _endpoint("bad"), _endpoint("good")
+    router = ReplicaRouter([bad, good], eject_after_failures=2, eject_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            with router._checkout(_attempt(bad)):
+                raise RuntimeError("connection reset")
+
+    assert bad.weight() == 0.0
+    assert all(router.choose() is good for _ in range(50))
+
+
+def test_query_errors_do_not_count_as_endpoint_failures():
+    """Test that statement timeouts and bad queries leave the endpoint in rotation."""
+    import psycopg2
+    from psycopg2.errors import QueryCanceled
+
+    from benz_news_context.replicas import ReplicaRouter
+
+    slow, other = _endpoint("slow"), _endpoint("other")
+    router = ReplicaRouter([slow, other], eject_after_failures=1, eject_seconds=60)
+
+    for error in (QueryCanceled("canceling statement due to statement timeout"), psycopg2.ProgrammingError("syntax")):
+        with pytest.raises(type(error)):
+            with router._checkout(_attempt(slow)):
+                raise error
+
+    assert slow.consecutive_failures == 0
+    assert slow.weight() > 0.0
+
+    with pytest.raises(psycopg2.OperationalError):
+        with router._checkout(_attempt(slow)):
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+
+    assert slow.weight() == 0.0
+
+
+def test_refused_connection_counts_as_endpoint_failure():
+    """Test that getconn() failing to connect ejects the endpoint like a failed query."""
+    import psycopg2
+
+    from benz_news_context.replicas import ReplicaRouter
+
+    down, up = _endpoint("down"), _endpoint("up")
+    down.pool.getconn.side_effect = psycopg2.OperationalError("connection refused")
+    router = ReplicaRouter([down, up], eject_after_failures=2, eject_seconds=60)
+
+    for _ in range(2):
+        with pytest.raises(psycopg2.OperationalError):
+            with router._checkout(_attempt(down)):
+                pass
+
+    assert down.weight() == 0.0
+    down.pool.putconn.assert_not_called()
+
+
+def test_exhausted_pool_falls_back_to_another_endpoint():
+    """Test that PoolError moves the read to another endpoint without penalizing the full one."""
+    from psycopg2.pool import PoolError
+
+    from benz_news_context.replicas import ReplicaRouter
+
+    full, spare = _endpoint("full"), _endpoint("spare")
+    full.pool.getconn.side_effect = PoolError("connection pool exhausted")
+    router = ReplicaRouter([full, spare])
+
+    with router._checkout(_attempt(full)) as conn:
+        assert conn is spare.pool.getconn.return_value
+
+    spare.pool.putconn.assert_called_once_with(conn, close=False)
+    assert full.consecutive_failures == 0
+
+    spare.pool.getconn.side_effect = PoolError("connection pool exhausted")
+    with pytest.raises(PoolError):
+        with router._checkout(_attempt(full)):
+            pass
+
+
+def test_all_ejected_endpoints_still_route():
+    """Test that reads fall back to the soonest-recovering endpoint when all are ejected."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    first, second = _endpoint("first"), _endpoint("second")
+    first.ejected_until = time.monotonic() + 10
+    second.ejected_until = time.monotonic() + 20
+
+    assert ReplicaRouter([first, second]).choose() is first
+
+
+def test_hedge_delay_uses_latency_percentile():
+    """Test that the hedge delay tracks the endpoint's p95 once enough samples exist."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    endpoint = _endpoint("a")
+    router = ReplicaRouter([endpoint, _endpoint("b")], hedge_enabled=True, hedge_min_delay_ms=5)
+    assert router.hedge_delay(endpoint) == 0.005
+
+    for i in range(100):
+        endpoint.record_success((i + 1) / 1000)
+
+    assert router.hedge_delay(endpoint) == pytest.approx(0.096)
+
+
+def test_hedged_read_takes_faster_endpoint_and_cancels_loser():
+    """Test that a slow primary is hedged to the other endpoint and cancelled."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    slow, fast = _endpoint("slow"), _endpoint("fast")
+    slow_conn = slow.pool.getconn.return_value
+    released = threading.Event()
+    slow_conn.cancel.side_effect = released.set
+    router = ReplicaRouter([slow, fast], hedge_enabled=True, hedge_min_delay_ms=10)
+    router.choose = lambda exclude=None: fast if exclude is slow else slow
+
+    def read(conn):
+        if conn is slow_conn:
+            released.wait(timeout=5)
+            raise RuntimeError("canceling statement due to user request")
+        return "fast result"
+
+    assert router.run_read(read) == "fast result"
+    assert released.wait(timeout=5)
+    # The cancelled loser is not counted against the slow endpoint's health
+    deadline = time.monotonic() + 5
+    while slow.pool.putconn.call_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert slow.consecutive_failures == 0
+
+
+def test_hedged_read_without_delay_uses_single_endpoint():
+    """Test that a read answering before the hedge delay issues no second request."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    first, second = _endpoint("first"), _endpoint("second")
+    router = ReplicaRouter([first, second], hedge_enabled=True, hedge_min_delay_ms=1000)
+    router.choose = lambda exclude=None: second if exclude is first else first
+
+    assert router.run_read(lambda conn: "result") == "result"
+    second.pool.getconn.assert_not_called()
+
+
+def test_hedge_delay_starts_when_the_attempt_runs():
+    """Test that time spent queued for a worker does not trigger a hedge."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    first, second = _endpoint("first"), _endpoint("second")
+    router = ReplicaRouter([first, second], hedge_enabled=True, hedge_min_delay_ms=50, hedge_max_workers=1)
+    router.choose = lambda exclude=None: second if exclude is first else first
+    router._executor.submit(time.sleep, 0.2)
+
+    assert router.run_read(lambda conn: "result") == "result"
+    second.pool.getconn.assert_not_called()
+
+
+def test_hedges_are_capped_to_a_share_of_reads():
+    """Test that hedges stop once the per-read budget is spent."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    slow, fast = _endpoint("slow"), _endpoint("fast")
+    slow_conn = slow.pool.getconn.return_value
+    router = ReplicaRouter([slow, fast], hedge_enabled=True, hedge_min_delay_ms=1, hedge_max_ratio=0.5)
+    router.choose = lambda exclude=None: fast if exclude is slow else slow
+    router._hedge_budget = 0.0
+
+    def read(conn):
+        if conn is slow_conn:
+            time.sleep(0.05)
+            return "slow result"
+        return "fast result"
+
+    assert [router.run_read(read) for _ in range(4)] == ["slow result", "fast result", "slow result", "fast result"]
+    assert fast.pool.getconn.call_count == 2
+
+
+def test_hedged_read_sees_the_callers_trace_id():
+    """Test that both attempts of a hedged read run with the request's trace ID."""
+    from benz_news_context.replicas import ReplicaRouter
+    from benz_news_context.tracing import _trace_id, current_trace_id
+
+    slow, fast = _endpoint("slow"), _endpoint("fast")
+    slow_conn = slow.pool.getconn.return_value
+    router = ReplicaRouter([slow, fast], hedge_enabled=True, hedge_min_delay_ms=1)
+    router.choose = lambda exclude=None: fast if exclude is slow else slow
+    seen = []
+
+    def read(conn):
+        seen.append(current_trace_id())
+        if conn is slow_conn:
+            time.sleep(0.05)
+        return "result"
+
+    token = _trace_id.set("trace-abc")
+    try:
+        assert router.run_read(read) == "result"
+    finally:
+        _trace_id.reset(token)
+
+    assert seen == ["trace-abc", "trace-abc"]
+
+
+@pytest.mark.skipif(len(REPLICA_URLS) < 2, reason="TEST_READ_REPLICA_URLS needs two DSNs")
+def test_router_reads_from_both_local_replicas():
+    """Test routing against two live Postgres instances."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    router = ReplicaRouter.from_dsns(REPLICA_URLS[:2], pool_max=2)
+    ports = set()
+    for endpoint in router.endpoints:
+        with router._checkout(_attempt(endpoint)) as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT inet_server_port()")
+                ports.add(cur.fetchone()[0])
+
+    assert len(ports) == 2
+
+
+@pytest.mark.skipif(len(REPLICA_URLS) < 2, reason="TEST_READ_REPLICA_URLS needs two DSNs")
+def test_hedged_read_against_local_replicas_beats_slow_query():
+    """Test that hedging against two live instances returns before a slow primary."""
+    from benz_news_context.replicas import ReplicaRouter
+
+    router = ReplicaRouter.from_dsns(REPLICA_URLS[:2], pool_max=2, hedge_enabled=True, hedge_min_delay_ms=50)
+    slow, fast = router.endpoints
+    router.choose = lambda exclude=None: fast if exclude is slow else slow
+
+    calls = []
+
+    def read(conn):
+        # The first (primary) attempt stalls server-side; the hedge does not
+        calls.append(conn)
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_sleep(%s), inet_server_port()", (5 if len(calls) == 1 else 0,))
+            return cur.fetchone()[1]
+
+    started = time.monotonic()
+    port = router.run_read(read)
+
+    assert time.monotonic() - started < 2
+    assert len(calls) == 2
+    assert port == calls[1].info.port
@@ -0,0 +1,111 @@
+"""Tests for compact cached row storage."""
+import sys
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+
+
+def _articles(count, start=REFERENCE):
+    return [
+        {
+            "id": f"a{i}",
+            "title": f"Headline {i}",
+            "published_utc": start - timedelta(minutes=15 * i),
+            "channels": ["News", "Movers"],
+            "tags": ["semiconductors"],
+            "sentiment": "positive",
+            "sentiment_score": 0.8,
+            "was_traded": i % 2 == 0,
+            "trade_side": None,
+        }
+        for i in range(count)
+    ]
+
+
+def test_compact_rows_round_trip_through_window_slices():
+    """Test that decoded rows equal the originals and are sliced to [start, end)."""
+    from benz_news_context.rows import CompactRows
+
+    rows = _articles(8)
+    compact = CompactRows(rows)
+
+    assert len(compact) == 8
+    assert compact.between("published_utc", REFERENCE - timedelta(days=1), REFERENCE + timedelta(seconds=1)) == rows
+    assert compact.between("published_utc", REFERENCE - timedelta(minutes=45), REFERENCE) == rows[1:4]
+    assert CompactRows([]).between("published_utc", REFERENCE - timedelta(days=1), REFERENCE) == []
+
+
+def test_compact_rows_normalize_offsets_and_decimals():
+    """Test that timestamps decode as the same instant in UTC and Decimals as floats."""
+    from benz_news_context.rows import CompactRows
+
+    eastern = timezone(timedelta(hours=-5))
+    executed = datetime(2026, 1, 21, 10, 30, 0, 123456, tzinfo=eastern)
+    [row] = CompactRows([{"trade_executed_at": executed, "fill_price": Decimal("101.25")}]).between(
+        "trade_executed_at", REFERENCE - timedelta(days=1), REFERENCE
+    )
+
+    assert row["trade_executed_at"] == executed
+    assert row["trade_executed_at"].tzinfo is timezone.utc
+    assert row["fill_price"] == 101.25 and isinstance(row["fill_price"], float)
+
+
+def test_compact_rows_read_naive_timestamps_as_utc():
+    """Test that a column mixing naive and aware timestamps is stored and sliced as UTC."""
+    from benz_news_context.rows import CompactRows
+
+    rows = _articles(3)
+    rows[1]["published_utc"] = rows[1]["published_utc"].replace(tzinfo=None)
+    sliced = CompactRows(rows).between("published_utc", REFERENCE - timedelta(minutes=20), REFERENCE)
+
+    assert [row["id"] for row in sliced] == ["a1"]
+    assert sliced[0]["published_utc"] == REFERENCE - timedelta(minutes=15)
+
+
+def test_compact_rows_scan_rows_not_newest_first():
+    """Test that rows in arbitrary order are filtered by scan, keeping their order."""
+    from benz_news_context.rows import CompactRows
+
+    rows = _articles(4)
+    shuffled = [rows[2], rows[0], rows[3], rows[1]]
+
+    assert CompactRows(shuffled).between("published_utc", REFERENCE - timedelta(minutes=30), REFERENCE) == [
+        rows[2],
+        rows[1],
+    ]
+
+
+def test_compact_rows_round_trip_through_json():
+    """Test that rows rebuilt from JSON decode to the same rows and slice the same way."""
+    from benz_news_context.rows import CompactRows
+
+    rows = _articles(8)
+    restored = CompactRows.from_json(CompactRows(rows).to_json())
+
+    assert restored.between("published_utc", REFERENCE - timedelta(minutes=45), REFERENCE) == rows[1:4]
+    assert restored.descending == CompactRows(rows).descending
+
+
+def test_compact_rows_share_interned_strings_across_windows_and_stores():
+    """Test that tags held by separate windows, including ones read back from JSON, are one object."""
+    from benz_news_context.rows import CompactRows
+
+    tag = "".join(["semi", "conductors"])
+    first = CompactRows([{"tags": [tag]}])
+    second = CompactRows.from_json(CompactRows([{"tags": ["semiconductors"]}]).to_json())
+
+    index = first.columns.index("tags")
+    assert first.values[index][0][0] is second.values[index][0][0]
+
+
+def test_compact_rows_hold_less_than_dict_rows():
+    """Test that nbytes is well under the size of the equivalent list of dicts."""
+    from benz_news_context.rows import CompactRows
+
+    rows = _articles(500)
+    dict_bytes = sys.getsizeof(rows) + sum(
+        sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values()) for row in rows
+    )
+
+    assert 0 < CompactRows(rows).nbytes < dict_bytes / 2
@@ -0,0 +1,255 @@
+"""Tests for the traded-news projection schema tooling."""
+import json
+import os
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# A scratch Postgres database enables the integration test; it works in a throwaway schema.
+DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+
+
+def test_install_backfills_under_lock_before_attaching_trigger():
+    """Test that install creates, locks, backfills and attaches the trigger in one transaction."""
+    from benz_news_context.db import schema
+
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    schema.install_traded_news_projection(conn)
+
+    statements = [c.args[0] for c in cursor.execute.call_args_list]
+    assert statements == [
+        schema.CREATE_TRADED_NEWS_PROJECTION,
+        "LOCK TABLE order_fills IN SHARE MODE",
+        schema.BACKFILL_TRADED_NEWS_PROJECTION,
+        schema.CREATE_TRADED_NEWS_PROJECTION_TRIGGER,
+    ]
+    conn.commit.assert_called_once()
+
+
+def test_projection_is_indexed_and_maintained_for_entry_fills():
+    """Test that the projection DDL indexes (symbol, filled_at) and only projects entry legs."""
+    from benz_news_context.db import schema
+
+    assert "(symbol, filled_at)" in schema.CREATE_TRADED_NEWS_PROJECTION
+    assert "AFTER INSERT ON order_fills" in schema.CREATE_TRADED_NEWS_PROJECTION_TRIGGER
+    assert "NEW.order_leg = 'entry'" in schema.CREATE_TRADED_NEWS_PROJECTION_TRIGGER
+    assert "of.order_leg = 'entry'" in schema.BACKFILL_TRADED_NEWS_PROJECTION
+
+
+def test_fetch_traded_news_reads_projection_when_enabled(mock_database_adapter):
+    """Test that TRADED_NEWS_FROM_PROJECTION switches the traded-news query to the projection."""
+    from benz_news_context.db.context import (
+        TRADED_NEWS_PROJECTION_STATEMENT,
+        fetch_traded_news,
+    )
+
+    cursor = mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    with patch("benz_news_context.config.TRADED_NEWS_FROM_PROJECTION", True):
+        fetch_traded_news(mock_database_adapter, "AVGO", REFERENCE, timedelta(days=14))
+
+    cursor.execute.assert_called_once_with(
+        TRADED_NEWS_PROJECTION_STATEMENT.text_sql, {"p1": "AVGO", "p2": REFERENCE, "p3": timedelta(days=14)}
+    )
+
+
+def test_monthly_partitions_use_utc_month_bounds():
+    """Test that partitions cover whole UTC months across a year boundary."""
+    from datetime import date
+
+    from benz_news_context.db import schema
+
+    cur = MagicMock()
+    names = schema.create_monthly_partitions(cur, "news_articles_partitioned", "news_articles", date(2025, 12, 20), date(2026, 1, 5))
+
+    assert names == ["news_articles_p2025_12", "news_articles_p2026_01"]
+    assert cur.execute.call_args_list[1].args[0] == (
+        "CREATE TABLE IF NOT EXISTS news_articles_p2026_01 PARTITION OF news_articles_partitioned "
+        "FOR VALUES FROM ('2026-01-01 00:00:00+00') TO ('2026-02-01 00:00:00+00')"
+    )
+
+
+def test_convert_to_partitioned_copies_then_swaps_names():
+    """Test that conversion locks, copies into monthly partitions and swaps names in one transaction."""
+    from benz_news_context.db import schema
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.side_effect = [None, (REFERENCE - timedelta(days=40), REFERENCE)]
+    cur.fetchall.side_effect = [[], [("p", ["id"]), ("u", ["url", "published_utc"])], [("news_articles_id_seq", "id")]]
+
+    schema.convert_to_partitioned(conn, "news_articles", months_ahead=1)
+
+    statements = [c.args[0] for c in cur.execute.call_args_list]
+    assert statements[-2] == "ALTER SEQUENCE news_articles_id_seq OWNED BY news_articles.id"
+    assert "LOCK TABLE news_articles IN ACCESS EXCLUSIVE MODE" in statements
+    assert any(s.endswith("PARTITION BY RANGE (published_utc)") for s in statements)
+    assert "CREATE TABLE news_articles_default PARTITION OF news_articles_partitioned DEFAULT" in statements
+    assert statements.index("INSERT INTO news_articles_partitioned SELECT * FROM news_articles") < statements.index(
+        "ALTER TABLE news_articles_partitioned RENAME TO news_articles"
+    )
+    assert "CREATE INDEX ON news_articles_partitioned USING GIN (tickers)" in statements
+    assert any("INCLUDING CONSTRAINTS" in s for s in statements)
+    assert "ALTER TABLE news_articles_partitioned ADD PRIMARY KEY (id, published_utc)" in statements
+    assert "ALTER TABLE news_articles_partitioned ADD UNIQUE (url, published_utc)" in statements
+    conn.commit.assert_called_once()
+
+
+def test_convert_to_partitioned_refuses_referenced_tables():
+    """Test that conversion stops before locking when foreign keys point at the table."""
+    from benz_news_context.db import schema
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.return_value = None
+    cur.fetchall.return_value = [("order_submissions.order_submissions_article_id_fkey",)]
+
+    with pytest.raises(ValueError, match="order_submissions_article_id_fkey"):
+        schema.convert_to_partitioned(conn, "news_articles")
+
+    statements = [c.args[0] for c in cur.execute.call_args_list]
+    assert not any(statement.startswith("LOCK") for statement in statements)
+    conn.rollback.assert_called_once()
+    conn.commit.assert_not_called()
+
+
+def test_add_partitions_moves_rows_out_of_the_default_partition():
+    """Test that rows stranded in the default partition are moved while it is detached."""
+    from benz_news_context.db import schema
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    # news_articles: partitioned, has a default partition holding rows; order_fills: not partitioned
+    cur.fetchone.side_effect = [(1,), ("news_articles_default",), (True,), None]
+
+    names = schema.add_partitions(conn, months_ahead=1)
+
+    statements = [c.args[0] for c in cur.execute.call_args_list]
+    detach = statements.index("ALTER TABLE news_articles DETACH PARTITION news_articles_default")
+    attach = statements.index("ALTER TABLE news_articles ATTACH PARTITION news_articles_default DEFAULT")
+    moved = next(i for i, statement in enumerate(statements) if "DELETE FROM news_articles_default" in statement)
+    creates = [i for i, statement in enumerate(statements) if statement.startswith("CREATE TABLE IF NOT EXISTS")]
+    assert len(names) == len(creates) == 2
+    assert detach < min(creates) and max(creates) < moved < attach
+    conn.commit.assert_called_once()
+
+
+def test_context_queries_bound_partition_keys_by_parameters():
+    """Test that each time column is bounded on both sides so partitions can be pruned."""
+    from benz_news_context.db.queries import PRIOR_NEWS_QUERY, TRADED_NEWS_QUERY
+
+    assert "na.published_utc >= ($2::timestamptz - $3::interval)" in PRIOR_NEWS_QUERY
+    assert "na.published_utc < $2::timestamptz" in PRIOR_NEWS_QUERY
+    assert "of.filled_at >= ($2::timestamptz - $3::interval)" in TRADED_NEWS_QUERY
+    # Fills long after publication stay in the result, as in the projection
+    assert "na.published_utc >=" not in TRADED_NEWS_QUERY
+    assert "na.published_utc < $2::timestamptz" in TRADED_NEWS_QUERY
+
+
+@pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+def test_prior_news_query_prunes_partitions_against_live_database():
+    """Test that a 48h window on a partitioned news_articles scans a single partition."""
+    import psycopg2
+
+    from benz_news_context.db import schema
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+
+    conn = psycopg2.connect(DATABASE_URL)
+    name = f"test_partitions_{uuid.uuid4().hex[:8]}"
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA {name}")
+            cur.execute(f"SET search_path TO {name}")
+            cur.execute(
+                "CREATE TABLE news_articles (id text PRIMARY KEY, title text, published_utc timestamptz NOT NULL, "
+                "channels text[], tags text[], tickers text[])"
+            )
+            cur.execute("CREATE TABLE trading_decisions (article_id text, ticker text, sentiment text, confidence float, decision text)")
+            cur.execute("CREATE TABLE order_submissions (article_id text, ticker text, side text)")
+            cur.execute(
+                "INSERT INTO news_articles SELECT 'a' || i, 'title', %s - i * interval '1 day', '{}', '{}', '{AVGO}' "
+                "FROM generate_series(0, 120) i",
+                (REFERENCE,),
+            )
+        conn.commit()
+        schema.convert_to_partitioned(conn, "news_articles", months_ahead=1)
+        with conn.cursor() as cur:
+            cur.execute(PRIOR_NEWS_STATEMENT.prepare_sql)
+            cur.execute("SET plan_cache_mode = force_generic_plan")
+            cur.execute(
+                f"EXPLAIN (ANALYZE, FORMAT JSON) {PRIOR_NEWS_STATEMENT.execute_sql}",
+                ("AVGO", REFERENCE - timedelta(days=10), timedelta(hours=48)),
+            )
+            plan = json.dumps(cur.fetchone()[0])
+            cur.execute("SELECT contype FROM pg_constraint WHERE conrelid = 'news_articles'::regclass")
+            constraints = {contype for (contype,) in cur.fetchall()}
+
+        assert len(set(re.findall(r"news_articles_p\d{4}_\d{2}", plan))) == 1
+        assert "p" in constraints
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {name} CASCADE")
+        conn.commit()
+        conn.close()
+
+
+@pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+def test_projection_matches_join_against_live_database():
+    """Test that backfilled and trigger-maintained rows match TRADED_NEWS_QUERY."""
+    import psycopg2
+
+    from benz_news_context.db import schema
+    from benz_news_context.db.context import (
+        TRADED_NEWS_PROJECTION_STATEMENT,
+        TRADED_NEWS_STATEMENT,
+    )
+
+    conn = psycopg2.connect(DATABASE_URL)
+    name = f"test_projection_{uuid.uuid4().hex[:8]}"
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"CREATE SCHEMA {name}")
+            cur.execute(f"SET search_path TO {name}")
+            cur.execute("CREATE TABLE news_articles (id text PRIMARY KEY, title text, published_utc timestamptz)")
+            cur.execute(
+                "CREATE TABLE order_submissions (client_order_id text, article_id text, symbol text, side text)"
+            )
+            cur.execute(
+                "CREATE TABLE order_fills (client_order_id text, order_leg text, filled_at timestamptz, fill_price numeric)"
+            )
+            cur.execute(
+                "INSERT INTO news_articles VALUES ('a1', 'Old news', %s), ('a2', 'New news', %s)",
+                (REFERENCE - timedelta(days=3), REFERENCE - timedelta(hours=2)),
+            )
+            cur.execute("INSERT INTO order_submissions VALUES ('o1', 'a1', 'AVGO', 'buy'), ('o2', 'a2', 'AVGO', 'sell')")
+            cur.execute(
+                "INSERT INTO order_fills VALUES ('o1', 'entry', %s, 101.5), ('o1', 'exit', %s, 102)",
+                (REFERENCE - timedelta(days=3), REFERENCE - timedelta(days=2)),
+            )
+        schema.install_traded_news_projection(conn)
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO order_fills VALUES ('o2', 'entry', %s, 99.25)", (REFERENCE - timedelta(hours=1),)
+            )
+
+            results = []
+            for statement in (TRADED_NEWS_STATEMENT, TRADED_NEWS_PROJECTION_STATEMENT):
+                cur.execute(statement.prepare_sql)
+                cur.execute(statement.execute_sql, ("AVGO", REFERENCE, timedelta(days=14)))
+                results.append(cur.fetchall())
+
+        assert len(results[0]) == 2
+        assert results[0] == results[1]
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f"DROP SCHEMA IF EXISTS {name} CASCADE")
+        conn.commit()
+        conn.close()
@@ -0,0 +1,18 @@
+"""Tests for the production entry point."""
+import sys
+
+import pytest
+
+
+def test_main_explains_missing_prod_extra(monkeypatch):
+    """Test that the script exits with install instructions when gunicorn is missing."""
+    from benz_news_context import server
+
+    monkeypatch.delitem(sys.modules, "benz_news_context.workers", raising=False)
+    monkeypatch.setitem(sys.modules, "gunicorn.app.base", None)
+
+    with pytest.raises(SystemExit) as exc_info:
+        server.main()
+
+    assert "--extra prod" in str(exc_info.value.code)
+    assert "gunicorn" in str(exc_info.value.code)
@@ -0,0 +1,292 @@
+"""Tests for the cross-process shared context cache."""
+import os
+import stat
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+LOOKBACK = timedelta(hours=48)
+
+
+def _article(published_utc):
+    return {"id": published_utc.isoformat(), "published_utc": published_utc}
+
+
+def _cache(tmp_path, **kwargs):
+    from benz_news_context.shared_cache import SharedContextCache
+
+    kwargs.setdefault("ttl_seconds", 60)
+    kwargs.setdefault("max_tickers", 10)
+    return SharedContextCache(str(tmp_path / "cache.db"), **kwargs)
+
+
+def test_shared_cache_round_trips_and_slices_rows(tmp_path):
+    """Test that stored rows come back intact and sliced to the requested window."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    inside = _article(REFERENCE - timedelta(hours=2))
+    too_old = _article(REFERENCE - timedelta(hours=49))
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE + timedelta(minutes=5), LOOKBACK + timedelta(minutes=10), [inside, too_old])
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == [inside]
+    assert cache.get(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK) is None
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE + timedelta(minutes=6), LOOKBACK) is None
+
+
+def test_shared_cache_returns_prefix_of_window_ending_before_reference(tmp_path):
+    """Test that a stored window ending early yields its rows and the tail left to fetch."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    inside = _article(REFERENCE - timedelta(hours=2))
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE - timedelta(minutes=10), LOOKBACK + timedelta(hours=1), [inside])
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+    assert cache.lookup_prefix(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == ([inside], timedelta(minutes=10))
+    assert cache.lookup_prefix(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK + timedelta(hours=2)) is None
+
+
+def test_shared_cache_file_is_private(tmp_path):
+    """Test that the cache file is readable and writable by its owner only."""
+    _cache(tmp_path)
+
+    assert stat.S_IMODE(os.stat(tmp_path / "cache.db").st_mode) == 0o600
+
+
+def test_shared_cache_refuses_files_others_can_access(tmp_path):
+    """Test that an existing store others can write, or owned by someone else, is refused."""
+    import pytest
+
+    path = tmp_path / "cache.db"
+    path.touch()
+    path.chmod(0o666)
+    with pytest.raises(PermissionError):
+        _cache(tmp_path)
+
+    path.chmod(0o600)
+    (tmp_path / "cache.db-wal").touch(mode=0o644)
+    with pytest.raises(PermissionError):
+        _cache(tmp_path)
+
+    (tmp_path / "cache.db-wal").unlink()
+    with patch("benz_news_context.shared_cache.os.getuid", return_value=os.getuid() + 1):
+        with pytest.raises(PermissionError):
+            _cache(tmp_path)
+
+
+def test_shared_cache_stores_rows_as_json(tmp_path):
+    """Test that windows are stored as JSON, not in a format that runs code when read."""
+    import json
+    import sqlite3
+
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [_article(REFERENCE - timedelta(hours=1))])
+    with sqlite3.connect(tmp_path / "cache.db") as conn:
+        (blob,) = conn.execute("SELECT rows FROM windows").fetchone()
+
+    assert json.loads(blob)[0] == ["id", "published_utc"]
+
+
+def test_shared_cache_hit_does_not_wait_for_the_write_lock(tmp_path):
+    """Test that a hit skips its LRU touch instead of waiting while another worker writes."""
+    import sqlite3
+    import time
+
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path, busy_timeout_ms=2000)
+    with patch("benz_news_context.shared_cache.time.time", return_value=time.time() - 30):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    writer = sqlite3.connect(tmp_path / "cache.db", isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        started = time.monotonic()
+        assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == []
+        assert time.monotonic() - started < 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    assert cache._connection().execute("PRAGMA busy_timeout").fetchone()[0] == 2000
+
+
+def test_shared_cache_expires_and_retains_for_stale_serving(tmp_path):
+    """Test TTL expiry and lookup() of expired windows within retention."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path, retain_seconds=600)
+    with patch("benz_news_context.shared_cache.time.time", return_value=1000.0):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    with patch("benz_news_context.shared_cache.time.time", return_value=1100.0):
+        assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+        assert cache.lookup(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, max_age=120) == ([], 100.0)
+    with patch("benz_news_context.shared_cache.time.time", return_value=1700.0):
+        cache.put(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK, [])
+        assert cache.lookup(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, max_age=10_000) is None
+        assert len(cache) == 1
+
+
+def test_shared_cache_evicts_least_recently_used_ticker(tmp_path):
+    """Test that the store holds at most max_tickers tickers, evicting the least recently used."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path, max_tickers=2)
+    with patch("benz_news_context.shared_cache.time.time", return_value=1000.0):
+        cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+        cache.put(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK, [])
+    with patch("benz_news_context.shared_cache.time.time", return_value=1005.0):
+        cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK)
+        cache.put(PRIOR_NEWS, "AAPL", REFERENCE, LOOKBACK, [])
+
+        assert len(cache) == 2
+        assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == []
+        assert cache.get(PRIOR_NEWS, "NVDA", REFERENCE, LOOKBACK) is None
+
+
+def test_shared_cache_evicts_least_recently_used_ticker_over_max_bytes(tmp_path):
+    """Test that tickers are evicted once stored rows exceed max_bytes."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    rows = [_article(REFERENCE - timedelta(minutes=i)) for i in range(1, 50)]
+    cache = _cache(tmp_path)
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+    per_ticker = cache.nbytes
+    cache.clear()
+
+    cache.max_bytes = per_ticker * 2
+    for offset, ticker in enumerate(("AVGO", "NVDA", "AAPL")):
+        with patch("benz_news_context.shared_cache.time.time", return_value=1000.0 + offset):
+            cache.put(PRIOR_NEWS, ticker, REFERENCE, LOOKBACK, rows)
+
+    assert cache.bytes_by_ticker() == {"NVDA": per_ticker, "AAPL": per_ticker}
+
+
+def test_shared_cache_serves_rows_written_by_another_process(tmp_path):
+    """Test that a window stored by one process is a hit in another."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    writer = f"""
+from datetime import datetime, timedelta, timezone
+from benz_news_context.shared_cache import SharedContextCache
+reference = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+cache = SharedContextCache({str(tmp_path / "cache.db")!r}, ttl_seconds=60, max_tickers=10)
+cache.put("prior_news", "AVGO", reference, timedelta(hours=48), [{{"id": "a", "published_utc": reference - timedelta(hours=1)}}])
+"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(os.path.abspath(p) for p in sys.path if p))
+    subprocess.run([sys.executable, "-c", writer], env=env, check=True, timeout=30)
+
+    assert cache.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == [
+        {"id": "a", "published_utc": REFERENCE - timedelta(hours=1)}
+    ]
+
+
+def test_shared_cache_handles_concurrent_writers(tmp_path):
+    """Test that threads writing and reading at once all see their own windows."""
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path, max_tickers=100, busy_timeout_ms=5000)
+    errors = []
+
+    def work(i):
+        try:
+            for j in range(20):
+                ticker = f"T{i}-{j}"
+                cache.put(PRIOR_NEWS, ticker, REFERENCE, LOOKBACK, [_article(REFERENCE - timedelta(hours=1))])
+                assert cache.get(PRIOR_NEWS, ticker, REFERENCE, LOOKBACK) is not None
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(cache) == 80
+
+
+def test_shared_cache_decodes_each_window_once_per_process(tmp_path):
+    """Test that repeated hits reuse the decoded window until it is replaced."""
+    from benz_news_context.cache import PRIOR_NEWS
+    from benz_news_context.rows import CompactRows
+
+    writer = _cache(tmp_path)
+    reader = _cache(tmp_path)
+    rows = [_article(REFERENCE - timedelta(hours=1))]
+    writer.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, rows)
+
+    with patch("benz_news_context.shared_cache.CompactRows.from_json", wraps=CompactRows.from_json) as decode:
+        assert writer.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == rows
+        assert decode.call_count == 0
+        assert reader.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == rows
+        assert reader.get(PRIOR_NEWS, "AVGO", REFERENCE - timedelta(hours=2), timedelta(hours=1)) == []
+        assert decode.call_count == 1
+
+        newer = [_article(REFERENCE - timedelta(minutes=30))]
+        writer.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, newer)
+        assert reader.get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) == newer
+        assert decode.call_count == 2
+
+
+def test_shared_cache_read_errors_are_misses(tmp_path):
+    """Test that a corrupt entry is treated as a miss instead of failing the request."""
+    import sqlite3
+
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    with sqlite3.connect(tmp_path / "cache.db") as conn:
+        conn.execute("UPDATE windows SET rows = x'00'")
+
+    # A process that has not decoded the window yet reads the corrupt blob
+    assert _cache(tmp_path).get(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK) is None
+
+
+def test_shared_cache_size_read_errors_degrade(tmp_path):
+    """Test that byte reporting survives an unreadable store."""
+    import sqlite3
+
+    from benz_news_context.cache import PRIOR_NEWS
+
+    cache = _cache(tmp_path)
+    cache.put(PRIOR_NEWS, "AVGO", REFERENCE, LOOKBACK, [])
+    with sqlite3.connect(tmp_path / "cache.db") as conn:
+        conn.execute("DROP TABLE windows")
+
+    assert cache.nbytes == 0
+    assert cache.bytes_by_ticker() == {}
+
+
+def test_context_cache_dependency_uses_shared_store_when_configured(tmp_path, monkeypatch):
+    """Test that SHARED_CACHE_PATH switches the cache dependency to the shared store."""
+    from benz_news_context import config
+    from benz_news_context.dependencies import get_context_cache
+    from benz_news_context.shared_cache import SharedContextCache
+
+    monkeypatch.setattr(config, "SHARED_CACHE_PATH", str(tmp_path / "shared.db"))
+
+    assert isinstance(get_context_cache(), SharedContextCache)
+
+
+def test_context_cache_dependency_falls_back_when_shared_store_is_refused(tmp_path, monkeypatch):
+    """Test that a shared store others can write is not used."""
+    from benz_news_context import config
+    from benz_news_context.cache import ContextCache
+    from benz_news_context.dependencies import get_context_cache
+    from benz_news_context.shared_cache import SharedContextCache
+
+    path = tmp_path / "shared.db"
+    path.touch(mode=0o666)
+    path.chmod(0o666)
+    monkeypatch.setattr(config, "SHARED_CACHE_PATH", str(path))
+
+    cache = get_context_cache()
+    assert isinstance(cache, ContextCache) and not isinstance(cache, SharedContextCache)
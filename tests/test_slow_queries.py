@@ -0,0 +1,152 @@
+"""Tests for slow query capture."""
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+REFERENCE = datetime(2026, 1, 21, 17, 0, 0, tzinfo=timezone.utc)
+PARAMS = ("AVGO", REFERENCE, timedelta(hours=48))
+
+
+@pytest.fixture
+def slow_query_log(tmp_path, monkeypatch):
+    """Route slow query records to a temporary file and return its path."""
+    from benz_news_context.db import slow_queries
+
+    path = tmp_path / "slow.jsonl"
+    monkeypatch.setattr("benz_news_context.config.SLOW_QUERY_LOG_PATH", str(path))
+    monkeypatch.setattr(slow_queries, "_writer", None)
+    yield path
+    monkeypatch.setattr(slow_queries, "_writer", None)
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_fast_query_is_not_captured(slow_query_log, mock_database_adapter):
+    """Test that queries under the threshold write nothing."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+    from benz_news_context.db.slow_queries import capture
+
+    with patch("benz_news_context.config.SLOW_QUERY_THRESHOLD_MS", 250):
+        capture(mock_database_adapter, PRIOR_NEWS_STATEMENT, PARAMS, elapsed_ms=10)
+
+    assert not slow_query_log.exists()
+
+
+def test_slow_query_records_bound_parameters(slow_query_log, mock_database_adapter):
+    """Test that a slow query writes its parameters, timing and trace ID."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+    from benz_news_context.db.slow_queries import capture
+    from benz_news_context.tracing import _trace_id
+
+    token = _trace_id.set("trace-abc")
+    try:
+        with (
+            patch("benz_news_context.config.SLOW_QUERY_THRESHOLD_MS", 250),
+            patch("benz_news_context.config.SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0.0),
+        ):
+            capture(mock_database_adapter, PRIOR_NEWS_STATEMENT, PARAMS, elapsed_ms=400)
+    finally:
+        _trace_id.reset(token)
+
+    [record] = _records(slow_query_log)
+    assert record["query"] == "prior_news_context"
+    assert record["trace_id"] == "trace-abc"
+    assert record["elapsed_ms"] == 400
+    assert record["params"] == {
+        "ticker": "AVGO",
+        "reference_timestamp": "2026-01-21T17:00:00+00:00",
+        "lookback": "172800 seconds",
+    }
+    assert "plan" not in record
+    mock_database_adapter.read_connection.assert_not_called()
+
+
+def test_sampled_slow_query_records_explain_plan(slow_query_log, mock_database_adapter):
+    """Test that a sampled slow query is explained in the background and the plan recorded."""
+    from benz_news_context.db import slow_queries
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+
+    plan = [{"Plan": {"Node Type": "Index Scan"}}]
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchone.return_value = (plan,)
+    with (
+        patch("benz_news_context.config.SLOW_QUERY_THRESHOLD_MS", 250),
+        patch("benz_news_context.config.SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 1.0),
+    ):
+        slow_queries.capture(mock_database_adapter, PRIOR_NEWS_STATEMENT, PARAMS, elapsed_ms=400)
+        slow_queries._explain_executor.submit(lambda: None).result(timeout=5)
+
+    [record] = _records(slow_query_log)
+    assert record["plan"] == plan
+
+
+def test_explain_uses_scratch_statement_when_prepared_statements_are_off():
+    """Test that EXPLAIN runs through a temporary prepared statement that is deallocated."""
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+    from benz_news_context.db.slow_queries import explain
+
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.return_value = (["plan"],)
+
+    with patch("benz_news_context.config.PREPARED_STATEMENTS", False):
+        assert explain(conn, PRIOR_NEWS_STATEMENT, PARAMS) == ["plan"]
+
+    statements = [c.args[0] for c in cur.execute.call_args_list]
+    assert statements[0].startswith("PREPARE prior_news_context_explain_")
+    assert statements[2].startswith("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) EXECUTE prior_news_context_explain_")
+    assert cur.execute.call_args_list[2].args[1] == PARAMS
+    assert statements[3].startswith("DEALLOCATE prior_news_context_explain_")
+    # Rolled back after DEALLOCATE, so the connection is not left idle in transaction
+    assert [name for name, *_ in conn.mock_calls if name in ("rollback", "cursor().__enter__().execute")][-2:] == [
+        "cursor().__enter__().execute",
+        "rollback",
+    ]
+    conn.rollback.assert_called_once()
+
+
+def test_explain_rolls_back_a_failed_transaction_before_deallocating():
+    """Test that a failed EXPLAIN is rolled back first so DEALLOCATE can run, and again after it."""
+    from psycopg2.extensions import TRANSACTION_STATUS_INERROR
+
+    from benz_news_context.db.context import PRIOR_NEWS_STATEMENT
+    from benz_news_context.db.slow_queries import explain
+
+    conn = MagicMock()
+    conn.get_transaction_status.return_value = TRANSACTION_STATUS_INERROR
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.side_effect = RuntimeError("canceling statement due to statement timeout")
+
+    with patch("benz_news_context.config.PREPARED_STATEMENTS", False):
+        with pytest.raises(RuntimeError):
+            explain(conn, PRIOR_NEWS_STATEMENT, PARAMS)
+
+    calls = [name for name, *_ in conn.mock_calls if name in ("rollback", "cursor().__enter__().execute")]
+    assert calls[-3:] == ["rollback", "cursor().__enter__().execute", "rollback"]
+    assert cur.execute.call_args_list[-1].args[0].startswith("DEALLOCATE ")
+
+
+def test_workers_take_the_lowest_free_log_file(tmp_path, monkeypatch):
+    """Test that each worker claims its own numbered log file, reusing ones no live process holds."""
+    import fcntl
+    import os
+
+    from benz_news_context.db import slow_queries
+
+    monkeypatch.setattr(slow_queries, "_slot_lock", None)
+    template = str(tmp_path / "slow.{worker}.jsonl")
+    other_worker = os.open(tmp_path / "slow.0.jsonl.lock", os.O_RDWR | os.O_CREAT)
+    fcntl.flock(other_worker, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    try:
+        assert slow_queries._claim_log_path(template) == str(tmp_path / "slow.1.jsonl")
+    finally:
+        os.close(other_worker)
+    # The worker holding file 0 has exited; its replacement takes the file over
+    assert slow_queries._claim_log_path(template) == str(tmp_path / "slow.0.jsonl")
+    os.close(slow_queries._slot_lock)
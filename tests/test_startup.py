@@ -0,0 +1,36 @@
+"""Startup budget tests: app import time and time from process start to first 200."""
+import os
+import sys
+
+import pytest
+
+from benchmarks.bench_startup import measure_first_response, measure_import
+
+# Generous enough for a loaded CI runner; benchmarks/bench_startup.py reports actuals.
+IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "1500"))
+FIRST_RESPONSE_BUDGET_MS = float(os.getenv("STARTUP_FIRST_RESPONSE_BUDGET_MS", "3000"))
+
+
+@pytest.fixture
+def child_env(tmp_path):
+    """Environment for a fresh interpreter that imports the package the way this one does."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(os.path.abspath(p) for p in sys.path if p)
+    env["HOT_TICKERS_PATH"] = str(tmp_path / "hot_tickers.json")
+    env["SLOW_QUERY_LOG_PATH"] = str(tmp_path / "slow_queries.jsonl")
+    return env
+
+
+def test_app_import_is_within_budget_and_defers_database_stack(child_env, tmp_path):
+    """Test that importing the app stays under budget without loading benz_common or psycopg2."""
+    measured = measure_import(child_env, str(tmp_path))
+
+    assert measured["loaded"] == []
+    assert measured["import_ms"] < IMPORT_BUDGET_MS
+
+
+def test_first_response_is_within_budget(child_env, tmp_path):
+    """Test that a freshly started server answers /livez with 200 within budget."""
+    elapsed_ms = measure_first_response(child_env, str(tmp_path), timeout=3 * FIRST_RESPONSE_BUDGET_MS / 1000)
+
+    assert elapsed_ms < FIRST_RESPONSE_BUDGET_MS
@@ -0,0 +1,66 @@
+"""Tests for request trace ID propagation."""
+from fastapi.testclient import TestClient
+
+
+def test_response_echoes_incoming_request_id():
+    """Test that a caller's X-Request-ID is kept and returned."""
+    from benz_news_context.app import app
+
+    client = TestClient(app)
+    response = client.get("/livez", headers={"X-Request-ID": "detector-42"})
+
+    assert response.headers["X-Request-ID"] == "detector-42"
+
+
+def test_trace_id_taken_from_traceparent():
+    """Test that the W3C traceparent trace ID is used when X-Request-ID is absent."""
+    from benz_news_context.app import app
+
+    client = TestClient(app)
+    response = client.get(
+        "/livez",
+        headers={"traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"},
+    )
+
+    assert response.headers["X-Request-ID"] == "4bf92f3577b34da6a3ce929d0e0e4736"
+
+
+def test_trace_id_generated_when_missing_or_invalid():
+    """Test that a fresh trace ID replaces a missing or malformed header."""
+    from benz_news_context.app import app
+
+    client = TestClient(app)
+    generated = client.get("/livez").headers["X-Request-ID"]
+    replaced = client.get("/livez", headers={"X-Request-ID": "bad id\twith spaces"}).headers["X-Request-ID"]
+
+    assert len(generated) == 32
+    assert replaced != "bad id\twith spaces"
+
+
+def test_trace_id_reaches_threadpool_query_work(mock_database_adapter):
+    """Test that the trace ID is visible to database work run in the threadpool."""
+    from unittest.mock import patch
+
+    from benz_news_context.app import app
+    from benz_news_context.dependencies import get_db_adapter
+    from benz_news_context.tracing import current_trace_id
+
+    seen = []
+    cursor = (
+        mock_database_adapter.read_connection.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+    )
+    cursor.fetchall.side_effect = lambda: seen.append(current_trace_id()) or []
+    app.dependency_overrides[get_db_adapter] = lambda: mock_database_adapter
+
+    client = TestClient(app)
+    response = client.post(
+        "/api/prior-news-context",
+        json={"ticker": "AVGO", "reference_timestamp": "2026-01-21T17:00:00Z"},
+        headers={"X-Request-ID": "trace-abc"},
+    )
+
+    assert response.status_code == 200
+    assert seen == ["trace-abc"]
+
+    # Clean up
+    app.dependency_overrides.clear()
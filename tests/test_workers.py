@@ -0,0 +1,40 @@
+"""Tests for the gunicorn application and its workers."""
+import pytest
+
+pytest.importorskip("gunicorn")
+pytest.importorskip("uvicorn_worker")
+
+
+def test_gunicorn_options_follow_config(monkeypatch):
+    """Test that worker count, keep-alive, backlog and recycling come from config."""
+    from benz_news_context import config, workers
+
+    monkeypatch.setattr(config, "WEB_CONCURRENCY", 6)
+    monkeypatch.setattr(config, "SERVER_PORT", 9001)
+    monkeypatch.setattr(config, "SERVER_BACKLOG", 4096)
+    monkeypatch.setattr(config, "SERVER_KEEPALIVE_SECONDS", 90)
+    monkeypatch.setattr(config, "SERVER_MAX_REQUESTS", 500)
+    monkeypatch.setattr(config, "SERVER_MAX_REQUESTS_JITTER", 50)
+
+    options = workers.gunicorn_options()
+
+    assert options["workers"] == 6
+    assert options["bind"].endswith(":9001")
+    assert options["backlog"] == 4096
+    assert options["keepalive"] == 90
+    assert options["max_requests"] == 500
+    assert options["max_requests_jitter"] == 50
+    assert options["preload_app"] is True
+
+
+def test_server_applies_options_and_loads_app():
+    """Test that the gunicorn application takes the options and serves the FastAPI app."""
+    from benz_news_context.app import app
+    from benz_news_context.workers import ContextServer, ContextWorker, gunicorn_options
+
+    server = ContextServer(gunicorn_options())
+
+    assert server.cfg.worker_class is ContextWorker
+    assert server.cfg.preload_app is True
+    assert server.load() is app
+    assert ContextWorker.CONFIG_KWARGS == {"loop": "uvloop", "http": "httptools"}